@@ -1,6 +1,7 @@
 #!/usr/bin/env -S poetry run python
 import sys
 import os
+import argparse
 import logging
 from pathlib import Path
 from datetime import datetime
@@ -11,14 +12,45 @@ sys.path.append(str(project_root))
 
 from dags import (
     setup_logging,
-    read_dag_data,
+    read_dag_data_columnar,
+    read_dag_data_chunked,
+    read_dag_data_arrow,
+    read_dag_cached,
+    get_cache_dir,
+    file_format,
+    write_frame,
     get_data_file_path,
     create_dag,
+    CsrGraph,
+    ReachabilityIndex,
     find_paths_with_dates,
+    find_paths_with_dates_parallel,
+    PathBudget,
+    find_top_paths,
     find_sorted_paths,
-    analyze_path_timing,
+    analyze_timing,
+    write_timing_report,
+    write_partition_report,
+    REPORT_FORMATS,
+    analyze_partitions,
+    PARTITION_MODES,
     analyze_network,
-    plot_dag
+    compute_schedule,
+    count_paths,
+    aggregate_paths_by_node,
+    aggregates_frame,
+    path_highlights,
+    compute_layout,
+    render_graphs,
+    RenderJob,
+    top_paths_subgraph,
+    neighborhood_subgraph,
+    render_opportunities,
+    enable_instrumentation,
+    stage,
+    instrumentation_report,
+    format_report_table,
+    write_report_json
 )
 
 def print_network_metrics(metrics):
@@ -59,7 +91,7 @@ def print_network_metrics(metrics):
     for node, centrality in sorted_out_centrality:
         print(f"Node {node}: {centrality:.3f}")
 
-def print_path_info(path_info, temporal_data):
+def print_path_info(path_info, temporal_data, G):
     """Print detailed information about a path."""
     print("\nPath Details:")
     print(f"Number of nodes: {len(path_info.nodes)}")
@@ -69,17 +101,38 @@ def print_path_info(path_info, temporal_data):
     
     print("\nNode Details:")
     for node in path_info.nodes:
-        print(f"\nNode: {node} [Opportunity: {temporal_data[node].opportunity}]")
+        # Filtered reads can keep a work item without the row that dates it
+        opportunity = temporal_data[node].opportunity if node in temporal_data else None
+        print(f"\nNode: {node} [Opportunity: {opportunity}]")
         if node in temporal_data:
-            print(f"  # Predecessors: {temporal_data[node].in_degree} # Successors: {temporal_data[node].out_degree}")
+            print(f"  # Predecessors: {G.in_degree(node)} # Successors: {G.out_degree(node)}")
             print(f"  Start date: {temporal_data[node].start_date}", 
                   f" Target date: {temporal_data[node].target_date}")
             print(f"  Closed date: {temporal_data[node].closed_date}")
 
-def print_timing_inconsistencies(sorted_paths, temporal_data):
+def print_schedule(schedule, temporal_data, max_rows=20):
+    """Print the critical path and the work items with the least slack."""
+    table = schedule.table
+    print(f"\nCritical Path ({len(schedule.critical_path)} nodes, finishing {schedule.finish_date}):")
+    print(f"Path: {' -> '.join(schedule.critical_path)}")
+    for node in schedule.critical_path:
+        row = table.loc[node]
+        opportunity = temporal_data[node].opportunity if node in temporal_data else None
+        print(f"\nNode: {node} [Opportunity: {opportunity}]")
+        print(f"  Start date: {row['start_date']}  Target date: {row['target_date']}")
+        print(f"  Earliest start: {row['earliest_start']}  Earliest finish: {row['earliest_finish']}")
+        print(f"  Slack: {row['slack']}  Delay: {row['delay']}")
+    
+    print(f"\nTop {max_rows} Work Items by Least Slack:")
+    least_slack = table[table['slack'].notna()].sort_values(['slack', 'earliest_finish'], ascending=[True, False]).head(max_rows)
+    print(least_slack[['target_date', 'earliest_finish', 'latest_finish', 'slack', 'delay', 'driver']].to_string())
+
+def print_timing_inconsistencies(G, temporal_data):
+    logger = logging.getLogger(__name__)
+    log_issues = logger.isEnabledFor(logging.DEBUG)
 
-    # Analyze timing inconsistencies
-    timing_issues = analyze_path_timing(sorted_paths, temporal_data)
+    # Analyze timing inconsistencies, once per node and edge
+    timing_issues = analyze_timing(G, temporal_data)
     
     # Print timing issues in a structured format
     print("\nTiming Analysis Results:")
@@ -92,14 +145,16 @@ def print_timing_inconsistencies(sorted_paths, temporal_data):
             if issues:
                 found_issues = True
                 print(f"{issue_type.replace('_', ' ').title()}:")
-                logging.info(f"{issue_type} = {issues}")
+                if log_issues:
+                    logger.debug("%s = %s", issue_type, issues)
                 if issue_type in ['missing_start_dates', 'missing_target_dates', 'target_passed_without_close']:
                     print(f"  Target Date: {issues['target_date']}")
                     print(f"  Start Date: {issues['start_date']}")
                     print(f"  Closed Date: {issues['closed_date']}")
                 elif issue_type in ['end_before_predecessor_end', 'start_before_predecessor_end']:
                     for issue in issues:
-                        print(f"  Path: {' -> '.join(issue['path'])}")
+                        for path in issue['paths']:
+                            print(f"  Path: {' -> '.join(path)}")
                         print(f"    Predecessor: {issue['predecessor']}")
                         print(f"    Node Date: {issue.get('node_date') or issue.get('start_date')}")
                         print(f"    Predecessor Date: {issue['predecessor_date']}")
@@ -111,23 +166,376 @@ def print_timing_inconsistencies(sorted_paths, temporal_data):
         print("No timing issues found!")
     
 
+def render_dags(G, temporal_data, paths, output_dir, args):
+    """Render the full and highlighted DAG, or only the focus subgraphs if any were asked for.
+
+    paths are the paths to highlight, as node lists or PathInfo objects.
+    """
+    if args.focus_top or args.focus_node or args.by_opportunity:
+        render_focus(G, temporal_data, paths, output_dir, args)
+    else:
+        # Draw the full and highlighted views with concurrent dot processes; colors do not
+        # change dot's layout, so both images place every node and edge alike. --reuse-layout
+        # lays the graph out once, or loads that layout from the cache, and only draws it twice
+        full_dag_path = output_dir / f'full_dag.{args.format}'
+        jobs = [RenderJob(full_dag_path)]
+        if paths:
+            highlighted_dag_path = output_dir / f'highlighted_dag.{args.format}'
+            highlight_nodes, highlight_edges = path_highlights(paths)
+            jobs.append(RenderJob(highlighted_dag_path, highlight_nodes=highlight_nodes, highlight_edges=highlight_edges))
+        positions = compute_layout(G, args.cache_dir or get_cache_dir()) if args.reuse_layout else None
+        render_graphs(G, jobs, positions=positions, dpi=args.dpi)
+        print(f"\nFull DAG visualization saved to: {full_dag_path}")
+        if paths:
+            print(f"Highlighted DAG visualization saved to: {highlighted_dag_path}")
+
+def render_focus(G, temporal_data, paths, output_dir, args):
+    """Render only the focus subgraphs selected on the command line, concurrently."""
+    jobs = []
+    if args.focus_top:
+        top_paths = find_top_paths(G, temporal_data, max_paths=args.focus_top)
+        highlight_nodes, highlight_edges = path_highlights(top_paths)
+        jobs.append(RenderJob(
+            output_dir / f'top_{args.focus_top}_paths.{args.format}',
+            highlight_nodes=highlight_nodes,
+            highlight_edges=highlight_edges,
+            graph=top_paths_subgraph(G, top_paths)
+        ))
+    if args.focus_node:
+        jobs.append(RenderJob(
+            output_dir / f'node_{args.focus_node}_{args.hops}_hops.{args.format}',
+            highlight_nodes={args.focus_node},
+            graph=neighborhood_subgraph(G, args.focus_node, args.hops)
+        ))
+    for job in render_graphs(G, jobs, dpi=args.dpi):
+        print(f"\nFocused DAG visualization saved to: {job}")
+    
+    if args.by_opportunity:
+        rendered = render_opportunities(G, temporal_data, output_dir / 'opportunities', args.format,
+                                        highlight_paths=paths, dpi=args.dpi)
+        print(f"\n{len(rendered)} opportunity visualizations saved to: {output_dir / 'opportunities'}")
+
+def analyze_partitioned(G, temporal_data, args, max_paths=20):
+    """Analyze and render each partition on a process pool, then print or save the merged results."""
+    render_dir = project_root / 'output' / 'partitions'
+    results = analyze_partitions(G, temporal_data, by=args.partition, workers=args.workers or None,
+                                 maximal=args.maximal_paths, max_paths=max_paths, render_dir=render_dir,
+                                 output_format=args.format, dpi=args.dpi, budget=args.budget)
+    
+    print(f"\n{len(results)} Partitions by {args.partition}:")
+    for result in results[:max_paths]:
+        truncated = ' (truncated)' if result.enumeration and result.enumeration.truncated else ''
+        print(f"  {result.key}: {result.nodes} nodes, {result.edges} edges, {result.paths} paths{truncated} ({result.seconds:.2f}s)")
+    if len(results) > max_paths:
+        print(f"  ... and {len(results) - max_paths} more")
+    truncated = [result.key for result in results if result.enumeration and result.enumeration.truncated]
+    if truncated:
+        print(f"Path enumeration was cut short in {len(truncated)} partitions: {', '.join(truncated[:max_paths])}")
+    
+    # Each partition's top paths are its own, so the overall top paths are among them
+    partition_keys = {id(path_info): result.key for result in results for path_info in result.top_paths}
+    selected_sorted_paths = find_sorted_paths((path_info for result in results for path_info in result.top_paths), max_paths)
+    print(f"\nTop {max_paths} Paths by Target Date:")
+    for i, path_info in enumerate(selected_sorted_paths, 1):
+        print(f"\nPath {i} [{partition_keys[id(path_info)]}]:")
+        print(f"Path: {' -> '.join(path_info.nodes)}")
+        print_path_info(path_info, temporal_data, G)
+    
+    if args.report_dir:
+        with stage('write_partition_report'):
+            issue_counts = write_partition_report(results, temporal_data, args.report_dir, args.report_format)
+        print(f"\n{sum(issue_counts.values())} timing issues saved to: {args.report_dir}")
+    else:
+        issue_counts = {}
+        for result in results:
+            for node_issues in result.timing_issues.values():
+                for issue_type, found in node_issues.items():
+                    count = len(found) if isinstance(found, list) else int(found is not None)
+                    issue_counts[issue_type] = issue_counts.get(issue_type, 0) + count
+        print("\nTiming Analysis Results:")
+    for issue_type, count in issue_counts.items():
+        print(f"  {issue_type}: {count}")
+    
+    rendered = sum(len(result.images) for result in results)
+    print(f"\n{rendered} partition visualizations saved to: {render_dir}")
+
+def print_enumeration_report(report, max_rows=10):
+    """Print what a path budget left out of the enumeration."""
+    if not report.truncated:
+        print(f"\nEnumerated all {report.paths} paths ({report.seconds:.2f}s)")
+        return
+    print(f"\nPath enumeration was cut short after {report.paths} paths ({report.seconds:.2f}s):")
+    if report.stopped:
+        print(f"  Stopped at the {report.stopped.replace('_', ' ')} limit after {report.sources_searched} "
+              f"of {report.sources_total} source work items")
+    if report.truncated_pairs:
+        print(f"  {len(report.truncated_pairs)} pairs hit the per-pair limit:")
+        for (source, target), left_out in list(report.truncated_pairs.items())[:max_rows]:
+            print(f"    {source} -> {target}" + (f" ({left_out} paths left out)" if left_out else ""))
+    cut_by_length = [source for source, reason in report.cut_sources.items() if reason == 'max_length']
+    if cut_by_length:
+        print(f"  {len(cut_by_length)} source work items have paths past the length limit, "
+              f"e.g. {', '.join(cut_by_length[:max_rows])}")
+
+def print_stats(args):
+    """Print or save per-stage statistics if they were asked for."""
+    if args.stats:
+        print("\nPipeline Stages:")
+        print(format_report_table(instrumentation_report()))
+    if args.stats_json:
+        write_report_json(args.stats_json)
+        print(f"\nStage statistics saved to: {args.stats_json}")
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Analyze paths and timing in a work item DAG.")
+    parser.add_argument(
+        '--data-file',
+        type=Path,
+        default=None,
+        help="CSV, Parquet or Arrow data file (default: $DAG_DATA_FILE, then data/working.csv)"
+    )
+    parser.add_argument(
+        '--opportunity',
+        action='append',
+        default=None,
+        help="Only read work items of this opportunity (repeatable)"
+    )
+    parser.add_argument(
+        '--target-from',
+        type=datetime.fromisoformat,
+        default=None,
+        help="Only read work items targeted on or after this ISO date (Parquet or Arrow input)"
+    )
+    parser.add_argument(
+        '--target-to',
+        type=datetime.fromisoformat,
+        default=None,
+        help="Only read work items targeted on or before this ISO date (Parquet or Arrow input)"
+    )
+    parser.add_argument(
+        '--maximal-paths',
+        action='store_true',
+        help="Only enumerate source-to-sink paths instead of paths between every node pair"
+    )
+    parser.add_argument(
+        '--csr',
+        action='store_true',
+        help="Use the compact integer-indexed graph instead of a NetworkX DiGraph"
+    )
+    parser.add_argument(
+        '--cache-dir',
+        type=Path,
+        default=None,
+        help="Directory for the parsed-data cache (default: .dag_cache in the project root)"
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="Always parse the CSV instead of using the parsed-data cache"
+    )
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=None,
+        help="Parse the CSV in chunks of this many rows, reading only the columns the analysis uses"
+    )
+    parser.add_argument(
+        '--partition',
+        choices=PARTITION_MODES,
+        default=None,
+        help="Analyze and render each weakly connected component or opportunity on its own, in parallel"
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help="Enumerate paths on this many worker processes (0 for one per CPU)"
+    )
+    parser.add_argument(
+        '--max-paths-per-pair',
+        type=int,
+        default=None,
+        help="Keep at most this many paths between any two work items"
+    )
+    parser.add_argument(
+        '--max-total-paths',
+        type=int,
+        default=None,
+        help="Stop enumerating paths once this many are found"
+    )
+    parser.add_argument(
+        '--max-path-length',
+        type=int,
+        default=None,
+        help="Do not follow paths longer than this many edges"
+    )
+    parser.add_argument(
+        '--time-limit',
+        type=float,
+        default=None,
+        metavar='SECONDS',
+        help="Stop enumerating paths after this many seconds (per partition with --partition)"
+    )
+    parser.add_argument(
+        '--format',
+        choices=['png', 'svg', 'plain'],
+        default='png',
+        help="Output format for the DAG visualizations"
+    )
+    parser.add_argument(
+        '--dpi',
+        type=int,
+        default=1200,
+        help="Resolution of PNG visualizations"
+    )
+    parser.add_argument(
+        '--reuse-layout',
+        action='store_true',
+        help="Lay the full DAG out once, cached in the cache directory, and draw both views from it "
+             "with straight edges instead of laying it out for each view"
+    )
+    parser.add_argument(
+        '--focus-top',
+        type=int,
+        default=None,
+        metavar='K',
+        help="Only render the subgraph of the top K paths by target date"
+    )
+    parser.add_argument(
+        '--focus-node',
+        default=None,
+        help="Only render the ancestors and descendants of this work item"
+    )
+    parser.add_argument(
+        '--hops',
+        type=int,
+        default=2,
+        help="Neighborhood size for --focus-node"
+    )
+    parser.add_argument(
+        '--by-opportunity',
+        action='store_true',
+        help="Render one subgraph per opportunity instead of the full DAG"
+    )
+    parser.add_argument(
+        '--blocks',
+        nargs=2,
+        default=None,
+        metavar=('A', 'B'),
+        help="Report whether work item A blocks work item B, i.e. B depends on A through some path"
+    )
+    parser.add_argument(
+        '--schedule',
+        action='store_true',
+        help="Print the critical path and the work items with the least slack instead of the top paths"
+    )
+    parser.add_argument(
+        '--report-dir',
+        type=Path,
+        default=None,
+        help="Stream timing issues and their paths to tables in this directory instead of printing them"
+    )
+    parser.add_argument(
+        '--report-format',
+        choices=REPORT_FORMATS,
+        default='jsonl',
+        help="Format of the --report-dir tables"
+    )
+    parser.add_argument(
+        '--aggregates-output',
+        type=Path,
+        default=None,
+        help="Write per-node path aggregates to this .parquet, .arrow or .csv file"
+    )
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        help="Print a table of time, memory and item counts per pipeline stage"
+    )
+    parser.add_argument(
+        '--stats-json',
+        type=Path,
+        default=None,
+        help="Write per-stage statistics to this JSON file"
+    )
+    parser.add_argument(
+        '--trace-memory',
+        action='store_true',
+        help="Measure per-stage memory with tracemalloc (slower) instead of peak RSS"
+    )
+    parser.add_argument(
+        '--profile',
+        default=None,
+        metavar='STAGE',
+        help="Run the first call of this stage (e.g. find_paths_with_dates) under cProfile"
+    )
+    parser.add_argument(
+        '--profile-output',
+        type=Path,
+        default=None,
+        help="File for the cProfile stats (default: output/<STAGE>.prof)"
+    )
+    args = parser.parse_args()
+    
+    # Enumeration budgets, None when no limit was asked for
+    args.budget = None
+    limits = (args.max_paths_per_pair, args.max_total_paths, args.max_path_length, args.time_limit)
+    if any(limit is not None for limit in limits):
+        if args.workers is not None and not args.partition:
+            parser.error("path budgets apply to the single-process search; use --partition to run in parallel")
+        try:
+            args.budget = PathBudget(*limits)
+        except ValueError as e:
+            parser.error(str(e))
+    if (args.target_from or args.target_to) and file_format(get_data_file_path(args.data_file)) == 'csv':
+        parser.error("--target-from and --target-to need a Parquet or Arrow data file")
+    return args
+
 def main():
+    args = parse_args()
+    
     # Setup logging
-    setup_logging()
+    setup_logging(queued=True)
     logger = logging.getLogger(__name__)
     
+    if args.stats or args.stats_json or args.profile:
+        profile_output = args.profile_output
+        if args.profile and profile_output is None:
+            (project_root / 'output').mkdir(exist_ok=True)
+            profile_output = project_root / 'output' / f'{args.profile}.prof'
+        enable_instrumentation(trace_memory=args.trace_memory, profile_stage=args.profile, profile_output=profile_output)
+    
     # Get data file path
-    data_file = get_data_file_path()
+    data_file = get_data_file_path(args.data_file)
     if not data_file.exists():
         logger.error(f"Data file not found: {data_file}")
         sys.exit(1)
     
     # Read DAG data
     logger.info(f"Reading DAG data from {data_file}")
-    data, temporal_data = read_dag_data(data_file)
-    
-    # Create DAG
-    G = create_dag(data)
+    if args.opportunity or args.target_from or args.target_to:
+        # Filtered reads only keep the matching rows and bypass the cache
+        if file_format(data_file) == 'csv':
+            data, temporal_data = read_dag_data_chunked(data_file, args.chunk_size or 100000, opportunities=args.opportunity)
+        else:
+            data, temporal_data = read_dag_data_arrow(data_file, args.opportunity, args.target_from, args.target_to)
+        G = CsrGraph.from_dag_data(data) if args.csr else create_dag(data)
+    elif args.no_cache:
+        if file_format(data_file) != 'csv':
+            data, temporal_data = read_dag_data_arrow(data_file)
+        elif args.chunk_size:
+            data, temporal_data = read_dag_data_chunked(data_file, args.chunk_size)
+        else:
+            data, temporal_data = read_dag_data_columnar(data_file)
+        
+        # Create DAG
+        G = CsrGraph.from_dag_data(data) if args.csr else create_dag(data)
+    else:
+        # Cached graph and temporal data, re-parsed only when the CSV changes
+        G, temporal_data = read_dag_cached(data_file, args.cache_dir, args.chunk_size)
+        if not args.csr:
+            G = G.to_networkx()
     
     # Perform network analysis
     metrics = analyze_network(G)
@@ -137,6 +545,8 @@ def main():
     print(f"Total nodes: {metrics['total_nodes']}")
     print(f"Total edges: {metrics['total_edges']}")
     print(f"Is DAG: {metrics['is_dag']}")
+    if metrics['is_dag']:
+        print(f"Total paths: {count_paths(G)}")
     print("\nNode Types:")
     for node_type, count in metrics['node_types'].items():
         print(f"  {node_type}: {count}")
@@ -144,38 +554,71 @@ def main():
     for state, count in metrics['node_states'].items():
         print(f"  {state}: {count}")
     
-    # Find paths with latest target dates
-    paths = find_paths_with_dates(G, temporal_data)
+    if args.blocks:
+        blocker, blocked = args.blocks
+        try:
+            answer = 'blocks' if ReachabilityIndex(G).reaches(blocker, blocked) else 'does not block'
+            print(f"\n{blocker} {answer} {blocked}")
+        except KeyError as e:
+            print(f"\nWork item {e} not in the DAG")
+    
+    if args.partition:
+        analyze_partitioned(G, temporal_data, args)
+        print_stats(args)
+        return
+    
+    # Every edge lies on some path, so highlighting all paths highlights every edge and its
+    # endpoints; the paths are only enumerated when an enumeration is asked for. --workers picks
+    # the process pool and --maximal-paths which paths, so the two combine
+    if args.workers is not None:
+        paths = find_paths_with_dates_parallel(
+            G, temporal_data, workers=args.workers or None, maximal=args.maximal_paths
+        )
+        print(f"\nEnumerated {len(paths)} {'maximal ' if args.maximal_paths else ''}paths")
+    elif args.budget or args.maximal_paths:
+        paths = find_paths_with_dates(G, temporal_data, maximal=args.maximal_paths, budget=args.budget)
+        print_enumeration_report(paths.report)
+    else:
+        paths = [list(edge) for edge in G.edges()]
     
     max_paths = 20
-    selected_sorted_paths = find_sorted_paths(paths, max_paths=max_paths)
+    if args.schedule:
+        # Critical path and slack from one pass each way over the topological order
+        print_schedule(compute_schedule(G, temporal_data, order=metrics['topological_sort']), temporal_data, max_paths)
+    else:
+        selected_sorted_paths = find_top_paths(G, temporal_data, max_paths=max_paths)
+        
+        # Print path information
+        print(f"\nTop {max_paths} Paths by Target Date:")
+        for i, path_info in enumerate(selected_sorted_paths, 1):
+            print(f"\nPath {i}:")
+            print(f"Path: {' -> '.join(path_info.nodes)}")
+            print_path_info(path_info, temporal_data, G)
     
-    # Print path information
-    print(f"\nTop {max_paths} Paths by Target Date:")
-    for i, path_info in enumerate(selected_sorted_paths, 1):
-        print(f"\nPath {i}:")
-        print(f"Path: {' -> '.join(path_info.nodes)}")
-        print_path_info(path_info, temporal_data)
+    # Check timing of every node and edge
+    if args.report_dir:
+        with stage('write_timing_report'):
+            issue_counts = write_timing_report(G, temporal_data, args.report_dir, args.report_format)
+        print(f"\n{sum(issue_counts.values())} timing issues saved to: {args.report_dir}")
+        for issue_type, count in issue_counts.items():
+            print(f"  {issue_type}: {count}")
+    else:
+        with stage('print_timing_inconsistencies'):
+            print_timing_inconsistencies(G, temporal_data)
     
-    # Call analyze_path_timing with the sorted paths and temporal data
-    print_timing_inconsistencies(paths, temporal_data)
+    if args.aggregates_output:
+        with stage('write_aggregates'):
+            write_frame(aggregates_frame(aggregate_paths_by_node(G, temporal_data)), args.aggregates_output)
+        print(f"\nPath aggregates saved to: {args.aggregates_output}")
     
     # Create output directory for visualizations
     output_dir = project_root / 'output'
     output_dir.mkdir(exist_ok=True)
     
-    # Create visualization of the full DAG
-    full_dag_path = output_dir / 'full_dag.png'
-    plot_dag(G, full_dag_path)
-    print(f"\nFull DAG visualization saved to: {full_dag_path}")
+    with stage('render'):
+        render_dags(G, temporal_data, paths, output_dir, args)
     
-    # Create visualization highlighting the top paths
-    if paths:
-        highlighted_dag_path = output_dir / 'highlighted_dag.png'
-        plot_dag(G, highlighted_dag_path, highlight_paths=[p.nodes for p in paths])
-        print(f"Highlighted DAG visualization saved to: {highlighted_dag_path}")
-
-   
+    print_stats(args)
 
 if __name__ == '__main__':
     main() 
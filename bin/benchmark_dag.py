@@ -0,0 +1,211 @@
+#!/usr/bin/env -S poetry run python
+import sys
+import os
+import argparse
+import json
+import logging
+import platform
+import shutil
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from datetime import datetime
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from dags import (
+    read_dag_data,
+    read_dag_data_columnar,
+    create_dag,
+    count_paths,
+    find_paths_with_dates,
+    find_paths_with_dates_parallel,
+    analyze_path_timing,
+    analyze_timing,
+    plot_dag,
+    write_dot,
+    write_dag_csv
+)
+
+STAGES = ['read_dag_data', 'read_dag_data_columnar', 'create_dag', 'find_paths_with_dates',
+          'find_paths_with_dates_parallel', 'analyze_path_timing', 'analyze_timing', 'plot_dag']
+
+def measure(func, repeat=1, trace_memory=True):
+    """Run func, returning its result, best wall time in seconds and peak traced bytes.
+
+    Timed runs are untraced, since tracemalloc slows Python code down several
+    times; memory is measured in one extra traced run.
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    peak = None
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            func()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result, best, peak
+
+def current_commit():
+    """Return the checked-out commit of the project, or None outside a git checkout."""
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=project_root, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def benchmark_size(data_file, args, work_dir):
+    """Time every selected stage on one data file, feeding each stage the previous results."""
+    results = []
+
+    def record(stage, func, items):
+        if stage not in args.stages:
+            return None
+        result, seconds, peak = measure(func, repeat=args.repeat, trace_memory=not args.no_memory)
+        stage_result = {'stage': stage, 'seconds': seconds, 'peak_bytes': peak, 'items': items(result)}
+        results.append(stage_result)
+        memory = f"{peak / 2 ** 20:9.1f} MB" if peak is not None else ''
+        print(f"  {stage:<30} {seconds:9.3f} s {memory}  {stage_result['items']}")
+        return result
+
+    record('read_dag_data', lambda: read_dag_data(data_file),
+           lambda r: {'work_items': len(r[0]), 'temporal_nodes': len(r[1])})
+    dag_data, temporal_data = read_dag_data_columnar(data_file)
+    record('read_dag_data_columnar', lambda: read_dag_data_columnar(data_file),
+           lambda r: {'work_items': len(r[0]), 'temporal_nodes': len(r[1])})
+    G = create_dag(dag_data)
+    record('create_dag', lambda: create_dag(dag_data),
+           lambda r: {'nodes': r.number_of_nodes(), 'edges': r.number_of_edges()})
+
+    # Path enumeration checks every node pair and then every path, so large cases are skipped
+    path_count = count_paths(G)
+    if path_count <= args.max_paths and G.number_of_nodes() <= args.max_path_nodes:
+        paths = record('find_paths_with_dates', lambda: find_paths_with_dates(G, temporal_data),
+                       lambda r: {'paths': len(r)})
+        if paths is None:
+            paths = find_paths_with_dates(G, temporal_data)
+        record('find_paths_with_dates_parallel',
+               lambda: find_paths_with_dates_parallel(G, temporal_data, workers=args.workers or None),
+               lambda r: {'paths': len(r), 'workers': args.workers or os.cpu_count()})
+        record('analyze_path_timing', lambda: analyze_path_timing(paths, temporal_data),
+               lambda r: {'paths': len(paths), 'nodes_with_issues': len(r)})
+    else:
+        for stage in ('find_paths_with_dates', 'find_paths_with_dates_parallel', 'analyze_path_timing'):
+            if stage in args.stages:
+                results.append({'stage': stage, 'skipped': f"{G.number_of_nodes()} nodes and {path_count} paths exceed the limits"})
+                print(f"  {stage:<30} skipped ({G.number_of_nodes()} nodes, {path_count} paths)")
+
+    record('analyze_timing', lambda: analyze_timing(G, temporal_data),
+           lambda r: {'nodes': len(r), 'edge_issues': sum(
+               len(i['end_before_predecessor_end']) + len(i['start_before_predecessor_end']) for i in r.values())})
+
+    # Without Graphviz only the DOT text is produced
+    if shutil.which('dot'):
+        record('plot_dag', lambda: plot_dag(G, work_dir / 'dag.svg', dpi=None),
+               lambda r: {'renderer': 'graphviz'})
+    else:
+        def emit_dot():
+            with open(os.devnull, 'w') as out:
+                write_dot(G, out)
+        record('plot_dag', emit_dot, lambda r: {'renderer': 'dot text only'})
+
+    return {'path_count': path_count, 'stages': results}
+
+def compare(previous_file, report):
+    """Print the time ratio of each stage against a previous report."""
+    with open(previous_file) as f:
+        previous = json.load(f)
+    before = {
+        (run['num_nodes'], stage['stage']): stage['seconds']
+        for run in previous['runs'] for stage in run['stages'] if 'seconds' in stage
+    }
+    print(f"\nCompared with {previous_file} (commit {previous.get('commit')}):")
+    for run in report['runs']:
+        for stage in run['stages']:
+            key = (run['num_nodes'], stage['stage'])
+            if 'seconds' in stage and before.get(key):
+                print(f"  {run['num_nodes']:>8} {stage['stage']:<24} {stage['seconds'] / before[key]:6.2f}x")
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark the DAG pipeline on synthetic data.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[250, 1000, 10000], help="Numbers of work items to generate")
+    parser.add_argument('--edge-density', type=float, default=1.5, help="Edges per work item")
+    parser.add_argument('--depth', type=int, default=10, help="Number of layers in the DAG")
+    parser.add_argument('--fan-out', type=int, default=4, help="Maximum successors per work item")
+    parser.add_argument('--missing', type=float, default=0.05, help="Fraction of missing start and target dates")
+    parser.add_argument('--inconsistent', type=float, default=0.05, help="Fraction of work items dated before their predecessors")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed for the generated data")
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES, help="Stages to time")
+    parser.add_argument('--repeat', type=int, default=1, help="Runs per stage; the fastest is kept")
+    parser.add_argument('--max-paths', type=int, default=200000, help="Skip path enumeration above this many paths")
+    parser.add_argument('--max-path-nodes', type=int, default=300, help="Skip path enumeration above this many graph nodes")
+    parser.add_argument('--workers', type=int, default=0, help="Worker processes for the parallel enumeration (0 for one per CPU)")
+    parser.add_argument('--no-memory', action='store_true', help="Skip the extra traced run per stage that measures memory")
+    parser.add_argument('--output-dir', type=Path, default=project_root / 'benchmark_results', help="Directory for JSON results")
+    parser.add_argument('--compare', type=Path, default=None, help="Previous JSON result to compare against")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    commit = current_commit()
+    report = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': {
+            'edge_density': args.edge_density,
+            'depth': args.depth,
+            'fan_out': args.fan_out,
+            'missing_date_fraction': args.missing,
+            'inconsistent_date_fraction': args.inconsistent,
+            'seed': args.seed,
+            'repeat': args.repeat,
+            'workers': args.workers or os.cpu_count(),
+            'trace_memory': not args.no_memory
+        },
+        'runs': []
+    }
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        work_dir = Path(work_dir)
+        for num_nodes in args.sizes:
+            data_file = write_dag_csv(
+                work_dir / f'synthetic_{num_nodes}.csv',
+                num_nodes=num_nodes,
+                edge_density=args.edge_density,
+                depth=args.depth,
+                fan_out=args.fan_out,
+                missing_date_fraction=args.missing,
+                inconsistent_date_fraction=args.inconsistent,
+                seed=args.seed
+            )
+            print(f"\n{num_nodes} work items:")
+            run = benchmark_size(data_file, args, work_dir)
+            run['num_nodes'] = num_nodes
+            report['runs'].append(run)
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    output_file = args.output_dir / f"benchmark-{datetime.now():%Y%m%d-%H%M%S}-{(commit or 'nogit')[:8]}.json"
+    with open(output_file, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults saved to: {output_file}")
+
+    if args.compare:
+        compare(args.compare, report)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env -S poetry run python
+import sys
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from dags import (
+    setup_logging,
+    get_data_file_path,
+    DagService,
+    serve_dag,
+    QUERIES
+)
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Keep a work item DAG loaded and answer queries about it over a Unix socket or local HTTP.",
+        epilog=f"Queries: {', '.join(QUERIES)}. Over HTTP, GET /<query>?node=<id>; "
+               "over the socket, one JSON object per line, e.g. {\"op\": \"ancestors\", \"node\": \"<id>\"}."
+    )
+    parser.add_argument(
+        '--data-file',
+        type=Path,
+        default=None,
+        help="CSV, Parquet or Arrow data file (default: $DAG_DATA_FILE, then data/working.csv)"
+    )
+    parser.add_argument(
+        '--socket',
+        type=Path,
+        default=None,
+        help="Unix socket to answer JSON Lines queries on"
+    )
+    parser.add_argument(
+        '--host',
+        default='127.0.0.1',
+        help="Interface to answer HTTP queries on; there is no authentication, so keep it local"
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=None,
+        help="Port to answer HTTP queries on (default: 8765 unless --socket is given)"
+    )
+    parser.add_argument(
+        '--cache-dir',
+        type=Path,
+        default=None,
+        help="Directory for the parsed-data cache (default: .dag_cache in the project root)"
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help="Threads for timing, render and reload work (default: CPU count)"
+    )
+    parser.add_argument(
+        '--poll-interval',
+        type=float,
+        default=2.0,
+        help="Seconds between checks of the data file for changes, 0 to never reload"
+    )
+    parser.add_argument(
+        '--top-paths',
+        type=int,
+        default=1000,
+        help="Number of paths by target date kept for top_paths queries"
+    )
+    parser.add_argument(
+        '--max-witness-paths',
+        type=int,
+        default=1,
+        help="Maximum number of example paths kept per timing issue"
+    )
+    parser.add_argument(
+        '--render-dir',
+        type=Path,
+        default=project_root / 'output' / 'server',
+        help="Directory for render queries (default: output/server)"
+    )
+    parser.add_argument(
+        '--dpi',
+        type=int,
+        default=1200,
+        help="Output resolution for bitmap render formats"
+    )
+    args = parser.parse_args()
+
+    if args.socket is None and args.port is None:
+        args.port = 8765
+    return args
+
+def main():
+    args = parse_args()
+
+    # Setup logging
+    setup_logging(log_name='dag_server', queued=True)
+    logger = logging.getLogger(__name__)
+
+    data_file = get_data_file_path(args.data_file)
+    if not data_file.exists():
+        logger.error(f"Data file not found: {data_file}")
+        sys.exit(1)
+
+    service = DagService(
+        data_file,
+        cache_dir=args.cache_dir,
+        max_top_paths=args.top_paths,
+        max_witness_paths=args.max_witness_paths,
+        render_dir=args.render_dir,
+        dpi=args.dpi,
+        workers=args.workers,
+        poll_interval=args.poll_interval
+    )
+    where = [str(place) for place in (args.socket, args.port and f"http://{args.host}:{args.port}") if place]
+    print(f"Serving {data_file} on {' and '.join(where)}; Ctrl-C to stop")
+    try:
+        asyncio.run(serve_dag(service, args.socket, args.host, args.port))
+    except KeyboardInterrupt:
+        print("\nStopped")
+
+if __name__ == '__main__':
+    main()
@@ -1,17 +1,111 @@
 from .utils.logging import setup_logging
-from .utils.data import read_dag_data, get_data_file_path, NodeTemporalInfo
-from .analysis.paths import create_dag, find_paths_with_dates, analyze_network, PathInfo, plot_dag, find_sorted_paths, analyze_path_timing
+from .utils.instrument import instrumented, stage, enable_instrumentation, disable_instrumentation, reset_instrumentation, instrumentation_report, format_report_table, write_report_json
+from .utils.data import read_dag_data, read_dag_data_vectorized, read_dag_data_columnar, read_dag_data_chunked, get_data_file_path, NodeTemporalInfo, TemporalStore
+from .utils.synthetic import generate_dag_frame, write_dag_csv
+from .utils.formats import read_dag_data_arrow, write_frame, convert_csv, file_format
+from .utils.cache import read_dag_cached, load_dag_cache, save_dag_cache, get_cache_dir
+from .analysis.paths import create_dag, find_paths_with_dates, iter_paths_with_dates, iter_maximal_paths, iter_paths_by_target_date, analyze_network, PathInfo, plot_dag, path_highlights, find_sorted_paths, find_top_paths, analyze_path_timing, iter_path_timing_issues
+from .analysis.csr import CsrGraph
+from .analysis.budget import PathBudget, EnumerationReport, longest_path_lengths
+from .analysis.reachability import ReachabilityIndex
+from .analysis.pathstore import PathStore, StoredPath
+from .analysis.render import write_dot, compute_layout, render_graphs, RenderJob
+from .analysis.focus import induced_subgraph, top_paths_subgraph, neighborhood_subgraph, opportunity_subgraph, render_opportunities
+from .analysis.parallel import find_paths_with_dates_parallel, iter_paths_parallel
+from .analysis.timing import analyze_timing, iter_timing_issues, iter_paths_through, WitnessPaths
+from .analysis.report import IssueReportWriter, write_timing_report, write_path_timing_report, write_partition_report, REPORT_FORMATS
+from .analysis.aggregates import aggregate_paths_by_node, aggregate_paths_by_pair, aggregates_frame, count_paths, PathAggregate
+from .analysis.partition import partition_graph, component_partitions, opportunity_partitions, analyze_partitions, Partition, PartitionResult, PARTITION_MODES
+from .analysis.schedule import compute_schedule, Schedule
+from .analysis.incremental import IncrementalAnalysis, read_delta
+from .analysis.server import DagService, GraphSnapshot, load_snapshot, serve_dag, QUERIES
 
 __all__ = [
     'setup_logging',
+    'instrumented',
+    'stage',
+    'enable_instrumentation',
+    'disable_instrumentation',
+    'reset_instrumentation',
+    'instrumentation_report',
+    'format_report_table',
+    'write_report_json',
     'read_dag_data',
+    'read_dag_data_vectorized',
+    'read_dag_data_columnar',
+    'read_dag_data_chunked',
+    'read_dag_data_arrow',
+    'write_frame',
+    'convert_csv',
+    'file_format',
+    'read_dag_cached',
+    'load_dag_cache',
+    'save_dag_cache',
+    'get_cache_dir',
     'get_data_file_path',
+    'generate_dag_frame',
+    'write_dag_csv',
     'create_dag',
+    'CsrGraph',
+    'ReachabilityIndex',
     'find_paths_with_dates',
+    'iter_paths_with_dates',
+    'PathBudget',
+    'EnumerationReport',
+    'longest_path_lengths',
+    'iter_maximal_paths',
+    'find_paths_with_dates_parallel',
+    'iter_paths_parallel',
+    'iter_paths_by_target_date',
     'find_sorted_paths',
+    'find_top_paths',
     'analyze_path_timing',
+    'iter_path_timing_issues',
+    'analyze_timing',
+    'iter_timing_issues',
+    'IssueReportWriter',
+    'write_timing_report',
+    'write_path_timing_report',
+    'write_partition_report',
+    'REPORT_FORMATS',
+    'iter_paths_through',
+    'WitnessPaths',
     'analyze_network',
+    'aggregate_paths_by_node',
+    'aggregate_paths_by_pair',
+    'aggregates_frame',
+    'count_paths',
+    'PathAggregate',
+    'partition_graph',
+    'component_partitions',
+    'opportunity_partitions',
+    'analyze_partitions',
+    'Partition',
+    'PartitionResult',
+    'PARTITION_MODES',
+    'compute_schedule',
+    'Schedule',
+    'IncrementalAnalysis',
+    'read_delta',
+    'DagService',
+    'GraphSnapshot',
+    'load_snapshot',
+    'serve_dag',
+    'QUERIES',
     'NodeTemporalInfo',
+    'TemporalStore',
     'PathInfo',
+    'PathStore',
+    'StoredPath',
     'plot_dag',
+    'path_highlights',
+    'write_dot',
+    'compute_layout',
+    'render_graphs',
+    'RenderJob',
+    'induced_subgraph',
+    'top_paths_subgraph',
+    'neighborhood_subgraph',
+    'opportunity_subgraph',
+    'render_opportunities',
 ]
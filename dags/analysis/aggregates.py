@@ -0,0 +1,203 @@
+import networkx as nx
+import logging
+import numpy as np
+import pandas as pd
+from typing import Dict, Tuple, Any, Iterable, Optional
+from datetime import datetime
+from dataclasses import dataclass
+
+from ..utils.data import TemporalStore
+from .csr import topological_order, descendants
+
+logger = logging.getLogger(__name__)
+
+# Sentinels for missing dates in the int64 (nanosecond) representation
+_NO_DATE_MAX = np.iinfo(np.int64).min
+_NO_DATE_MIN = np.iinfo(np.int64).max
+
+@dataclass
+class PathAggregate:
+    """Class to store aggregates over a set of paths without materializing them."""
+    path_count: int
+    target_date: Optional[datetime]
+    start_date: Optional[datetime]
+    closed_date: Optional[datetime]
+
+def _node_dates(G: nx.DiGraph, temporal_data: Dict[str, Any],
+                nodes: Optional[Iterable[str]] = None) -> Dict[str, Tuple[int, int, int]]:
+    """Map each graph node (or only the given nodes) to its (target, start, closed) dates as int64 nanoseconds.
+
+    Missing dates (or nodes without temporal data) get sentinels that never win
+    a max (target, closed) or min (start) comparison.
+    """
+    store = TemporalStore.from_temporal_data(temporal_data)
+    nodes = list(G.nodes() if nodes is None else nodes)
+    positions = np.array([store.positions.get(node, -1) for node in nodes], dtype=np.int64)
+    known = positions >= 0
+    rows = positions[known]
+
+    # NaT is int64.min, which is already the sentinel for the max aggregates
+    targets = np.full(len(nodes), _NO_DATE_MAX, dtype=np.int64)
+    starts = np.full(len(nodes), _NO_DATE_MIN, dtype=np.int64)
+    closeds = np.full(len(nodes), _NO_DATE_MAX, dtype=np.int64)
+    targets[known] = store.target_dates[rows].view(np.int64)
+    start_dates = store.start_dates[rows]
+    starts[known] = np.where(np.isnat(start_dates), _NO_DATE_MIN, start_dates.view(np.int64))
+    closeds[known] = store.closed_dates[rows].view(np.int64)
+    return dict(zip(nodes, zip(targets.tolist(), starts.tolist(), closeds.tolist())))
+
+def _merge(a: Tuple[int, int, int], b: Tuple[int, int, int]) -> Tuple[int, int, int]:
+    """Combine two (target, start, closed) aggregates."""
+    return (max(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]))
+
+def _to_aggregate(path_count: int, dates: Tuple[int, int, int]) -> PathAggregate:
+    """Convert an int64 aggregate back to a PathAggregate with timestamps."""
+    target, start, closed = dates
+    return PathAggregate(
+        path_count=path_count,
+        target_date=None if target == _NO_DATE_MAX else pd.Timestamp(target),
+        start_date=None if start == _NO_DATE_MIN else pd.Timestamp(start),
+        closed_date=None if closed == _NO_DATE_MAX else pd.Timestamp(closed)
+    )
+
+def aggregate_paths_by_node(G: nx.DiGraph, temporal_data: Dict[str, Any], direction: str = 'upstream') -> Dict[str, PathAggregate]:
+    """Aggregate dates over all paths ending (or starting) at each node.
+
+    Walks the DAG once in topological order. For 'upstream', each node gets the
+    number of paths (of two or more nodes) that end at it, plus the latest
+    target date, earliest start date and latest closed date over those paths.
+    'downstream' does the same for paths that start at the node.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph
+        temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
+        direction (str): 'upstream' or 'downstream'
+
+    Returns:
+        Dict[str, PathAggregate]: Aggregates keyed by node
+
+    Raises:
+        ValueError: If direction is not 'upstream' or 'downstream'
+        nx.NetworkXUnfeasible: If the graph contains a cycle
+    """
+    if direction not in ('upstream', 'downstream'):
+        raise ValueError(f"Unknown direction '{direction}'")
+    logger.info(f"Aggregating {direction} paths by node")
+
+    dates = _node_dates(G, temporal_data)
+    order = topological_order(G)
+    neighbors = G.predecessors
+    if direction == 'downstream':
+        order.reverse()
+        neighbors = G.successors
+
+    counts = {}
+    aggregates = {}
+    _propagate(order, neighbors, dates, counts, aggregates)
+
+    logger.info(f"Aggregated {sum(counts.values())} paths over {len(order)} nodes")
+    return {node: _node_aggregate(counts[node], aggregates[node]) for node in G.nodes()}
+
+def _propagate(order, neighbors, dates: Dict[str, Tuple[int, int, int]],
+               counts: Dict[str, int], aggregates: Dict[str, Tuple[int, int, int]]) -> None:
+    """Fill counts and aggregates for the nodes in order from their neighbors' entries.
+
+    aggregates[node] includes the node's own dates; nodes not in order must
+    already have entries.
+    """
+    for node in order:
+        count = 0
+        aggregate = dates[node]
+        for neighbor in neighbors(node):
+            # Every path ending at the neighbor extends by one edge, plus the edge itself
+            count += counts[neighbor] + 1
+            aggregate = _merge(aggregate, aggregates[neighbor])
+        counts[node] = count
+        aggregates[node] = aggregate
+
+def _node_aggregate(count: int, aggregate: Tuple[int, int, int]) -> PathAggregate:
+    """PathAggregate for a node's paths; a node on no path has no dates."""
+    return _to_aggregate(count, aggregate if count else (_NO_DATE_MAX, _NO_DATE_MIN, _NO_DATE_MAX))
+
+def aggregate_paths_by_pair(G: nx.DiGraph, temporal_data: Dict[str, Any]) -> Dict[Tuple[str, str], PathAggregate]:
+    """Aggregate dates over all paths between each pair of connected nodes.
+
+    For every source, walks its descendants once in topological order, so the
+    total cost is O(V * E) regardless of how many paths exist. Each reachable
+    (source, target) pair gets the exact number of simple paths between them,
+    plus the latest target date, earliest start date and latest closed date
+    over those paths. These match what find_paths_with_dates would report per
+    path, reduced over each pair.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph
+        temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
+
+    Returns:
+        Dict[Tuple[str, str], PathAggregate]: Aggregates keyed by (source, target)
+
+    Raises:
+        nx.NetworkXUnfeasible: If the graph contains a cycle
+    """
+    logger.info("Aggregating paths by endpoint pair")
+    dates = _node_dates(G, temporal_data)
+    topological_index = {node: i for i, node in enumerate(topological_order(G))}
+
+    pair_aggregates = {}
+    for source in G.nodes():
+        reachable = sorted(descendants(G, source), key=topological_index.__getitem__)
+        counts = {source: 1}
+        aggregates = {source: dates[source]}
+        for node in reachable:
+            count = 0
+            aggregate = dates[node]
+            for pred in G.predecessors(node):
+                if pred in counts:
+                    count += counts[pred]
+                    aggregate = _merge(aggregate, aggregates[pred])
+            counts[node] = count
+            aggregates[node] = aggregate
+            pair_aggregates[(source, node)] = _to_aggregate(count, aggregate)
+
+    logger.info(f"Aggregated {sum(a.path_count for a in pair_aggregates.values())} paths over {len(pair_aggregates)} node pairs")
+    return pair_aggregates
+
+def aggregates_frame(aggregates: Dict[Any, PathAggregate]) -> pd.DataFrame:
+    """Turn aggregates from aggregate_paths_by_node or aggregate_paths_by_pair into a DataFrame.
+
+    Args:
+        aggregates (Dict[Any, PathAggregate]): Aggregates keyed by node or by (source, target)
+
+    Returns:
+        pd.DataFrame: One row per key with path_count and the three dates,
+            indexed by node or by (source, target)
+    """
+    keys = list(aggregates)
+    if keys and isinstance(keys[0], tuple):
+        index = pd.MultiIndex.from_tuples(keys, names=['source', 'target'])
+    else:
+        index = pd.Index(keys, name='node')
+    values = list(aggregates.values())
+    return pd.DataFrame({
+        'path_count': np.array([a.path_count for a in values], dtype=np.int64),
+        'target_date': pd.to_datetime([a.target_date for a in values]),
+        'start_date': pd.to_datetime([a.start_date for a in values]),
+        'closed_date': pd.to_datetime([a.closed_date for a in values])
+    }, index=index)
+
+def count_paths(G: nx.DiGraph) -> int:
+    """Count the simple paths of two or more nodes in the DAG without enumerating them.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph
+
+    Returns:
+        int: Number of paths find_paths_with_dates would return
+
+    Raises:
+        nx.NetworkXUnfeasible: If the graph contains a cycle
+    """
+    counts = {}
+    for node in topological_order(G):
+        counts[node] = sum(counts[pred] + 1 for pred in G.predecessors(node))
+    return sum(counts.values())
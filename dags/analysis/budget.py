@@ -0,0 +1,205 @@
+import networkx as nx
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Tuple, Optional
+
+from .csr import topological_order
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class PathBudget:
+    """Class to describe limits on a path enumeration; None means no limit.
+
+    max_paths_per_pair caps the paths kept between one source and one target,
+    max_paths the paths kept overall, max_length the number of edges of a
+    path (the cutoff of nx.all_simple_paths) and time_limit the wall-clock
+    seconds the search may run.
+    """
+    max_paths_per_pair: Optional[int] = None
+    max_paths: Optional[int] = None
+    max_length: Optional[int] = None
+    time_limit: Optional[float] = None
+
+    def __post_init__(self):
+        for name in ('max_paths_per_pair', 'max_paths', 'max_length', 'time_limit'):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive, got {value}")
+
+    def deadline(self) -> float:
+        """time.monotonic() value at which a search starting now must stop."""
+        return math.inf if self.time_limit is None else time.monotonic() + self.time_limit
+
+@dataclass
+class EnumerationReport:
+    """Class to report whether, and where, a budgeted path enumeration was cut short.
+
+    stopped is 'max_paths' or 'deadline' if the whole search stopped early,
+    after searching sources_searched of sources_total sources. truncated_pairs
+    maps (source, target) pairs that had more paths than max_paths_per_pair
+    (of at most max_length edges) to the number of paths left out. cut_sources
+    maps sources whose search was cut short to the reason: 'max_length' where
+    the source has paths longer than max_length, or the stop reason for the
+    source being searched when the search stopped.
+    """
+    paths: int = 0
+    sources_searched: int = 0
+    sources_total: int = 0
+    stopped: Optional[str] = None
+    truncated_pairs: Dict[Tuple[str, str], int] = field(default_factory=dict)
+    cut_sources: Dict[str, str] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    @property
+    def truncated(self) -> bool:
+        """Whether any paths were left out."""
+        return bool(self.stopped or self.truncated_pairs or self.cut_sources)
+
+    def log(self) -> None:
+        """Log a one-line summary, as a warning if paths were left out."""
+        if not self.truncated:
+            logger.info(f"Enumerated all {self.paths} paths in {self.seconds:.2f}s")
+            return
+        logger.warning(
+            f"Path enumeration {'stopped at ' + self.stopped if self.stopped else 'was truncated'} after "
+            f"{self.paths} paths and {self.sources_searched} of {self.sources_total} sources in {self.seconds:.2f}s; "
+            f"{len(self.truncated_pairs)} pairs hit the per-pair limit, {len(self.cut_sources)} sources were cut short"
+        )
+
+def longest_path_lengths(G: nx.DiGraph) -> Dict[str, int]:
+    """Number of edges of the longest path starting at each node of a DAG.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph or CsrGraph
+
+    Returns:
+        Dict[str, int]: Longest path length per node, 0 for sinks
+
+    Raises:
+        nx.NetworkXUnfeasible: If the graph contains a cycle
+    """
+    lengths = {}
+    for node in reversed(topological_order(G)):
+        lengths[node] = max((lengths[succ] + 1 for succ in G.successors(node)), default=0)
+    return lengths
+
+def path_counts_from(G: nx.DiGraph, source: str, max_length: Optional[int] = None) -> Dict[str, int]:
+    """Number of paths from source to each node it reaches in a DAG, of at most max_length edges.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph or CsrGraph
+        source (str): Node the paths start at
+        max_length (int, optional): Longest path, in edges, to count
+
+    Returns:
+        Dict[str, int]: Path count per node reached, without source itself
+    """
+    # counts[node][k] is the number of paths of k edges, or of any length without max_length
+    width = 1 if max_length is None else max_length + 1
+    counts = {source: [1] + [0] * (width - 1)}
+    for node in topological_order(G):
+        here = counts.get(node)
+        if here is None:
+            continue
+        for succ in G.successors(node):
+            there = counts.setdefault(succ, [0] * width)
+            if max_length is None:
+                there[0] += here[0]
+            else:
+                for k in range(max_length):
+                    there[k + 1] += here[k]
+    del counts[source]
+    return {node: sum(by_length) for node, by_length in counts.items() if any(by_length)}
+
+class BudgetTracker:
+    """Class to apply a PathBudget to a path search and fill in its EnumerationReport.
+
+    Every budgeted walker goes through one tracker, so a budget keeps the same
+    paths and gives the same report whichever walker searches. A walker calls
+    start_source before each source, step at each step of its search, keep
+    for each path found, in the order find_paths_with_dates lists them, and
+    end_source after each source, then finish once at the end.
+
+    Attributes:
+        budget (PathBudget): Limits being applied
+        report (EnumerationReport): Report being filled in
+    """
+    def __init__(self, G: nx.DiGraph, budget: Optional[PathBudget] = None,
+                 report: Optional[EnumerationReport] = None):
+        self.G = G
+        self.budget = budget or PathBudget()
+        self.report = report if report is not None else EnumerationReport()
+        self._started = time.monotonic()
+        self._deadline = self.budget.deadline()
+        self._lengths = longest_path_lengths(G) if self.budget.max_length is not None else None
+        self._steps = 0
+        self._pair_counts: Dict[str, int] = {}
+
+    def start_source(self, source: str) -> bool:
+        """Start searching a source, returning False if the whole search has stopped instead."""
+        if not self.report.stopped and time.monotonic() > self._deadline:
+            self.report.stopped = 'deadline'
+        if self.report.stopped:
+            return False
+        self.report.sources_searched += 1
+        self._pair_counts = {}
+        if self._lengths is not None and self._lengths[source] > self.budget.max_length:
+            self.report.cut_sources[source] = 'max_length'
+        return True
+
+    def step(self) -> bool:
+        """Count one search step, returning True once the search has to stop."""
+        # Checking the clock every 1024 steps keeps its cost out of the search
+        self._steps += 1
+        if not self._steps & 1023 and not self.report.stopped and time.monotonic() > self._deadline:
+            self.report.stopped = 'deadline'
+        return self.report.stopped is not None
+
+    def keep(self, source: str, target: str) -> bool:
+        """Whether to keep the next path from source to target.
+
+        Paths found before the time limit passed are still kept; max_paths
+        stops the search at the first path past it.
+        """
+        if self.report.stopped == 'max_paths':
+            return False
+        if self.report.paths == self.budget.max_paths:
+            self.report.stopped = 'max_paths'
+            return False
+        count = self._pair_counts[target] = self._pair_counts.get(target, 0) + 1
+        if self.budget.max_paths_per_pair is not None and count > self.budget.max_paths_per_pair:
+            # The number left out is counted by finish, so walkers need not search past the limit
+            self.report.truncated_pairs[(source, target)] = 0
+            return False
+        self.report.paths += 1
+        return True
+
+    @property
+    def keeps_every_path(self) -> bool:
+        """Whether keep keeps every path, which it does without max_paths or max_paths_per_pair."""
+        return self.budget.max_paths is None and self.budget.max_paths_per_pair is None
+
+    def keep_every(self, count: int) -> None:
+        """Keep count paths at once; only for when keeps_every_path, to skip a keep call per path."""
+        self.report.paths += count
+
+    def end_source(self, source: str) -> None:
+        """Finish searching a source, marking it cut short if the search stopped during it."""
+        if self.report.stopped:
+            self.report.cut_sources[source] = self.report.stopped
+
+    def finish(self) -> EnumerationReport:
+        """Count the paths left out of each truncated pair, time the search and log the report."""
+        by_source = {}
+        for source, target in self.report.truncated_pairs:
+            by_source.setdefault(source, []).append(target)
+        for source, targets in by_source.items():
+            counts = path_counts_from(self.G, source, self.budget.max_length)
+            for target in targets:
+                self.report.truncated_pairs[(source, target)] = counts[target] - self.budget.max_paths_per_pair
+        self.report.seconds = time.monotonic() - self._started
+        self.report.log()
+        return self.report
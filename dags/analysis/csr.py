@@ -0,0 +1,290 @@
+import networkx as nx
+import heapq
+import logging
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Tuple, Any, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+class CsrGraph:
+    """Compact integer-indexed directed graph.
+
+    Node IDs are interned to integers in the order create_dag would add them.
+    Successors and predecessors are stored as CSR (indptr/indices) arrays in
+    the same adjacency order NetworkX would use, and node types and states as
+    integer codes into category lists (-1 for unknown). The class also offers
+    the small part of the nx.DiGraph API the analysis functions rely on
+    (nodes, edges, successors, predecessors and degrees), so it can be passed
+    where a DiGraph is expected.
+    """
+    def __init__(self, node_ids: List[str], sources: np.ndarray, targets: np.ndarray,
+                 type_codes: np.ndarray, types: List[str], state_codes: np.ndarray, states: List[str]):
+        self.node_ids = list(node_ids)
+        self.index = {node: i for i, node in enumerate(self.node_ids)}
+        self.type_codes = np.asarray(type_codes, dtype=np.int32)
+        self.types = list(types)
+        self.state_codes = np.asarray(state_codes, dtype=np.int32)
+        self.states = list(states)
+
+        sources = np.asarray(sources, dtype=np.int32)
+        targets = np.asarray(targets, dtype=np.int32)
+        # Stable sorts keep edge insertion order within each adjacency list
+        self.succ_indptr, self.succ_indices = self._csr(sources, targets)
+        self.pred_indptr, self.pred_indices = self._csr(targets, sources)
+
+    def _csr(self, keys: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        order = np.argsort(keys, kind='stable')
+        indptr = np.zeros(len(self.node_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys, minlength=len(self.node_ids)), out=indptr[1:])
+        return indptr, values[order]
+
+    @classmethod
+    def from_arrays(cls, node_ids: List[str], succ_indptr: np.ndarray, succ_indices: np.ndarray,
+                    pred_indptr: np.ndarray, pred_indices: np.ndarray, type_codes: np.ndarray, types: List[str],
+                    state_codes: np.ndarray, states: List[str]) -> 'CsrGraph':
+        """Wrap existing CSR arrays (for example memory-mapped ones) without rebuilding them."""
+        graph = cls.__new__(cls)
+        graph.node_ids = list(node_ids)
+        graph.index = {node: i for i, node in enumerate(graph.node_ids)}
+        graph.succ_indptr = succ_indptr
+        graph.succ_indices = succ_indices
+        graph.pred_indptr = pred_indptr
+        graph.pred_indices = pred_indices
+        graph.type_codes = type_codes
+        graph.types = list(types)
+        graph.state_codes = state_codes
+        graph.states = list(states)
+        return graph
+
+    @classmethod
+    def from_dag_data(cls, data: Dict) -> 'CsrGraph':
+        """Build the graph directly from read_dag_data output.
+
+        Args:
+            data (dict): DAG data structure with nodes and their relationships
+
+        Returns:
+            CsrGraph: Graph with the same nodes, edges and adjacency order as create_dag(data)
+        """
+        logger.info("Creating CSR DAG from data")
+        order = {}
+        edges = {}
+        for node, info in data.items():
+            order.setdefault(node, len(order))
+            for pred in info.get('predecessors', ()):
+                order.setdefault(pred, len(order))
+                edges.setdefault((pred, node), None)
+            for succ in info.get('successors', ()):
+                order.setdefault(succ, len(order))
+                edges.setdefault((node, succ), None)
+
+        node_ids = list(order)
+        edge_codes = np.array([(order[u], order[v]) for u, v in edges], dtype=np.int32).reshape(-1, 2)
+        type_codes, types = cls._codes(node_ids, {node: info.get('type') for node, info in data.items()})
+        state_codes, states = cls._codes(node_ids, {node: info.get('state') for node, info in data.items()})
+        graph = cls(node_ids, edge_codes[:, 0], edge_codes[:, 1], type_codes, types, state_codes, states)
+        logger.info(f"Created CSR DAG with {graph.number_of_nodes()} nodes and {graph.number_of_edges()} edges")
+        return graph
+
+    @classmethod
+    def from_networkx(cls, G: nx.DiGraph) -> 'CsrGraph':
+        """Build the graph from a NetworkX DiGraph, keeping its node and adjacency order."""
+        node_ids = list(G.nodes())
+        index = {node: i for i, node in enumerate(node_ids)}
+        type_codes, types = cls._codes(node_ids, {node: attrs.get('type') for node, attrs in G.nodes(data=True)})
+        state_codes, states = cls._codes(node_ids, {node: attrs.get('state') for node, attrs in G.nodes(data=True)})
+
+        def csr(neighbors) -> Tuple[np.ndarray, np.ndarray]:
+            indptr = np.zeros(len(node_ids) + 1, dtype=np.int64)
+            np.cumsum([len(neighbors[node]) for node in node_ids], out=indptr[1:])
+            indices = np.fromiter((index[v] for node in node_ids for v in neighbors[node]), dtype=np.int32, count=int(indptr[-1]))
+            return indptr, indices
+
+        succ_indptr, succ_indices = csr(G.succ)
+        pred_indptr, pred_indices = csr(G.pred)
+        return cls.from_arrays(node_ids, succ_indptr, succ_indices, pred_indptr, pred_indices,
+                               type_codes, types, state_codes, states)
+
+    @staticmethod
+    def _codes(node_ids: List[str], values: Dict[str, Any]) -> Tuple[np.ndarray, List[str]]:
+        codes, categories = pd.factorize(pd.Series([values.get(node) for node in node_ids], dtype=object))
+        return codes.astype(np.int32), categories.tolist()
+
+    def to_networkx(self) -> nx.DiGraph:
+        """Convert to a NetworkX DiGraph with 'type' and 'state' node attributes.
+
+        Nodes, successor lists and predecessor lists keep their order.
+        """
+        G = nx.DiGraph()
+        for i, node in enumerate(self.node_ids):
+            attrs = {}
+            if self.type_codes[i] >= 0:
+                attrs['type'] = self.types[self.type_codes[i]]
+            if self.state_codes[i] >= 0:
+                attrs['state'] = self.states[self.state_codes[i]]
+            G.add_node(node, **attrs)
+        ids = self.node_ids
+        G.add_edges_from((ids[u], ids[v]) for u, v in self._edge_insertion_order())
+        return G
+
+    def _edge_insertion_order(self) -> List[Tuple[int, int]]:
+        """Order the edges so that adding them one by one reproduces both adjacency orders.
+
+        Each successor list and each predecessor list is a chain of ordering
+        constraints; a topological sort of those constraints gives an order
+        that satisfies all of them.
+        """
+        n_edges = self.number_of_edges()
+        sources = np.repeat(np.arange(len(self.node_ids)), np.diff(self.succ_indptr)).tolist()
+        targets = self.succ_indices.tolist()
+        slots = {(u, v): k for k, (u, v) in enumerate(zip(sources, targets))}
+        pred_targets = np.repeat(np.arange(len(self.node_ids)), np.diff(self.pred_indptr)).tolist()
+        pred_slots = [slots[(u, v)] for u, v in zip(self.pred_indices.tolist(), pred_targets)]
+
+        followers = [[] for _ in range(n_edges)]
+        blockers = [0] * n_edges
+        for k in range(n_edges - 1):
+            if sources[k + 1] == sources[k]:
+                followers[k].append(k + 1)
+                blockers[k + 1] += 1
+            if pred_targets[k + 1] == pred_targets[k]:
+                followers[pred_slots[k]].append(pred_slots[k + 1])
+                blockers[pred_slots[k + 1]] += 1
+
+        ready = [k for k in range(n_edges) if not blockers[k]]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            k = heapq.heappop(ready)
+            order.append((sources[k], targets[k]))
+            for follower in followers[k]:
+                blockers[follower] -= 1
+                if not blockers[follower]:
+                    heapq.heappush(ready, follower)
+        return order
+
+    def memory_usage(self) -> int:
+        """Approximate bytes held by the index arrays (excluding node ID strings)."""
+        return sum(a.nbytes for a in (
+            self.succ_indptr, self.succ_indices, self.pred_indptr, self.pred_indices,
+            self.type_codes, self.state_codes
+        ))
+
+    # Integer API
+
+    def successor_codes(self, i: int) -> np.ndarray:
+        return self.succ_indices[self.succ_indptr[i]:self.succ_indptr[i + 1]]
+
+    def predecessor_codes(self, i: int) -> np.ndarray:
+        return self.pred_indices[self.pred_indptr[i]:self.pred_indptr[i + 1]]
+
+    def in_degrees(self) -> np.ndarray:
+        return np.diff(self.pred_indptr)
+
+    def out_degrees(self) -> np.ndarray:
+        return np.diff(self.succ_indptr)
+
+    def topological_codes(self) -> np.ndarray:
+        """Return node codes in topological order.
+
+        Raises:
+            nx.NetworkXUnfeasible: If the graph contains a cycle
+        """
+        remaining = self.in_degrees().copy()
+        frontier = np.flatnonzero(remaining == 0)
+        order = []
+        while len(frontier):
+            order.append(frontier)
+            # Successors of the whole frontier, with one decrement per edge
+            starts = self.succ_indptr[frontier]
+            counts = self.succ_indptr[frontier + 1] - starts
+            edge_positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+            succs = self.succ_indices[edge_positions]
+            np.subtract.at(remaining, succs, 1)
+            candidates = np.unique(succs)
+            frontier = candidates[remaining[candidates] == 0]
+        order = np.concatenate(order) if order else np.empty(0, dtype=np.int64)
+        if len(order) != len(self.node_ids):
+            raise nx.NetworkXUnfeasible("Graph contains a cycle or graph changed during iteration")
+        return order
+
+    # NetworkX-compatible API
+
+    def nodes(self, data: bool = False):
+        if not data:
+            return list(self.node_ids)
+        result = []
+        for i, node in enumerate(self.node_ids):
+            attrs = {}
+            if self.type_codes[i] >= 0:
+                attrs['type'] = self.types[self.type_codes[i]]
+            if self.state_codes[i] >= 0:
+                attrs['state'] = self.states[self.state_codes[i]]
+            result.append((node, attrs))
+        return result
+
+    def edges(self) -> List[Tuple[str, str]]:
+        ids = self.node_ids
+        sources = np.repeat(np.arange(len(ids)), np.diff(self.succ_indptr))
+        return [(ids[u], ids[v]) for u, v in zip(sources.tolist(), self.succ_indices.tolist())]
+
+    def successors(self, node: str) -> Iterator[str]:
+        ids = self.node_ids
+        return (ids[j] for j in self.successor_codes(self.index[node]).tolist())
+
+    def predecessors(self, node: str) -> Iterator[str]:
+        ids = self.node_ids
+        return (ids[j] for j in self.predecessor_codes(self.index[node]).tolist())
+
+    def in_degree(self, node: str) -> int:
+        i = self.index[node]
+        return int(self.pred_indptr[i + 1] - self.pred_indptr[i])
+
+    def out_degree(self, node: str) -> int:
+        i = self.index[node]
+        return int(self.succ_indptr[i + 1] - self.succ_indptr[i])
+
+    def degree(self, node: str) -> int:
+        return self.in_degree(node) + self.out_degree(node)
+
+    def has_edge(self, u: str, v: str) -> bool:
+        return u in self.index and v in self.index and self.index[v] in self.successor_codes(self.index[u])
+
+    def number_of_nodes(self) -> int:
+        return len(self.node_ids)
+
+    def number_of_edges(self) -> int:
+        return len(self.succ_indices)
+
+    def __contains__(self, node) -> bool:
+        return node in self.index
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.node_ids)
+
+def topological_order(G) -> List[str]:
+    """Return the nodes of a DiGraph or CsrGraph in topological order.
+
+    Raises:
+        nx.NetworkXUnfeasible: If the graph contains a cycle
+    """
+    if isinstance(G, CsrGraph):
+        return [G.node_ids[i] for i in G.topological_codes().tolist()]
+    return list(nx.topological_sort(G))
+
+def descendants(G, node: str) -> set:
+    """Return the set of nodes reachable from node in a DiGraph or CsrGraph."""
+    if not isinstance(G, CsrGraph):
+        return nx.descendants(G, node)
+    seen = np.zeros(len(G.node_ids), dtype=bool)
+    stack = [G.index[node]]
+    while stack:
+        for succ in G.successor_codes(stack.pop()).tolist():
+            if not seen[succ]:
+                seen[succ] = True
+                stack.append(succ)
+    return {G.node_ids[i] for i in np.flatnonzero(seen).tolist()}
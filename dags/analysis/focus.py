@@ -0,0 +1,142 @@
+import networkx as nx
+import logging
+import re
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional
+
+from ..utils.data import TemporalStore
+from .paths import PathInfo, path_highlights
+from .render import RenderJob, render_graphs
+
+logger = logging.getLogger(__name__)
+
+def induced_subgraph(G: nx.DiGraph, nodes: Iterable[str]) -> nx.DiGraph:
+    """Copy the subgraph of G induced by nodes, in the order given.
+
+    Only the adjacency of the given nodes is read, so the cost depends on the
+    size of the subgraph rather than of G. Works for a CsrGraph too.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph
+        nodes (Iterable[str]): Nodes to keep; nodes not in G are ignored
+
+    Returns:
+        nx.DiGraph: Induced subgraph
+    """
+    nodes = [node for node in dict.fromkeys(nodes) if node in G]
+    keep = set(nodes)
+    H = nx.DiGraph()
+    if isinstance(G, nx.DiGraph):
+        H.add_nodes_from((node, G.nodes[node]) for node in nodes)
+    else:
+        H.add_nodes_from(nodes)
+    H.add_edges_from((node, succ) for node in nodes for succ in G.successors(node) if succ in keep)
+    return H
+
+def top_paths_subgraph(G: nx.DiGraph, paths: Iterable) -> nx.DiGraph:
+    """Subgraph induced by the union of some paths, e.g. the top-K from find_top_paths.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph
+        paths (Iterable): Paths as node lists or PathInfo objects
+
+    Returns:
+        nx.DiGraph: Induced subgraph
+    """
+    return induced_subgraph(G, (node for path in paths for node in (path.nodes if isinstance(path, PathInfo) else path)))
+
+def neighborhood_subgraph(G: nx.DiGraph, node: str, hops: int = 2) -> nx.DiGraph:
+    """Subgraph induced by a node and its ancestors and descendants within a number of hops.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph
+        node (str): Node to focus on
+        hops (int): Maximum distance from node, upstream and downstream
+
+    Returns:
+        nx.DiGraph: Induced subgraph
+
+    Raises:
+        KeyError: If node is not in G
+    """
+    if node not in G:
+        raise KeyError(f"Node {node} not in graph")
+    nodes = [node]
+    for neighbors in (G.predecessors, G.successors):
+        seen = {node}
+        frontier = [node]
+        for _ in range(hops):
+            next_frontier = []
+            for current in frontier:
+                for neighbor in neighbors(current):
+                    if neighbor not in seen:
+                        seen.add(neighbor)
+                        next_frontier.append(neighbor)
+            nodes.extend(next_frontier)
+            frontier = next_frontier
+    return induced_subgraph(G, nodes)
+
+def opportunity_subgraph(G: nx.DiGraph, temporal_data: Dict[str, Any], opportunity: str) -> nx.DiGraph:
+    """Subgraph induced by the nodes of one opportunity.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph
+        temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
+        opportunity (str): OPPORTUNITY_NAME to keep
+
+    Returns:
+        nx.DiGraph: Induced subgraph, empty if no node has that opportunity
+    """
+    store = TemporalStore.from_temporal_data(temporal_data)
+    if opportunity not in store.opportunities:
+        return nx.DiGraph()
+    rows = np.flatnonzero(store.opportunity_codes == store.opportunities.index(opportunity))
+    return induced_subgraph(G, (store.node_ids[i] for i in rows.tolist()))
+
+def _file_stem(name: str) -> str:
+    """Turn an opportunity name into a safe file name stem."""
+    return re.sub(r'[^A-Za-z0-9._-]+', '_', name).strip('_') or 'opportunity'
+
+def render_opportunities(G: nx.DiGraph, temporal_data: Dict[str, Any], output_dir: Path, output_format: str = 'png',
+                         opportunities: Optional[List[str]] = None, highlight_paths: Optional[Iterable] = None,
+                         dpi: int = 1200, max_workers: Optional[int] = None) -> Dict[str, Path]:
+    """Render one image per opportunity, each laid out on its own, concurrently.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph
+        temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
+        output_dir (Path): Directory for the images
+        output_format (str): Graphviz output format
+        opportunities (List[str], optional): Opportunities to render, defaults to all of them
+        highlight_paths (Iterable, optional): Paths to highlight where they cross an opportunity
+        dpi (int): Output resolution for bitmap formats
+        max_workers (int, optional): Maximum concurrent Graphviz processes
+
+    Returns:
+        Dict[str, Path]: Image path per opportunity; opportunities with no edges are skipped
+    """
+    store = TemporalStore.from_temporal_data(temporal_data)
+    highlight_nodes, highlight_edges = path_highlights(highlight_paths or [])
+    jobs = {}
+    stems = set()
+    for opportunity in opportunities if opportunities is not None else store.opportunities:
+        subgraph = opportunity_subgraph(G, store, opportunity)
+        if not subgraph.number_of_edges():
+            logger.info(f"Skipping opportunity {opportunity}, which has no edges")
+            continue
+        stem = _file_stem(opportunity)
+        while stem in stems:
+            stem += '_'
+        stems.add(stem)
+        jobs[opportunity] = RenderJob(
+            Path(output_dir) / f'{stem}.{output_format}',
+            highlight_nodes=highlight_nodes,
+            highlight_edges=highlight_edges,
+            graph=subgraph
+        )
+
+    logger.info(f"Rendering {len(jobs)} opportunity subgraphs")
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    render_graphs(G, list(jobs.values()), dpi=dpi, max_workers=max_workers)
+    return {opportunity: job.output_path for opportunity, job in jobs.items()}
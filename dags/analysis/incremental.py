@@ -0,0 +1,228 @@
+import networkx as nx
+import logging
+import pandas as pd
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional
+from datetime import datetime
+
+from ..utils.data import TemporalStore
+from .csr import CsrGraph
+from .aggregates import PathAggregate, _node_dates, _propagate, _node_aggregate, aggregate_paths_by_node
+from .timing import analyze_timing
+
+logger = logging.getLogger(__name__)
+
+CHANGE_TYPES = ('add', 'remove', 'update')
+
+def read_delta(delta_file: Path) -> pd.DataFrame:
+    """Read a delta export of changed relationship rows.
+
+    A delta has the same columns as the full export plus CHANGE_TYPE, which is
+    'add', 'remove' or 'update' for each row.
+
+    Args:
+        delta_file (Path): Path to the delta CSV file
+
+    Returns:
+        pd.DataFrame: Delta rows in file order
+
+    Raises:
+        ValueError: If the file has no CHANGE_TYPE column or an unknown change type
+    """
+    logger.info(f"Reading delta from {delta_file}")
+    delta = pd.read_csv(delta_file)
+    _check_delta(delta)
+    logger.info(f"Successfully read {len(delta)} delta rows")
+    return delta
+
+def _check_delta(delta: pd.DataFrame) -> None:
+    """Raise ValueError unless every delta row has a known change type."""
+    if 'CHANGE_TYPE' not in delta.columns:
+        raise ValueError("Delta has no CHANGE_TYPE column")
+    unknown = set(delta['CHANGE_TYPE'].str.lower()) - set(CHANGE_TYPES)
+    if unknown:
+        raise ValueError(f"Unknown change types {sorted(unknown)}")
+
+def _relationship_edge(item: str, related: str, relationship_type: str):
+    """Edge implied by a relationship row, as create_dag adds it, or None."""
+    if relationship_type == 'Predecessor':
+        return related, item
+    if relationship_type == 'Successor':
+        return item, related
+    return None
+
+class IncrementalAnalysis:
+    """Upstream path aggregates and timing issues kept up to date under deltas.
+
+    Holds a mutable graph and temporal store. Each delta only recomputes the
+    aggregates of the nodes it touches and their descendants, and the timing
+    issues of the nodes whose own dates or incoming edges changed.
+
+    Attributes:
+        G (nx.DiGraph): Current graph
+        temporal_data (TemporalStore): Current temporal data, updated in place
+        issues (Dict[str, Dict[str, Any]]): Current timing issues, as analyze_timing returns them
+    """
+    def __init__(self, G: nx.DiGraph, temporal_data: Dict[str, Any], max_witness_paths: int = 1,
+                 today: Optional[datetime] = None):
+        """Build the initial aggregates and issues.
+
+        Args:
+            G (nx.DiGraph): NetworkX directed graph (a CsrGraph is converted, other graphs are updated in place)
+            temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
+            max_witness_paths (int): Maximum number of example paths kept per issue
+            today (datetime, optional): Reference date for overdue checks, fixed for the lifetime of the analysis
+        """
+        self.G = G.to_networkx() if isinstance(G, CsrGraph) else G
+        self.temporal_data = TemporalStore.from_temporal_data(temporal_data)
+        self.max_witness_paths = max_witness_paths
+        self.today = today or datetime.now()
+
+        self._dates = _node_dates(self.G, self.temporal_data)
+        self._counts = {}
+        self._aggregates = {}
+        _propagate(nx.topological_sort(self.G), self.G.predecessors, self._dates, self._counts, self._aggregates)
+        self.issues = self._analyze_timing()
+        logger.info(f"Initialized incremental analysis of {self.G.number_of_nodes()} nodes")
+
+    def _analyze_timing(self, nodes: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        return analyze_timing(self.G, self.temporal_data, self.max_witness_paths, self.today, nodes=nodes)
+
+    def apply_delta(self, delta: pd.DataFrame) -> Dict[str, int]:
+        """Apply a delta of relationship rows and refresh what it affects.
+
+        'add' and 'update' rows add their relationship edge if it is missing and
+        overwrite the related node's dates and opportunity and the work item's
+        type and state. Edges that would close a cycle are skipped with a
+        warning. 'remove' rows delete their relationship edge; nodes stay in
+        the graph.
+
+        Args:
+            delta (pd.DataFrame): Delta rows, as read by read_delta
+
+        Returns:
+            Dict[str, int]: Counts of added, removed and rejected edges, updated
+                nodes, recomputed aggregates and refreshed issue entries
+
+        Raises:
+            ValueError: If the delta has an unknown change type
+        """
+        _check_delta(delta)
+        change_types = delta['CHANGE_TYPE'].str.lower()
+        items = delta['WORK_ITEM_ID'].astype(str)
+        related = delta['WORK_ITEM_RELATED_ID'].astype(str)
+
+        added = []
+        removed = []
+        rejected = []
+        new_nodes = []
+        for change_type, item, related_id, relationship_type, node_type, node_state in zip(
+            change_types, items, related,
+            delta['WORK_ITEM_RELATIONSHIP_TYPE'],
+            delta['WORK_ITEM_TYPE_NAME'],
+            delta['WORK_ITEM_RELATIONSHIP_STATE_NAME']
+        ):
+            edge = _relationship_edge(item, related_id, relationship_type)
+            if change_type == 'remove':
+                if edge is not None and self.G.has_edge(*edge):
+                    self.G.remove_edge(*edge)
+                    removed.append(edge)
+                continue
+            if item not in self.G:
+                new_nodes.append(item)
+            self.G.add_node(item, type=node_type, state=node_state)
+            if edge is None or self.G.has_edge(*edge):
+                continue
+            u, v = edge
+            if u == v or (u in self.G and v in self.G and nx.has_path(self.G, v, u)):
+                logger.warning(f"Skipping relationship {u} -> {v}, which would create a cycle")
+                rejected.append(edge)
+                continue
+            new_nodes.extend(node for node in edge if node not in self.G)
+            self.G.add_edge(u, v)
+            added.append(edge)
+
+        # Dates come from the upserted rows, the last row for each related ID winning
+        upserts = change_types != 'remove'
+        updated = list(dict.fromkeys(related[upserts]))
+        self.temporal_data.upsert(
+            related[upserts].tolist(),
+            delta.loc[upserts, 'START_DATETIME'],
+            delta.loc[upserts, 'TARGET_DATETIME'],
+            delta.loc[upserts, 'CLOSED_DATETIME'],
+            delta.loc[upserts, 'OPPORTUNITY_NAME']
+        )
+
+        # Aggregates change at heads of changed edges, at nodes with new dates, and downstream of both
+        edge_nodes = [node for edge in added + removed for node in edge]
+        touched = {v for _, v in added + removed} | {node for node in updated + new_nodes if node in self.G}
+        self._dates.update(_node_dates(self.G, self.temporal_data, touched))
+        affected = set(touched)
+        stack = list(touched)
+        while stack:
+            for succ in self.G.successors(stack.pop()):
+                if succ not in affected:
+                    affected.add(succ)
+                    stack.append(succ)
+        order = list(nx.topological_sort(self.G.subgraph(affected)))
+        _propagate(order, self.G.predecessors, self._dates, self._counts, self._aggregates)
+
+        # Issues change where a node's dates, degree or incoming edges changed,
+        # and at successors of nodes whose target date may have moved
+        refresh = set(edge_nodes) | {node for node in updated if node in self.G}
+        refresh |= {succ for node in updated if node in self.G for succ in self.G.successors(node)}
+        for node in refresh:
+            self.issues.pop(node, None)
+        self.issues.update(self._analyze_timing(refresh))
+
+        summary = {
+            'added_edges': len(added),
+            'removed_edges': len(removed),
+            'rejected_edges': len(rejected),
+            'updated_nodes': len(updated),
+            'recomputed_aggregates': len(order),
+            'refreshed_issues': len(refresh)
+        }
+        logger.info(f"Applied delta of {len(delta)} rows: {summary}")
+        return summary
+
+    def aggregates(self) -> Dict[str, PathAggregate]:
+        """Current upstream path aggregates, as aggregate_paths_by_node returns them.
+
+        Returns:
+            Dict[str, PathAggregate]: Aggregates keyed by node
+        """
+        return {node: _node_aggregate(self._counts[node], self._aggregates[node]) for node in self.G.nodes()}
+
+    def verify(self) -> Dict[str, List[str]]:
+        """Diff the incremental state against a full recompute.
+
+        Returns:
+            Dict[str, List[str]]: Nodes whose 'aggregates' or 'issues' differ; both lists are empty when consistent
+        """
+        logger.info("Verifying incremental analysis against a full recompute")
+        expected = aggregate_paths_by_node(self.G, self.temporal_data)
+        actual = self.aggregates()
+        aggregate_mismatches = [node for node in expected if expected[node] != actual.get(node)]
+
+        expected_issues = _strip_paths(self._analyze_timing())
+        actual_issues = _strip_paths(self.issues)
+        issue_mismatches = [
+            node for node in expected_issues.keys() | actual_issues.keys()
+            if expected_issues.get(node) != actual_issues.get(node)
+        ]
+
+        mismatches = {'aggregates': aggregate_mismatches, 'issues': sorted(issue_mismatches)}
+        if aggregate_mismatches or issue_mismatches:
+            logger.warning(f"Incremental analysis differs from a full recompute: {mismatches}")
+        return mismatches
+
+def _strip_paths(issues: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Issues without their lazy witness paths, for comparison."""
+    def strip(record):
+        if isinstance(record, list):
+            return [strip(r) for r in record]
+        if isinstance(record, dict):
+            return {k: v for k, v in record.items() if k != 'paths'}
+        return record
+    return {node: {kind: strip(record) for kind, record in node_issues.items()} for node, node_issues in issues.items()}
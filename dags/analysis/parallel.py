@@ -0,0 +1,183 @@
+import networkx as nx
+import logging
+import os
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple, Any, Iterator, Optional
+
+from .paths import PathInfo
+from .csr import CsrGraph
+from .aggregates import _node_dates, _NO_DATE_MAX, _NO_DATE_MIN
+
+logger = logging.getLogger(__name__)
+
+# Successor CSR arrays and node dates of the graph being searched, set once per worker process
+_worker_graph = None
+
+def _encode_graph(G: nx.DiGraph) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Encode the successor lists of G as int32 CSR arrays, keeping adjacency order."""
+    if isinstance(G, CsrGraph):
+        return G.node_ids, G.succ_indptr, G.succ_indices
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+    indices = np.empty(G.number_of_edges(), dtype=np.int32)
+    position = 0
+    for i, node in enumerate(nodes):
+        for succ in G.successors(node):
+            indices[position] = index[succ]
+            position += 1
+        indptr[i + 1] = position
+    return nodes, indptr, indices
+
+def _init_worker(indptr: np.ndarray, indices: np.ndarray, dates: np.ndarray) -> None:
+    """Install the encoded graph and its (target, start, closed) node dates in a worker process."""
+    global _worker_graph
+    _worker_graph = (indptr.tolist(), indices.tolist(), [tuple(row) for row in dates.tolist()])
+
+def _enumerate_shard(sources: List[int], maximal: bool) -> List[Tuple[int, np.ndarray, np.ndarray, np.ndarray]]:
+    """Enumerate the paths starting at each source of a shard.
+
+    Returns one (source, offsets, values, dates) chunk per source: the paths
+    flattened into an int32 array, and each path's latest target, earliest
+    start and latest closed date as int64 nanoseconds. Paths come out grouped
+    by target in node order and in depth-first order within a target, which
+    is the order find_paths_with_dates uses. With maximal=True only paths
+    ending at nodes without successors are kept, in depth-first order.
+    """
+    indptr, indices, node_dates = _worker_graph
+    on_path = [False] * (len(indptr) - 1)
+    chunks = []
+    for source in sources:
+        paths = []
+        path_dates = []
+        path = [source]
+        prefix_dates = [node_dates[source]]
+        on_path[source] = True
+        stack = [iter(indices[indptr[source]:indptr[source + 1]])]
+        while stack:
+            node = next(stack[-1], None)
+            if node is None:
+                stack.pop()
+                prefix_dates.pop()
+                on_path[path.pop()] = False
+                continue
+            if on_path[node]:
+                continue
+            path.append(node)
+            target, start, closed = prefix_dates[-1]
+            node_target, node_start, node_closed = node_dates[node]
+            dates = (max(target, node_target), min(start, node_start), max(closed, node_closed))
+            is_sink = indptr[node] == indptr[node + 1]
+            if not maximal or is_sink:
+                paths.append(list(path))
+                path_dates.append(dates)
+            if is_sink:
+                path.pop()
+            else:
+                on_path[node] = True
+                prefix_dates.append(dates)
+                stack.append(iter(indices[indptr[node]:indptr[node + 1]]))
+
+        if not maximal:
+            order = sorted(range(len(paths)), key=lambda i: paths[i][-1])
+            paths = [paths[i] for i in order]
+            path_dates = [path_dates[i] for i in order]
+        offsets = np.zeros(len(paths) + 1, dtype=np.int64)
+        np.cumsum([len(p) for p in paths], out=offsets[1:])
+        values = np.fromiter((node for p in paths for node in p), dtype=np.int32, count=int(offsets[-1]))
+        chunks.append((source, offsets, values, np.array(path_dates, dtype=np.int64).reshape(-1, 3)))
+    return chunks
+
+def _decode_chunks(nodes: List[str], results) -> Iterator[PathInfo]:
+    """Turn shard results back into PathInfo objects, in order."""
+    timestamps = {_NO_DATE_MAX: None, _NO_DATE_MIN: None}
+    
+    def timestamp(value: int):
+        if value not in timestamps:
+            timestamps[value] = pd.Timestamp(value)
+        return timestamps[value]
+    
+    for chunks in results:
+        for _, offsets, values, dates in chunks:
+            path_nodes = [nodes[i] for i in values.tolist()]
+            bounds = zip(offsets[:-1].tolist(), offsets[1:].tolist(), dates.tolist())
+            for start, end, (target, start_date, closed) in bounds:
+                yield PathInfo(
+                    nodes=path_nodes[start:end],
+                    target_date=timestamp(target),
+                    start_date=timestamp(start_date),
+                    closed_date=timestamp(closed)
+                )
+
+def iter_paths_parallel(G: nx.DiGraph, temporal_data: Dict[str, Any], workers: Optional[int] = None,
+                        maximal: bool = False, shard_size: Optional[int] = None) -> Iterator[PathInfo]:
+    """Lazily yield every path in the DAG, enumerated on a process pool.
+
+    Sources are split into shards of consecutive nodes and searched on a
+    ProcessPoolExecutor. The graph is sent to each worker once, as int32 CSR
+    arrays plus int64 node dates, when the worker starts. Workers also reduce
+    each path's dates, and return flat integer chunks that are turned into
+    PathInfo objects in shard order, so the output matches
+    find_paths_with_dates (or its maximal mode) exactly.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph
+        temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
+        workers (int, optional): Number of worker processes, defaults to the CPU count
+        maximal (bool): Only yield maximal (source-to-sink) paths
+        shard_size (int, optional): Sources per task, defaults to about four tasks per worker
+
+    Yields:
+        PathInfo: Paths between all pairs of nodes
+    """
+    workers = workers or os.cpu_count() or 1
+    nodes, indptr, indices = _encode_graph(G)
+    if maximal:
+        sources = [i for i, node in enumerate(nodes) if G.in_degree(node) == 0 and G.out_degree(node)]
+    else:
+        sources = [i for i, node in enumerate(nodes) if G.out_degree(node)]
+    shard_size = shard_size or max(1, -(-len(sources) // (workers * 4)))
+    shards = [sources[i:i + shard_size] for i in range(0, len(sources), shard_size)]
+    node_dates = _node_dates(G, temporal_data)
+    dates = np.array([node_dates[node] for node in nodes], dtype=np.int64).reshape(-1, 3)
+    logger.info(f"Enumerating paths from {len(sources)} sources in {len(shards)} shards on {workers} workers")
+
+    # Record degrees for every node that lies on a path, as find_paths_with_dates does
+    for node in nodes:
+        if node in temporal_data and G.degree(node):
+            temporal_data[node].in_degree = G.in_degree(node)
+            temporal_data[node].out_degree = G.out_degree(node)
+
+    if workers == 1:
+        _init_worker(indptr, indices, dates)
+        results = (_enumerate_shard(shard, maximal) for shard in shards)
+        yield from _decode_chunks(nodes, results)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(indptr, indices, dates)) as executor:
+        results = executor.map(_enumerate_shard, shards, [maximal] * len(shards))
+        yield from _decode_chunks(nodes, results)
+
+def find_paths_with_dates_parallel(G: nx.DiGraph, temporal_data: Dict[str, Any], workers: Optional[int] = None,
+                                   maximal: bool = False) -> List[PathInfo]:
+    """Find paths in the DAG using a process pool.
+
+    Parallel counterpart of find_paths_with_dates, returning the same list.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph
+        temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
+        workers (int, optional): Number of worker processes, defaults to the CPU count
+        maximal (bool): Only return maximal (source-to-sink) paths
+
+    Returns:
+        List[PathInfo]: List of paths
+    """
+    logger.info(f"Finding {'maximal ' if maximal else ''}paths with dates in parallel")
+    path_infos = list(iter_paths_parallel(G, temporal_data, workers=workers, maximal=maximal))
+
+    if not path_infos:
+        logger.info("No paths found in the DAG")
+    return path_infos
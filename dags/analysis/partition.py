@@ -0,0 +1,276 @@
+import networkx as nx
+import itertools
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Tuple, Any, Optional
+
+from ..utils.data import TemporalStore
+from ..utils.instrument import instrumented
+from .budget import PathBudget, EnumerationReport
+from .aggregates import count_paths
+from .paths import PathInfo, find_paths_with_dates, find_sorted_paths, find_top_paths, path_highlights
+from .timing import analyze_timing
+from .render import RenderJob, render_graphs
+from .focus import induced_subgraph, _file_stem
+
+logger = logging.getLogger(__name__)
+
+PARTITION_MODES = ('component', 'opportunity')
+
+# Key of the partition holding nodes without an opportunity
+NO_OPPORTUNITY = '(no opportunity)'
+
+@dataclass
+class Partition:
+    """Class to describe one part of a partitioned DAG."""
+    key: str
+    nodes: List[str]
+
+@dataclass
+class PartitionResult:
+    """Class to store the analysis of one partition.
+
+    top_paths are plain PathInfo objects and the witness paths in
+    timing_issues are lists, so a result pickles without its graph.
+    enumeration reports what a path budget left out of the partition, and is
+    None when its paths were counted rather than enumerated.
+    """
+    key: str
+    nodes: int
+    edges: int
+    paths: int
+    top_paths: List[PathInfo]
+    timing_issues: Dict[str, Dict[str, Any]]
+    images: List[Path] = field(default_factory=list)
+    seconds: float = 0.0
+    enumeration: Optional[EnumerationReport] = None
+
+def component_partitions(G: nx.DiGraph) -> List[Partition]:
+    """Split a DAG into its weakly connected components, largest first.
+
+    Components are keyed 'component-1', 'component-2', ... in that order;
+    components of equal size keep the order of their first node, and the
+    nodes of each component keep the node order of G.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph or CsrGraph
+
+    Returns:
+        List[Partition]: One partition per component
+    """
+    order = {node: i for i, node in enumerate(G.nodes())}
+    seen = set()
+    components = []
+    for node in order:
+        if node in seen:
+            continue
+        seen.add(node)
+        component = [node]
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for neighbor in itertools.chain(G.successors(current), G.predecessors(current)):
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    component.append(neighbor)
+                    stack.append(neighbor)
+        component.sort(key=order.__getitem__)
+        components.append(component)
+    components.sort(key=len, reverse=True)
+    return [Partition(f'component-{i}', component) for i, component in enumerate(components, 1)]
+
+def opportunity_partitions(G: nx.DiGraph, temporal_data: Dict[str, Any]) -> List[Partition]:
+    """Split a DAG by OPPORTUNITY_NAME, largest opportunity first.
+
+    Edges between opportunities belong to no partition, so paths that cross
+    opportunities are cut at the boundary. Nodes without an opportunity are
+    kept together under NO_OPPORTUNITY.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph or CsrGraph
+        temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
+
+    Returns:
+        List[Partition]: One partition per opportunity
+    """
+    store = TemporalStore.from_temporal_data(temporal_data)
+    groups = {}
+    for node in G.nodes():
+        opportunity = store[node].opportunity if node in store else None
+        groups.setdefault(NO_OPPORTUNITY if opportunity is None else opportunity, []).append(node)
+    partitions = [Partition(key, nodes) for key, nodes in groups.items()]
+    partitions.sort(key=lambda partition: len(partition.nodes), reverse=True)
+    return partitions
+
+def partition_graph(G: nx.DiGraph, temporal_data: Dict[str, Any], by: str = 'component') -> List[Partition]:
+    """Split a DAG into independent partitions, largest first.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph or CsrGraph
+        temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
+        by (str): 'component' for weakly connected components or 'opportunity' for OPPORTUNITY_NAME
+
+    Returns:
+        List[Partition]: The partitions
+
+    Raises:
+        ValueError: If by is not one of PARTITION_MODES
+    """
+    if by not in PARTITION_MODES:
+        raise ValueError(f"Unknown partition mode {by}, expected one of {PARTITION_MODES}")
+    partitions = component_partitions(G) if by == 'component' else opportunity_partitions(G, temporal_data)
+    logger.info(f"Split {G.number_of_nodes()} nodes into {len(partitions)} partitions by {by}, "
+                f"largest {len(partitions[0].nodes) if partitions else 0} nodes")
+    return partitions
+
+def _analyze_partition(key: str, stem: str, G: nx.DiGraph, temporal_data: TemporalStore, options: Dict[str, Any]) -> PartitionResult:
+    """Find paths and timing issues of one partition, and render it if asked to.
+
+    Paths are only enumerated under a budget or in maximal mode; otherwise
+    the top paths come from a best-first search and the path count from
+    counting, as in the main analysis.
+    """
+    started = time.perf_counter()
+    if options['budget'] or options['maximal']:
+        paths = find_paths_with_dates(G, temporal_data, maximal=options['maximal'], budget=options['budget'])
+        top_paths = [
+            PathInfo(list(path.nodes), path.target_date, path.start_date, path.closed_date)
+            for path in find_sorted_paths(paths, options['max_paths'])
+        ]
+        path_count, enumeration = len(paths), paths.report
+    else:
+        top_paths = find_top_paths(G, temporal_data, options['max_paths'])
+        path_count, enumeration = count_paths(G), None
+        # Every edge lies on some path, so all paths highlight every edge and its endpoints
+        paths = [list(edge) for edge in G.edges()]
+    timing_issues = analyze_timing(G, temporal_data, options['max_witness_paths'], options['today'])
+    for node_issues in timing_issues.values():
+        for found in node_issues.values():
+            for record in found if isinstance(found, list) else [found] if found else []:
+                record['paths'] = [list(path) for path in record['paths']]
+
+    images = []
+    if options['render_dir'] is not None and G.number_of_edges():
+        render_dir = Path(options['render_dir'])
+        jobs = [RenderJob(render_dir / f"{stem}.{options['output_format']}")]
+        if len(paths):
+            highlight_nodes, highlight_edges = path_highlights(paths)
+            jobs.append(RenderJob(render_dir / f"{stem}_highlighted.{options['output_format']}",
+                                  highlight_nodes=highlight_nodes, highlight_edges=highlight_edges))
+        images = render_graphs(G, jobs, dpi=options['dpi'], max_workers=1)
+
+    return PartitionResult(
+        key=key,
+        nodes=G.number_of_nodes(),
+        edges=G.number_of_edges(),
+        paths=path_count,
+        top_paths=top_paths,
+        timing_issues=timing_issues,
+        images=images,
+        seconds=time.perf_counter() - started,
+        enumeration=enumeration
+    )
+
+def _analyze_batch(tasks: List[Tuple[str, str, nx.DiGraph, TemporalStore, Dict[str, Any]]]) -> List[PartitionResult]:
+    """Analyze a batch of partitions in a worker process."""
+    return [_analyze_partition(*task) for task in tasks]
+
+@instrumented(items=lambda results: {'partitions': len(results), 'paths': sum(result.paths for result in results)})
+def analyze_partitions(G: nx.DiGraph, temporal_data: Dict[str, Any], by: str = 'component',
+                       partitions: Optional[List[Partition]] = None, workers: Optional[int] = None,
+                       maximal: bool = False, max_paths: int = 20, max_witness_paths: int = 1,
+                       today: Optional[datetime] = None, render_dir: Optional[Path] = None,
+                       output_format: str = 'png', dpi: int = 1200,
+                       budget: Optional[PathBudget] = None) -> List[PartitionResult]:
+    """Find paths and timing issues of each partition of a DAG, and render them, on a process pool.
+
+    The graph is split once, and each partition is sent to a worker as its
+    own induced subgraph and temporal store. Partitions go out largest
+    first, alone, while small ones are packed into batches of about the same
+    node count, so the wall time is bounded by the largest partition rather
+    than by the whole graph. A batch's subgraphs are only built when it is
+    sent, with at most two batches per worker waiting, so the caller never
+    holds a second copy of the whole graph. With component partitions the
+    merged results are those of the whole graph, as no path crosses
+    components. temporal_data is not changed.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph or CsrGraph
+        temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
+        by (str): Partition mode, one of PARTITION_MODES; ignored if partitions are given
+        partitions (List[Partition], optional): Partitions to analyze, e.g. from partition_graph
+        workers (int, optional): Number of worker processes, defaults to the CPU count
+        maximal (bool): Enumerate maximal (source-to-sink) paths instead of counting all paths
+        max_paths (int): Number of top paths by target date kept per partition
+        max_witness_paths (int): Maximum number of example paths kept per timing issue
+        today (datetime, optional): Reference date for overdue checks, defaults to now
+        render_dir (Path, optional): Render each partition with edges, plain and highlighted, into this directory
+        output_format (str): Graphviz output format
+        dpi (int): Output resolution for bitmap formats
+        budget (PathBudget, optional): Limits on each partition's path enumeration; the time
+            limit applies to each partition on its own
+
+    Returns:
+        List[PartitionResult]: Results in partition order
+    """
+    workers = workers or os.cpu_count() or 1
+    partitions = partition_graph(G, temporal_data, by) if partitions is None else partitions
+    store = TemporalStore.from_temporal_data(temporal_data)
+    options = {
+        'maximal': maximal,
+        'max_paths': max_paths,
+        'max_witness_paths': max_witness_paths,
+        'today': today or datetime.now(),
+        'render_dir': render_dir,
+        'output_format': output_format,
+        'dpi': dpi,
+        'budget': budget
+    }
+    if render_dir is not None:
+        Path(render_dir).mkdir(parents=True, exist_ok=True)
+
+    batch_nodes = max(1, -(-G.number_of_nodes() // (workers * 4)))
+    batches = [[]]
+    batch_size = 0
+    stems = set()
+    for partition in partitions:
+        stem = _file_stem(partition.key)
+        while stem in stems:
+            stem += '_'
+        stems.add(stem)
+        if batch_size >= batch_nodes:
+            batches.append([])
+            batch_size = 0
+        batches[-1].append((partition.key, stem, partition.nodes))
+        batch_size += len(partition.nodes)
+    batches = [batch for batch in batches if batch]
+    logger.info(f"Analyzing {len(partitions)} partitions in {len(batches)} batches on {workers} workers")
+
+    def tasks(batch):
+        return [(key, stem, induced_subgraph(G, nodes), store.subset(nodes), options) for key, stem, nodes in batch]
+
+    if workers == 1 or len(batches) <= 1:
+        results = [result for batch in batches for result in _analyze_batch(tasks(batch))]
+    else:
+        workers = min(workers, len(batches))
+        results = []
+        futures = deque()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Results are collected in batch order, so they come out in partition order
+            for batch in batches:
+                if len(futures) >= 2 * workers:
+                    results.extend(futures.popleft().result())
+                futures.append(executor.submit(_analyze_batch, tasks(batch)))
+            while futures:
+                results.extend(futures.popleft().result())
+
+    if results:
+        slowest = max(results, key=lambda result: result.seconds)
+        logger.info(f"Analyzed {len(results)} partitions; slowest {slowest.key} ({slowest.nodes} nodes) took {slowest.seconds:.2f}s")
+    return results
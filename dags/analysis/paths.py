@@ -1,10 +1,20 @@
 import networkx as nx
+import heapq
+import itertools
 import logging
-from typing import Dict, List, Tuple, Any
+import math
+import numpy as np
+from typing import Dict, List, Set, Tuple, Any, Callable, Iterable, Iterator, Optional, Sequence
 from datetime import datetime
 from dataclasses import dataclass
 from pathlib import Path
-import pydot
+
+from .aggregates import _node_dates, _NO_DATE_MAX
+from .budget import PathBudget, EnumerationReport, BudgetTracker
+from .csr import CsrGraph, topological_order
+from .reachability import ReachabilityIndex
+from .render import RenderJob, render_graphs
+from ..utils.instrument import instrumented
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +26,7 @@ class PathInfo:
     start_date: datetime
     closed_date: datetime
 
+@instrumented(items=lambda G: {'nodes': G.number_of_nodes(), 'edges': G.number_of_edges()})
 def create_dag(data: Dict) -> nx.DiGraph:
     """Create a NetworkX DAG from the data.
     
@@ -41,153 +52,435 @@ def create_dag(data: Dict) -> nx.DiGraph:
     logger.info(f"Created DAG with {G.number_of_nodes()} nodes and {G.number_of_edges()} edges")
     return G
 
-def plot_dag(G: nx.DiGraph, output_path: Path, highlight_paths: List[List[str]] = None) -> None:
-    """Create a visual representation of the DAG using pydot.
+@instrumented(items=lambda sets: {'nodes': len(sets[0]), 'edges': len(sets[1])})
+def path_highlights(paths: Iterable) -> Tuple[Set[str], Set[Tuple[str, str]]]:
+    """Collect the nodes and consecutive edges of a set of paths for highlighting.
+    
+    Args:
+        paths (Iterable): Paths as node lists or PathInfo objects
+        
+    Returns:
+        tuple: (nodes, edges)
+            nodes: Set of nodes on any path
+            edges: Set of (source, target) pairs that are consecutive on any path
+    """
+    nodes = set()
+    edges = set()
+    for path in paths:
+        path = path.nodes if isinstance(path, PathInfo) else path
+        nodes.update(path)
+        edges.update(zip(path, path[1:]))
+    return nodes, edges
+
+@instrumented()
+def plot_dag(G: nx.DiGraph, output_path: Path, highlight_paths: List[List[str]] = None,
+             highlight_nodes: Optional[Set[str]] = None,
+             highlight_edges: Optional[Set[Tuple[str, str]]] = None,
+             positions: Optional[Dict[str, Tuple[float, float]]] = None, dpi: int = 1200) -> None:
+    """Create a visual representation of the DAG with Graphviz.
+    
+    Highlighting is looked up in node and edge sets, built once from
+    highlight_paths or passed in directly (e.g. from path_highlights), so it
+    costs the same however many paths are highlighted. The DOT text is
+    streamed straight into Graphviz; see render.render_graphs for rendering
+    several images at once.
     
     Args:
         G (nx.DiGraph): NetworkX directed graph
-        output_path (Path): Path to save the output PNG file
+        output_path (Path): Path to save the output file; the suffix (png, svg, plain, ...) picks the format
         highlight_paths (List[List[str]], optional): List of paths to highlight in the graph
+        highlight_nodes (Set[str], optional): Nodes to highlight, in addition to those on highlight_paths
+        highlight_edges (Set[Tuple[str, str]], optional): Edges to highlight, in addition to those on highlight_paths
+        positions (Dict[str, Tuple[float, float]], optional): Precomputed layout from render.compute_layout
+        dpi (int): Output resolution for bitmap formats
     """
     logger.info(f"Creating DAG visualization at {output_path}")
     
-    # Create pydot graph with high DPI settings
-    dot = pydot.Dot(graph_type='digraph', rankdir='TB', dpi='1200')
-    dot.set_node_defaults(shape='box', style='filled', fillcolor='lightblue')
-    dot.set_edge_defaults(arrowhead='vee')
+    highlight_nodes = set(highlight_nodes or ())
+    highlight_edges = set(highlight_edges or ())
+    if highlight_paths:
+        path_nodes, path_edges = path_highlights(highlight_paths)
+        highlight_nodes |= path_nodes
+        highlight_edges |= path_edges
     
-    # Add nodes
-    for node, attrs in G.nodes(data=True):
-        # Create node label with type and state
-        #node_type = attrs.get('type', 'Unknown')
-        #node_state = attrs.get('state', 'Unknown')
-        #label = f"{node}\n{node_type}\n{node_state}"
-        label = f"{node}"
-        
-        # Create node with attributes
-        pydot_node = pydot.Node(
-            node,
-            label=label,
-            fillcolor='lightgreen' if highlight_paths and any(node in path for path in highlight_paths) else 'lightblue'
-        )
-        dot.add_node(pydot_node)
-    
-    # Add edges
-    for source, target in G.edges():
-        # Create edge with attributes
-        edge = pydot.Edge(
-            source,
-            target,
-            color='red' if highlight_paths and any(
-                source in path and target in path and 
-                path.index(source) + 1 == path.index(target) 
-                for path in highlight_paths
-            ) else 'black'
-        )
-        dot.add_edge(edge)
-    
-    # Save the graph with high resolution settings
     try:
-        # Set graph attributes for high resolution
-        dot.set('dpi', '1200')
-        dot.set('size', '60, 6')  # Not intended to print!
-        dot.set('ratio', 'fill')
-        dot.set('concentrate', 'true')  # Merge edges between same nodes
-        
-        # Write high resolution PNG
-        dot.write_png(str(output_path), prog='dot')
+        job = RenderJob(output_path, highlight_nodes=highlight_nodes, highlight_edges=highlight_edges)
+        render_graphs(G, [job], positions=positions, dpi=dpi, max_workers=1)
         logger.info(f"Successfully created high resolution DAG visualization at {output_path}")
     except Exception as e:
         logger.error(f"Failed to create DAG visualization: {e}")
         raise
 
-def find_paths_with_dates(G: nx.DiGraph, temporal_data: Dict[str, Any]) -> List[PathInfo]:
+def _path_info(G: nx.DiGraph, path: List[str], temporal_data: Dict[str, Any]) -> PathInfo:
+    """Build a PathInfo for a path and record degrees for its nodes."""
+    # Get the latest target date in the path
+    target_dates = []
+    start_dates = []
+    closed_dates = []
+    
+    for node in path:
+        if node in temporal_data:
+            if temporal_data[node].target_date:
+                target_dates.append(temporal_data[node].target_date)
+            if temporal_data[node].start_date:
+                start_dates.append(temporal_data[node].start_date)
+            if temporal_data[node].closed_date:
+                closed_dates.append(temporal_data[node].closed_date)
+            # Calculate in and out degrees for nodes in path
+            temporal_data[node].in_degree = G.in_degree(node)
+            temporal_data[node].out_degree = G.out_degree(node)
+    
+    # Use the latest dates if available
+    latest_target = max(target_dates) if target_dates else None
+    earliest_start = min(start_dates) if start_dates else None
+    latest_closed = max(closed_dates) if closed_dates else None
+    
+    return PathInfo(
+        nodes=path,
+        target_date=latest_target,
+        start_date=earliest_start,
+        closed_date=latest_closed
+    )
+
+@instrumented(yields='paths')
+def iter_maximal_paths(G: nx.DiGraph) -> Iterator[List[str]]:
+    """Lazily yield the maximal paths of a DAG.
+    
+    A maximal path runs from a node with no predecessors to a node with no
+    successors. Every other path is a sub-path of one of these. Runs one
+    depth-first search per source, extending and trimming a single shared
+    prefix instead of restarting the search for every node pair.
+    
+    Args:
+        G (nx.DiGraph): NetworkX directed graph (must be acyclic)
+        
+    Yields:
+        List[str]: Node lists of maximal paths with two or more nodes
+    """
+    for source in G.nodes():
+        if G.in_degree(source) or not G.out_degree(source):
+            continue
+        path = [source]
+        stack = [iter(G.successors(source))]
+        while stack:
+            node = next(stack[-1], None)
+            if node is None:
+                stack.pop()
+                path.pop()
+                continue
+            path.append(node)
+            if G.out_degree(node):
+                stack.append(iter(G.successors(node)))
+            else:
+                yield list(path)
+                path.pop()
+
+def _iter_pair_paths(G: nx.DiGraph, source: str, target: str, reachability: ReachabilityIndex,
+                     cutoff: Optional[int] = None, step: Optional[Callable[[], bool]] = None) -> Iterator[List[str]]:
+    """Lazily yield the paths from source to target of a DAG, in the order of nx.all_simple_paths.
+    
+    Only successors that reach target are followed, so no time goes into
+    branches that cannot end there, and paths longer than cutoff edges are
+    not followed. step, if given, is called at every step of the search, and
+    the search returns early, without error, once it returns True, even
+    between two paths.
+    """
+    path = [source]
+    stack = [iter(G.successors(source))]
+    while stack:
+        if step is not None and step():
+            return
+        node = next(stack[-1], None)
+        if node is None:
+            stack.pop()
+            path.pop()
+        elif node == target:
+            yield path + [node]
+        elif (cutoff is None or len(path) < cutoff) and reachability.reaches(node, target):
+            path.append(node)
+            stack.append(iter(G.successors(node)))
+
+@instrumented(yields='paths')
+def iter_paths_with_dates(G: nx.DiGraph, temporal_data: Dict[str, Any], maximal: bool = False,
+                          reachability: Optional[ReachabilityIndex] = None, budget: Optional[PathBudget] = None,
+                          report: Optional[EnumerationReport] = None) -> Iterator[PathInfo]:
+    """Lazily yield every path in the DAG as a PathInfo.
+    
+    Yields the same paths, in the same order, as find_paths_with_dates without
+    holding them all in memory. Only node pairs the reachability index
+    connects are searched, rather than all V^2 of them, and each pair's
+    search only follows nodes that still reach its target.
+    
+    With a budget, each pair's search stops after max_paths_per_pair paths,
+    paths longer than max_length edges are not searched, and the whole search
+    stops cleanly after max_paths paths or once time_limit has passed, even
+    in the middle of a pair. The budget is applied by a BudgetTracker, as in
+    PathStore.from_graph, which the maximal and CsrGraph searches go through,
+    so every search keeps the same paths and fills in the same report.
+    
+    Args:
+        G (nx.DiGraph): NetworkX directed graph
+        temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
+        maximal (bool): Only yield maximal (source-to-sink) paths
+        reachability (ReachabilityIndex, optional): Index of G to reuse, built if not given
+        budget (PathBudget, optional): Limits on the search
+        report (EnumerationReport, optional): Filled in with what the budget left out
+        
+    Yields:
+        PathInfo: Paths between all pairs of nodes
+    """
+    if budget is not None and (maximal or isinstance(G, CsrGraph)):
+        from .pathstore import PathStore
+        store = PathStore.from_graph(G, temporal_data, maximal=maximal, budget=budget)
+        if report is not None:
+            vars(report).update(vars(store.report))
+        yield from store
+        return
+    
+    if maximal:
+        for path in iter_maximal_paths(G):
+            yield _path_info(G, path, temporal_data)
+        return
+    
+    if isinstance(G, CsrGraph):
+        # nx.all_simple_paths needs a DiGraph; the single-worker DFS gives the same order
+        from .parallel import iter_paths_parallel
+        yield from iter_paths_parallel(G, temporal_data, workers=1)
+        return
+    
+    # Pairs with several paths are counted and logged once at the end; per pair only at DEBUG
+    log_pairs = logger.isEnabledFor(logging.DEBUG)
+    multi_path_pairs = 0
+    most_paths = (0, None, None)
+    reachability = reachability or ReachabilityIndex(G)
+    
+    tracker = BudgetTracker(G, budget, report)
+    sources = [source for source in G.nodes() if G.out_degree(source)]
+    tracker.report.sources_total = len(sources)
+    for source in sources:
+        if not tracker.start_source(source):
+            break
+        # Reachable targets in node order; a DAG never reaches a node from itself
+        for target in reachability.descendants(source):
+            paths = []
+            for path in _iter_pair_paths(G, source, target, reachability, tracker.budget.max_length, tracker.step):
+                if not tracker.keep(source, target):
+                    # The search is lazy, so the paths past the limit are never searched
+                    break
+                paths.append(path)
+            if len(paths) > 1:
+                multi_path_pairs += 1
+                if len(paths) > most_paths[0]:
+                    most_paths = (len(paths), source, target)
+                if log_pairs:
+                    logger.debug("Found %d paths between %s and %s", len(paths), source, target)
+            for path in paths:
+                yield _path_info(G, path, temporal_data)
+            if tracker.report.stopped:
+                break
+        tracker.end_source(source)
+    if multi_path_pairs:
+        logger.info("Found %d node pairs with more than one path, at most %d between %s and %s",
+                    multi_path_pairs, *most_paths)
+    tracker.finish()
+
+@instrumented(items=lambda paths: {'paths': len(paths)})
+def find_paths_with_dates(G: nx.DiGraph, temporal_data: Dict[str, Any], maximal: bool = False,
+                          budget: Optional[PathBudget] = None) -> Sequence[PathInfo]:
     """Find paths in the DAG and sort them by target date.
     
+    With maximal=True only source-to-sink paths are returned. Every edge and
+    every connected node still lies on one of them, so analyze_path_timing
+    finds the same issues from a much smaller path set.
+    
+    The paths, in the order iter_paths_with_dates yields them, are kept in a
+    PathStore that shares common prefixes, and come out as StoredPath
+    handles whose node lists are built on access.
+    
+    A budget bounds the search; the paths found before it ran out are
+    returned, and the store's report says which pairs and sources were cut.
+    
     Args:
         G (nx.DiGraph): NetworkX directed graph
         temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
-        max_paths (int): Maximum number of paths to return
+        maximal (bool): Only return maximal (source-to-sink) paths
+        budget (PathBudget, optional): Limits on the number, length and search time of paths
         
     Returns:
-        List[PathInfo]: List of paths sorted by target date (latest first)
+        Sequence[PathInfo]: PathStore of the paths
     """
-    logger.info(f"Finding paths with dates")
-    all_paths = []
+    from .pathstore import PathStore
+    logger.info(f"Finding {'maximal ' if maximal else ''}paths with dates")
+    path_infos = PathStore.from_graph(G, temporal_data, maximal=maximal, budget=budget)
     
-    # Find all paths between all pairs of nodes
-    for source in G.nodes():
-        for target in G.nodes():
-            if source != target:
-                try:
-                    paths = list(nx.all_simple_paths(G, source, target))
-                    if len(paths) > 1:
-                        logger.info(f"Found {len(paths)} paths between {source} and {target}")
-                    all_paths.extend(paths)
-                except nx.NetworkXNoPath:
-                    continue
-    
-    if not all_paths:
+    if not path_infos:
         logger.info("No paths found in the DAG")
-        return []
-    
-    # Convert paths to PathInfo objects with temporal data
-    path_infos = []
-    for path in all_paths:
-        # Get the latest target date in the path
-        target_dates = []
-        start_dates = []
-        closed_dates = []
-        
-        for node in path:
-            if node in temporal_data:
-                if temporal_data[node].target_date:
-                    target_dates.append(temporal_data[node].target_date)
-                if temporal_data[node].start_date:
-                    start_dates.append(temporal_data[node].start_date)
-                if temporal_data[node].closed_date:
-                    closed_dates.append(temporal_data[node].closed_date)
-                # Calculate in and out degrees for nodes in path
-                temporal_data[node].in_degree = G.in_degree(node)
-                temporal_data[node].out_degree = G.out_degree(node)
-        
-        # Use the latest dates if available
-        latest_target = max(target_dates) if target_dates else None
-        earliest_start = min(start_dates) if start_dates else None
-        latest_closed = max(closed_dates) if closed_dates else None
-        
-        path_infos.append(PathInfo(
-            nodes=path,
-            target_date=latest_target,
-            start_date=earliest_start,
-            closed_date=latest_closed
-        ))
     return path_infos
 
 
-def find_sorted_paths(path_infos, max_paths: int = 20) -> List[PathInfo]:
-    # Sort paths by target date (latest first) and take top max_paths
-    sorted_paths = sorted(
-        path_infos,
-        key=lambda x: (x.target_date or datetime.min),
-        reverse=True
+@instrumented(items=lambda paths: {'paths': len(paths)})
+def find_sorted_paths(path_infos: Iterable[PathInfo], max_paths: int = 20) -> List[PathInfo]:
+    """Select the paths with the latest target dates.
+    
+    Consumes path_infos once, keeping only max_paths candidates in a heap, so
+    it can be fed from iter_paths_with_dates without materializing every path.
+    Ties keep their input order.
+    
+    Args:
+        path_infos (Iterable[PathInfo]): Paths to choose from
+        max_paths (int): Maximum number of paths to return
+        
+    Returns:
+        List[PathInfo]: Paths sorted by target date (latest first)
+    """
+    path_count = 0
+    
+    def counted(paths):
+        nonlocal path_count
+        for path_info in paths:
+            path_count += 1
+            yield path_info
+    
+    # Keep the top max_paths by target date (latest first)
+    sorted_paths = heapq.nlargest(
+        max_paths,
+        counted(path_infos),
+        key=lambda x: (x.target_date or datetime.min)
     )
     
-    logger.info(f"Found {len(sorted_paths)} paths with target dates")
-    logger.info(f"Returning {max_paths} paths")
-    return sorted_paths[:max_paths]
+    logger.info(f"Found {path_count} paths with target dates")
+    logger.info(f"Returning {len(sorted_paths)} paths")
+    return sorted_paths
 
 
+@instrumented(yields='paths')
+def iter_paths_by_target_date(G: nx.DiGraph, temporal_data: Dict[str, Any]) -> Iterator[PathInfo]:
+    """Lazily yield paths in order of latest target date, latest first.
+    
+    Best-first search over the DAG. Each partial path is ranked by an upper
+    bound on the target date any extension of it can reach (the latest target
+    date among the path and all descendants of its last node), so a path is
+    only yielded once no unexplored extension can beat it. Partial paths share
+    their prefixes, and branches whose bound never reaches the top of the heap
+    are never expanded.
+    
+    Paths that share a target date come out in the order find_paths_with_dates
+    enumerates them: by source in node order, then by target in node order,
+    then in depth-first order. A partial path is ranked among them by the
+    first target, in node order, that an extension reaching its bound can end
+    at, so the ties are broken without enumerating them.
+    
+    Args:
+        G (nx.DiGraph): NetworkX directed graph
+        temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
+        
+    Yields:
+        PathInfo: Paths of two or more nodes, latest target date first
+        
+    Raises:
+        nx.NetworkXUnfeasible: If the graph contains a cycle
+    """
+    target_dates = {node: dates[0] for node, dates in _node_dates(G, temporal_data).items()}
+    index = {node: i for i, node in enumerate(G.nodes())}
+    
+    # Per node: latest target date among itself and its descendants, and among its strict
+    # descendants only; the first descendant in node order; and the first node in node
+    # order a path from the node can end at while reaching each of those two dates
+    reachable_target = {}
+    descendant_target = {}
+    first_descendant = {}
+    reachable_first = {}
+    descendant_first = {}
+    for node in reversed(topological_order(G)):
+        best = _NO_DATE_MAX
+        first = math.inf
+        for succ in G.successors(node):
+            best = max(best, reachable_target[succ])
+            first = min(first, index[succ], first_descendant[succ])
+        descendant_target[node] = best
+        reachable_target[node] = max(best, target_dates[node])
+        first_descendant[node] = first
+        descendant_first[node] = min((reachable_first[succ] for succ in G.successors(node)
+                                      if reachable_target[succ] == best), default=math.inf)
+        if target_dates[node] >= best:
+            reachable_first[node] = min(index[node], first)
+        else:
+            reachable_first[node] = descendant_first[node]
+    
+    # Heap entries: (-date, source, target, successor positions, kind, sequence, (node, parent cell), latest
+    # target so far). A complete path's key is exact; a partial path's is the least key of any extension
+    # reaching its bound, since its successor positions prefix theirs. Complete paths sort before partial
+    # paths with an otherwise equal key.
+    complete, partial = 0, 1
+    sequence = itertools.count()
+    heap = []
+    for node in G.nodes():
+        if G.out_degree(node):
+            latest = target_dates[node]
+            first = first_descendant[node] if latest >= descendant_target[node] else descendant_first[node]
+            heapq.heappush(heap, (-reachable_target[node], index[node], first, (), partial, next(sequence),
+                                  (node, None), latest))
+    
+    while heap:
+        _, source, _, positions, kind, _, cell, latest = heapq.heappop(heap)
+        if kind == complete:
+            path = []
+            while cell is not None:
+                path.append(cell[0])
+                cell = cell[1]
+            path.reverse()
+            yield _path_info(G, path, temporal_data)
+            continue
+        
+        for position, succ in enumerate(G.successors(cell[0])):
+            succ_latest = max(latest, target_dates[succ])
+            succ_cell = (succ, cell)
+            succ_positions = positions + (position,)
+            heapq.heappush(heap, (-succ_latest, source, index[succ], succ_positions, complete, next(sequence),
+                                  succ_cell, succ_latest))
+            if G.out_degree(succ):
+                if succ_latest >= descendant_target[succ]:
+                    bound, first = succ_latest, first_descendant[succ]
+                else:
+                    bound, first = descendant_target[succ], descendant_first[succ]
+                heapq.heappush(heap, (-bound, source, first, succ_positions, partial, next(sequence),
+                                      succ_cell, succ_latest))
+
+@instrumented(items=lambda paths: {'paths': len(paths)})
+def find_top_paths(G: nx.DiGraph, temporal_data: Dict[str, Any], max_paths: int = 20) -> List[PathInfo]:
+    """Find the paths with the latest target dates without enumerating every path.
+    
+    Returns the same paths, in the same order, as
+    find_sorted_paths(find_paths_with_dates(...)), including which of the
+    paths that share a target date make the cut.
+    
+    Args:
+        G (nx.DiGraph): NetworkX directed graph
+        temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
+        max_paths (int): Maximum number of paths to return
+        
+    Returns:
+        List[PathInfo]: Paths sorted by target date (latest first)
+    """
+    logger.info(f"Finding top {max_paths} paths by target date")
+    top_paths = list(itertools.islice(iter_paths_by_target_date(G, temporal_data), max_paths))
+    logger.info(f"Returning {len(top_paths)} paths")
+    return top_paths
+
+
+@instrumented(items=lambda metrics: {'nodes': metrics['total_nodes'], 'edges': metrics['total_edges']})
 def analyze_network(G: nx.DiGraph) -> Dict[str, Any]:
     """Perform basic network analysis on the DAG.
     
     Args:
-        G (nx.DiGraph): NetworkX directed graph
+        G (nx.DiGraph): NetworkX directed graph or CsrGraph
         
     Returns:
         dict: Dictionary containing various network metrics
     """
     logger.info("Performing network analysis")
+    if isinstance(G, CsrGraph):
+        return _analyze_csr_network(G)
     metrics = {
         'total_nodes': G.number_of_nodes(),
         'total_edges': G.number_of_edges(),
@@ -208,105 +501,179 @@ def analyze_network(G: nx.DiGraph) -> Dict[str, Any]:
         metrics['node_states'][node_state] = metrics['node_states'].get(node_state, 0) + 1
     
     logger.info(f"Network analysis complete. Found {len(metrics['node_types'])} node types and {len(metrics['node_states'])} states")
-    logger.debug(f"Node types: {metrics['node_types']}")
-    logger.debug(f"Node states: {metrics['node_states']}")
+    logger.debug("Node types: %s", metrics['node_types'])
+    logger.debug("Node states: %s", metrics['node_states'])
     
     return metrics 
 
-def analyze_path_timing(path_infos: List[PathInfo], temporal_data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+def _analyze_csr_network(G: CsrGraph) -> Dict[str, Any]:
+    """Compute the analyze_network metrics from a CsrGraph's arrays."""
+    n = G.number_of_nodes()
+    scale = 1 / (n - 1) if n > 1 else 1
+    try:
+        topological_sort = topological_order(G)
+    except nx.NetworkXUnfeasible:
+        topological_sort = None
+    
+    def counts(codes: np.ndarray, categories: List[str]) -> Dict[str, int]:
+        # Categories in order of first appearance, like the DiGraph version
+        labels = np.array(categories + ['Unknown'], dtype=object)[codes]
+        _, first, totals = np.unique(labels.astype(str), return_index=True, return_counts=True)
+        order = np.argsort(first)
+        return {labels[first[i]]: int(totals[i]) for i in order}
+    
+    metrics = {
+        'total_nodes': n,
+        'total_edges': G.number_of_edges(),
+        'is_dag': topological_sort is not None,
+        'node_types': counts(G.type_codes, G.types),
+        'node_states': counts(G.state_codes, G.states),
+        'in_degree_centrality': dict(zip(G.node_ids, (G.in_degrees() * scale).tolist())),
+        'out_degree_centrality': dict(zip(G.node_ids, (G.out_degrees() * scale).tolist())),
+        'topological_sort': topological_sort
+    }
+    
+    logger.info(f"Network analysis complete. Found {len(metrics['node_types'])} node types and {len(metrics['node_states'])} states")
+    return metrics
+
+def _node_timing_issues(node: str, node_data, today: datetime) -> List[Tuple[str, Dict[str, Any]]]:
+    """Check a node's own dates, returning (issue type, record) pairs without the path."""
+    found = []
+    # Check for missing start dates
+    if not node_data.start_date:
+        found.append(('missing_start_dates', {
+            'node': node,
+            'target_date': node_data.target_date,
+            'start_date': node_data.start_date,
+            'closed_date': node_data.closed_date
+        }))
+    # Check for missing complete dates
+    if not node_data.target_date:
+        found.append(('missing_target_dates', {
+            'node': node,
+            'target_date': node_data.target_date,
+            'start_date': node_data.start_date,
+            'closed_date': node_data.closed_date
+        }))
+    # Check for completed nodes without close dates
+    if node_data.target_date and node_data.target_date < today and not node_data.closed_date:
+        found.append(('target_passed_without_close', {
+            'node': node,
+            'target_date': node_data.target_date,
+            'start_date': node_data.start_date,
+            'closed_date': node_data.closed_date
+        }))
+    return found
+
+def _edge_timing_issues(node: str, node_data, pred_node: str, pred_data) -> List[Tuple[str, Dict[str, Any]]]:
+    """Check a node's dates against its predecessor's, returning (issue type, record) pairs without the path."""
+    found = []
+    # Check if node ends before predecessor
+    if (node_data.target_date and pred_data.target_date and
+        node_data.target_date < pred_data.target_date):
+        found.append(('end_before_predecessor_end', {
+            'node': node,
+            'predecessor': pred_node,
+            'node_date': node_data.target_date,
+            'predecessor_date': pred_data.target_date
+        }))
+    # Check if node starts before predecessor ends
+    if (node_data.start_date and pred_data.target_date and
+        node_data.start_date < pred_data.target_date):
+        found.append(('start_before_predecessor_end', {
+            'node': node,
+            'predecessor': pred_node,
+            'start_date': node_data.start_date,
+            'predecessor_date': pred_data.target_date
+        }))
+    return found
+
+@instrumented(yields='issues')
+def iter_path_timing_issues(path_infos: Iterable[PathInfo], temporal_data: Dict[str, Any],
+                            today: Optional[datetime] = None) -> Iterator[Tuple[int, PathInfo, str, Dict[str, Any]]]:
+    """Lazily yield the timing issues analyze_path_timing finds, as each path is read.
+
+    A node's own issues are reported on the first path that reaches it, and
+    predecessor issues on every path that crosses the edge. Only the set of
+    nodes seen so far is kept, so paths can come straight from a generator
+    such as iter_paths_with_dates.
+
+    Args:
+        path_infos (Iterable[PathInfo]): Paths to analyze, as PathInfo objects or node lists
+        temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
+        today (datetime, optional): Reference date for overdue checks, defaults to now
+
+    Yields:
+        Tuple[int, PathInfo, str, Dict[str, Any]]: Index of the path, the path as given, issue type and issue record
+    """
+    today = today or datetime.now()
+    seen = set()
+    for path_index, path_info in enumerate(path_infos):
+        # Read once, since a StoredPath builds its node list on each access
+        nodes = path_info.nodes if isinstance(path_info, PathInfo) else path_info
+        for i, node in enumerate(nodes):
+            node_data = temporal_data.get(node)
+            if not node_data:
+                continue
+            if node not in seen:
+                seen.add(node)
+                for issue_type, record in _node_timing_issues(node, node_data, today):
+                    yield path_index, path_info, issue_type, record
+            # Skip first node as it has no predecessors on the path
+            if i > 0:
+                pred_node = nodes[i-1]
+                pred_data = temporal_data.get(pred_node)
+                if pred_data:
+                    for issue_type, record in _edge_timing_issues(node, node_data, pred_node, pred_data):
+                        yield path_index, path_info, issue_type, record
+
+@instrumented(items=lambda issues: {'issues': sum(len(found) for found in issues.values())})
+def analyze_path_timing(path_infos: Iterable[PathInfo], temporal_data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
     """Analyze paths for timing issues and inconsistencies.
     
+    Reads path_infos once, so the paths can come from a generator.
+    
     Args:
-        path_infos (List[PathInfo]): List of paths to analyze
-        G (nx.DiGraph): NetworkX directed graph
+        path_infos (Iterable[PathInfo]): Paths to analyze, as PathInfo objects or node lists
         temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
         
     Returns:
         Dict[str, List[Dict[str, Any]]]: Dictionary containing lists of issues found, categorized by type
     """
     logger.info("Analyzing paths for timing issues")
-    today = datetime.now()
     
     issues = {}
-
-    for path_info in path_infos:
-        for i, node in enumerate(path_info.nodes):
-            node_data = temporal_data.get(node)
-            if not node_data:
-                continue
-
-            if node not in issues: 
-                # Frist time we've seen this node
-                issues[node] = {
-                    'missing_start_dates': None,
-                    'missing_target_dates': None,
-                    'target_passed_without_close': None,
-                    'end_before_predecessor_end': [],
-                    'start_before_predecessor_end': []
-                }
-
-                # Check for missing start dates
-                if not node_data.start_date:
-                    issues[node]['missing_start_dates'] = {
-                        'node': node,
-                        'path': path_info.nodes,
-                        'target_date': node_data.target_date,
-                        'start_date': node_data.start_date,
-                        'closed_date': node_data.closed_date
-                    }
-                
-                # Check for missing complete dates
-                if not node_data.target_date:
-                    issues[node]['missing_target_dates'] = {
-                        'node': node,
-                        'path': path_info.nodes,
-                        'target_date': node_data.target_date,
-                        'start_date': node_data.start_date,
-                        'closed_date': node_data.closed_date
-                    }
-                
-                # Check for completed nodes without close dates
-                if node_data.target_date and node_data.target_date < today and not node_data.closed_date:
-                    issues[node]['target_passed_without_close'] = {
-                        'node': node,
-                        'target_date': node_data.target_date,
-                        'start_date': node_data.start_date,
-                        'closed_date': node_data.closed_date,
-                        'path': path_info.nodes
+    
+    def seeded(path_infos):
+        # Every dated node on a path gets an entry, issues or not, before its path is checked
+        for path_info in path_infos:
+            nodes = path_info.nodes if isinstance(path_info, PathInfo) else path_info
+            for node in nodes:
+                if node not in issues and temporal_data.get(node):
+                    issues[node] = {
+                        'missing_start_dates': None,
+                        'missing_target_dates': None,
+                        'target_passed_without_close': None,
+                        'end_before_predecessor_end': [],
+                        'start_before_predecessor_end': []
                     }
-            # The same can play a role in multiple paths, so process each path
-            # Check predecessor timing issues
-            # On the path including target node
-            if i > 0:  # Skip first node as it has no predecessors
-                pred_node = path_info.nodes[i-1]
-                pred_data = temporal_data.get(pred_node)
-                
-                if pred_data:
-                    # Check if node ends before predecessor
-                    if (node_data.target_date and pred_data.target_date and 
-                        node_data.target_date < pred_data.target_date):
-                        issues[node]['end_before_predecessor_end'].append({
-                            'node': node,
-                            'predecessor': pred_node,
-                            'node_date': node_data.target_date,
-                            'predecessor_date': pred_data.target_date,
-                            'path': path_info.nodes
-                        })
-                    
-                    # Check if node starts before predecessor ends
-                    if (node_data.start_date and pred_data.target_date and 
-                        node_data.start_date < pred_data.target_date):
-                        issues[node]['start_before_predecessor_end'].append({
-                            'node': node,
-                            'predecessor': pred_node,
-                            'start_date': node_data.start_date,
-                            'predecessor_date': pred_data.target_date,
-                            'path': path_info.nodes
-                        })
-    
-    # Log summary of issues found
-    for issue_type, issue_list in issues.items():
-        if issue_list:
-            logger.warning(f"Found {len(issue_list)} {issue_type}")
+            yield nodes
+    
+    # The issues found on one path share its one node list
+    for path_index, path, issue_type, record in iter_path_timing_issues(seeded(path_infos), temporal_data):
+        record['path'] = path
+        if isinstance(issues[record['node']][issue_type], list):
+            issues[record['node']][issue_type].append(record)
+        else:
+            issues[record['node']][issue_type] = record
+    
+    # Log one summary line per issue type rather than one per node
+    issue_counts = {}
+    for node_issues in issues.values():
+        for issue_type, found in node_issues.items():
+            if found:
+                issue_counts[issue_type] = issue_counts.get(issue_type, 0) + (len(found) if isinstance(found, list) else 1)
+    for issue_type, count in issue_counts.items():
+        logger.warning("Found %d %s", count, issue_type)
     
     return issues 
\ No newline at end of file
@@ -0,0 +1,249 @@
+import networkx as nx
+import logging
+import numpy as np
+import pandas as pd
+from array import array
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Dict, List, Tuple, Any, Optional
+
+from .paths import PathInfo
+from .parallel import _encode_graph
+from .aggregates import _node_dates, _NO_DATE_MAX, _NO_DATE_MIN
+from .budget import PathBudget, EnumerationReport, BudgetTracker
+
+logger = logging.getLogger(__name__)
+
+def _timestamp(value: int) -> Optional[datetime]:
+    return None if value in (_NO_DATE_MAX, _NO_DATE_MIN) else pd.Timestamp(value)
+
+class StoredPath(PathInfo):
+    """PathInfo handle into a PathStore.
+
+    Holds only the store and a path index; the node list and dates are read
+    from the store each time they are accessed.
+    """
+    __slots__ = ('_store', '_path_id')
+
+    def __init__(self, store: 'PathStore', path_id: int):
+        self._store = store
+        self._path_id = path_id
+
+    @property
+    def nodes(self) -> List[str]:
+        return self._store.path_nodes(self._path_id)
+
+    @property
+    def target_date(self) -> Optional[datetime]:
+        return _timestamp(self._store.cell_dates[self._store.path_cells[self._path_id], 0])
+
+    @property
+    def start_date(self) -> Optional[datetime]:
+        return _timestamp(self._store.cell_dates[self._store.path_cells[self._path_id], 1])
+
+    @property
+    def closed_date(self) -> Optional[datetime]:
+        return _timestamp(self._store.cell_dates[self._store.path_cells[self._path_id], 2])
+
+class PathStore(Sequence):
+    """Class to hold enumerated paths in a prefix trie of int-encoded nodes.
+
+    Each trie cell is a node code and the index of its parent cell, and a
+    path is the cell where it ends, so paths that share a prefix share its
+    cells. Every cell also holds the (target, start, closed) aggregate of the
+    path from the root to it, computed from its parent's when it is added.
+    When every node pair is enumerated each cell ends a path, so a path costs
+    one cell: four integers and three dates.
+
+    Indexing gives StoredPath handles that materialize node lists on access.
+    A store built under a PathBudget keeps the EnumerationReport of what
+    the budget left out in report.
+    """
+    def __init__(self, node_ids: List[str], cell_parent: np.ndarray, cell_node: np.ndarray,
+                 cell_dates: np.ndarray, path_cells: np.ndarray, report: Optional[EnumerationReport] = None):
+        self.node_ids = node_ids
+        self.cell_parent = cell_parent
+        self.cell_node = cell_node
+        self.cell_dates = cell_dates
+        self.path_cells = path_cells
+        self.report = report
+
+    @classmethod
+    def from_graph(cls, G: nx.DiGraph, temporal_data: Dict[str, Any], maximal: bool = False,
+                   budget: Optional[PathBudget] = None) -> 'PathStore':
+        """Enumerate the paths of a DAG into a store, one depth-first search per source.
+
+        Paths come in the order of find_paths_with_dates: by source, then by
+        target in node order, then in depth-first order. With maximal=True
+        only source-to-sink paths are kept, in depth-first order.
+
+        With a budget, paths past max_paths_per_pair are skipped (the search
+        still goes through them to reach further targets), the search does
+        not go deeper than max_length edges, and it stops once max_paths are
+        kept or time_limit has passed, keeping the paths found so far. The
+        budget is applied by a BudgetTracker fed each source's paths in
+        find_paths_with_dates order, as iter_paths_with_dates does, so both
+        keep the same paths and report the same truncation. To that end the
+        source being searched when max_paths is reached is searched to its
+        end, keeping only enough of each target's paths to decide.
+
+        Args:
+            G (nx.DiGraph): NetworkX directed graph or CsrGraph
+            temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
+            maximal (bool): Only keep maximal (source-to-sink) paths
+            budget (PathBudget, optional): Limits on the search
+
+        Returns:
+            PathStore: The enumerated paths, with an EnumerationReport in report
+        """
+        nodes, indptr, indices = _encode_graph(G)
+        node_dates = _node_dates(G, temporal_data)
+        dates = [node_dates[node] for node in nodes]
+        indptr = indptr.tolist()
+        indices = indices.tolist()
+
+        # Compact growable columns, so building does not hold a Python object per path
+        cell_parent = array('q')
+        cell_node = array('i')
+        cell_target, cell_start, cell_closed = array('q'), array('q'), array('q')
+        path_chunks = []
+        on_path = [False] * len(nodes)
+
+        tracker = BudgetTracker(G, budget)
+        budget = tracker.budget
+
+        def add_cell(parent: int, node: int, aggregate: Tuple[int, int, int]) -> int:
+            cell_parent.append(parent)
+            cell_node.append(node)
+            cell_target.append(aggregate[0])
+            cell_start.append(aggregate[1])
+            cell_closed.append(aggregate[2])
+            return len(cell_node) - 1
+
+        sources = [source for source in range(len(nodes))
+                   if indptr[source] != indptr[source + 1] and not (maximal and G.in_degree(nodes[source]))]
+        tracker.report.sources_total = len(sources)
+        for source in sources:
+            if not tracker.start_source(nodes[source]):
+                break
+            # Path cells found from this source, with their targets, in depth-first order, and
+            # how many paths per target the tracker could still keep
+            found = array('q')
+            found_targets = array('i')
+            found_per_target = {}
+            candidate_limit = budget.max_paths_per_pair
+            if budget.max_paths is not None:
+                remaining = budget.max_paths - tracker.report.paths
+                candidate_limit = remaining if candidate_limit is None else min(candidate_limit, remaining)
+            root = add_cell(-1, source, dates[source])
+            stack = [(iter(indices[indptr[source]:indptr[source + 1]]), root)]
+            on_path[source] = True
+            while stack:
+                if tracker.step():
+                    for _, cell in stack:
+                        on_path[cell_node[cell]] = False
+                    break
+                node = next(stack[-1][0], None)
+                if node is None:
+                    on_path[cell_node[stack.pop()[1]]] = False
+                    continue
+                if on_path[node]:
+                    continue
+                parent = stack[-1][1]
+                target, start, closed = dates[node]
+                cell = add_cell(parent, node, (max(cell_target[parent], target), min(cell_start[parent], start),
+                                               max(cell_closed[parent], closed)))
+                is_sink = indptr[node] == indptr[node + 1]
+                if not maximal or is_sink:
+                    if candidate_limit is not None:
+                        found_per_target[node] = found_per_target.get(node, 0) + 1
+                    # One path past the limit is enough for the tracker to see it was reached
+                    if candidate_limit is None or found_per_target[node] <= candidate_limit + 1:
+                        found.append(cell)
+                        found_targets.append(node)
+                if not is_sink and (budget.max_length is None or len(stack) < budget.max_length):
+                    on_path[node] = True
+                    stack.append((iter(indices[indptr[node]:indptr[node + 1]]), cell))
+            found = np.array(found, dtype=np.int64)
+            found_targets = np.array(found_targets, dtype=np.int32)
+            if not maximal:
+                # Group by target in node order; the sort is stable, keeping depth-first order
+                order = np.argsort(found_targets, kind='stable')
+                found, found_targets = found[order], found_targets[order]
+            if tracker.keeps_every_path:
+                tracker.keep_every(len(found))
+            else:
+                kept = []
+                for cell, node in zip(found.tolist(), found_targets.tolist()):
+                    if tracker.keep(nodes[source], nodes[node]):
+                        kept.append(cell)
+                    elif tracker.report.stopped == 'max_paths':
+                        break
+                found = np.array(kept, dtype=np.int64)
+            path_chunks.append(found)
+            tracker.end_source(nodes[source])
+        report = tracker.finish()
+
+        cell_node = np.frombuffer(cell_node, dtype=np.int32)
+        path_cells = np.concatenate(path_chunks) if path_chunks else np.empty(0, dtype=np.int64)
+
+        # Record degrees for the nodes on kept paths, as find_paths_with_dates does; a stopped
+        # search can have visited cells that no kept path runs through
+        cell_parent_array = np.frombuffer(cell_parent, dtype=np.int64)
+        kept = np.zeros(len(cell_node), dtype=bool)
+        cells = np.unique(path_cells)
+        while len(cells):
+            kept[cells] = True
+            cells = cell_parent_array[cells]
+            cells = np.unique(cells[cells >= 0])
+            cells = cells[~kept[cells]]
+        for code in np.unique(cell_node[kept]).tolist():
+            node = nodes[code]
+            if node in temporal_data:
+                temporal_data[node].in_degree = G.in_degree(node)
+                temporal_data[node].out_degree = G.out_degree(node)
+
+        store = cls(
+            nodes,
+            cell_parent_array,
+            cell_node,
+            np.column_stack([np.frombuffer(column, dtype=np.int64) for column in (cell_target, cell_start, cell_closed)]),
+            path_cells,
+            report
+        )
+        logger.info(f"Stored {len(store)} paths in {len(cell_node)} trie cells, {store.memory_usage()} bytes")
+        return store
+
+    def __len__(self) -> int:
+        return len(self.path_cells)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [StoredPath(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("path index out of range")
+        return StoredPath(self, index)
+
+    def memory_usage(self) -> int:
+        """Bytes used by the trie and path arrays."""
+        return self.cell_parent.nbytes + self.cell_node.nbytes + self.cell_dates.nbytes + self.path_cells.nbytes
+
+    def path_codes(self, path_id: int) -> List[int]:
+        """Node codes of a path, from its first node to its last."""
+        codes = []
+        cell = int(self.path_cells[path_id])
+        while cell >= 0:
+            codes.append(int(self.cell_node[cell]))
+            cell = int(self.cell_parent[cell])
+        codes.reverse()
+        return codes
+
+    def path_nodes(self, path_id: int) -> List[str]:
+        """Node IDs of a path, as a new list."""
+        return [self.node_ids[code] for code in self.path_codes(path_id)]
+
+    def target_dates(self) -> np.ndarray:
+        """Latest target date of every path as datetime64, NaT where no node has one."""
+        return self.cell_dates[self.path_cells, 0].view('datetime64[ns]')
@@ -0,0 +1,69 @@
+import networkx as nx
+import logging
+import numpy as np
+from typing import List
+
+from .csr import topological_order
+
+logger = logging.getLogger(__name__)
+
+class ReachabilityIndex:
+    """Class to answer "is there a path from A to B" in O(1) for a DAG.
+
+    Stores the transitive closure as one bitset row per node, with bit j of
+    row i set when node j is reachable from node i. Rows and bits both follow
+    the node order of the graph, so a row unpacks to a mask over G.nodes().
+    The index takes V^2 / 8 bytes, about 12 MB for 10,000 nodes.
+    """
+    def __init__(self, G: nx.DiGraph):
+        """Build the closure with one pass over G in reverse topological order.
+
+        Args:
+            G (nx.DiGraph): NetworkX directed graph or CsrGraph
+
+        Raises:
+            nx.NetworkXUnfeasible: If the graph contains a cycle
+        """
+        self.node_ids: List[str] = list(G.nodes())
+        self.index = {node: i for i, node in enumerate(self.node_ids)}
+        self._rows = np.zeros((len(self.node_ids), (len(self.node_ids) + 63) // 64), dtype=np.uint64)
+        for node in reversed(topological_order(G)):
+            succs = np.array([self.index[succ] for succ in G.successors(node)], dtype=np.int64)
+            if len(succs):
+                # Everything a successor reaches, plus the successors themselves
+                row = np.bitwise_or.reduce(self._rows[succs], axis=0)
+                np.bitwise_or.at(row, succs >> 6, np.left_shift(np.uint64(1), (succs & 63).astype(np.uint64)))
+                self._rows[self.index[node]] = row
+        logger.info(f"Built reachability index of {len(self.node_ids)} nodes in {self.memory_usage()} bytes")
+
+    def memory_usage(self) -> int:
+        """Bytes used by the bitsets."""
+        return self._rows.nbytes
+
+    def reaches(self, source: str, target: str) -> bool:
+        """Whether target can be reached from source, i.e. whether source blocks target.
+
+        Raises:
+            KeyError: If either node is not in the graph
+        """
+        j = self.index[target]
+        return bool((int(self._rows[self.index[source], j >> 6]) >> (j & 63)) & 1)
+
+    def descendant_mask(self, node: str) -> np.ndarray:
+        """Boolean mask over the graph's nodes, in order, of the nodes reachable from node."""
+        # Little-endian bytes of each word hold its bits in order
+        bits = np.unpackbits(self._rows[self.index[node]].astype('<u8').view(np.uint8), bitorder='little')
+        return bits[:len(self.node_ids)].astype(bool)
+
+    def ancestor_mask(self, node: str) -> np.ndarray:
+        """Boolean mask over the graph's nodes, in order, of the nodes that reach node."""
+        j = self.index[node]
+        return ((self._rows[:, j >> 6] >> np.uint64(j & 63)) & np.uint64(1)).astype(bool)
+
+    def descendants(self, node: str) -> List[str]:
+        """Nodes reachable from node, in graph node order."""
+        return [self.node_ids[i] for i in np.flatnonzero(self.descendant_mask(node)).tolist()]
+
+    def ancestors(self, node: str) -> List[str]:
+        """Nodes from which node can be reached, in graph node order."""
+        return [self.node_ids[i] for i in np.flatnonzero(self.ancestor_mask(node)).tolist()]
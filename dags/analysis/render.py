@@ -0,0 +1,203 @@
+import networkx as nx
+import hashlib
+import json
+import logging
+import os
+import shlex
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Set, Tuple, Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+# Graph, node and edge attributes shared by every render, as plot_dag has always used them
+GRAPH_ATTRS = {'rankdir': 'TB', 'size': '60, 6', 'ratio': 'fill', 'concentrate': 'true'}
+NODE_ATTRS = {'shape': 'box', 'style': 'filled', 'fillcolor': 'lightblue'}
+EDGE_ATTRS = {'arrowhead': 'vee'}
+HIGHLIGHT_NODE_ATTRS = {'fillcolor': 'lightgreen'}
+HIGHLIGHT_EDGE_ATTRS = {'color': 'red'}
+
+# Layouts computed in this process, keyed by layout_key
+_layouts = {}
+
+@dataclass
+class RenderJob:
+    """Class to describe one image to render from a graph."""
+    output_path: Path
+    format: Optional[str] = None
+    highlight_nodes: Optional[Set[str]] = None
+    highlight_edges: Optional[Set[Tuple[str, str]]] = None
+    graph: Optional[nx.DiGraph] = None
+
+def _quote(value) -> str:
+    """Quote a value as a DOT ID."""
+    return '"' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+def _attr_list(attrs: Dict[str, str]) -> str:
+    return ', '.join(f"{key}={_quote(value)}" for key, value in attrs.items())
+
+def write_dot(G: nx.DiGraph, out: TextIO, highlight_nodes: Optional[Set[str]] = None,
+              highlight_edges: Optional[Set[Tuple[str, str]]] = None,
+              positions: Optional[Dict[str, Tuple[float, float]]] = None, dpi: Optional[int] = 1200) -> None:
+    """Stream the DOT text for G to a file or pipe.
+
+    Styles that every node or edge shares are written once as defaults, so
+    each element is a single short line and no intermediate objects are built.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph
+        out (TextIO): Text stream to write to
+        highlight_nodes (Set[str], optional): Nodes to highlight
+        highlight_edges (Set[Tuple[str, str]], optional): Edges to highlight
+        positions (Dict[str, Tuple[float, float]], optional): Fixed node positions in points, from compute_layout
+        dpi (int, optional): Output resolution for bitmap formats
+    """
+    highlight_nodes = highlight_nodes or set()
+    highlight_edges = highlight_edges or set()
+    graph_attrs = dict(GRAPH_ATTRS, dpi=str(dpi)) if dpi else GRAPH_ATTRS
+
+    out.write('digraph G {\n')
+    out.write(f"graph [{_attr_list(graph_attrs)}];\n")
+    out.write(f"node [{_attr_list(NODE_ATTRS)}];\n")
+    out.write(f"edge [{_attr_list(EDGE_ATTRS)}];\n")
+    highlighted = _attr_list(HIGHLIGHT_NODE_ATTRS)
+    for node in G.nodes():
+        attrs = [highlighted] if node in highlight_nodes else []
+        if positions and node in positions:
+            x, y = positions[node]
+            attrs.append(f'pos="{x:.2f},{y:.2f}!"')
+        out.write(f"{_quote(node)} [{', '.join(attrs)}];\n" if attrs else f"{_quote(node)};\n")
+    highlighted = f" [{_attr_list(HIGHLIGHT_EDGE_ATTRS)}]"
+    for source, target in G.edges():
+        out.write(f"{_quote(source)} -> {_quote(target)}{highlighted if (source, target) in highlight_edges else ''};\n")
+    out.write('}\n')
+
+def _start_graphviz(output_format: str, output_path: Optional[Path] = None, fixed_positions: bool = False,
+                    stderr: Optional[TextIO] = None) -> subprocess.Popen:
+    """Start a Graphviz process that reads DOT on stdin.
+
+    With fixed_positions, neato -n2 draws the nodes where the DOT text puts
+    them instead of laying the graph out again; edges are then drawn
+    straight rather than routed as dot splines.
+    """
+    command = ['neato', '-n2'] if fixed_positions else ['dot']
+    command.append(f'-T{output_format}')
+    if output_path is not None:
+        command.append(f'-o{output_path}')
+    return subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=stderr, text=True)
+
+def _finish(G: nx.DiGraph, output_format: str, output_path: Optional[Path] = None, fixed_positions: bool = False,
+            **dot_args) -> str:
+    """Stream G into a new Graphviz process and wait for it.
+
+    stdout is read on its own thread while the DOT text is written, and
+    stderr goes to a temporary file, so neither pipe can fill up and stall
+    Graphviz however much output or how many warnings it writes.
+
+    Returns:
+        str: What the process wrote to stdout
+
+    Raises:
+        RuntimeError: If Graphviz exits with an error
+    """
+    with tempfile.TemporaryFile('w+') as stderr:
+        process = _start_graphviz(output_format, output_path, fixed_positions, stderr=stderr)
+        with ThreadPoolExecutor(max_workers=1) as reader:
+            output = reader.submit(process.stdout.read)
+            try:
+                write_dot(G, process.stdin, **dot_args)
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+            output = output.result()
+        if process.wait() != 0:
+            stderr.seek(0)
+            raise RuntimeError(f"{process.args[0]} failed with exit code {process.returncode}: {stderr.read().strip()}")
+    return output
+
+def layout_key(G: nx.DiGraph) -> str:
+    """Key identifying the layout of G: its nodes and edges in order, and the graph attributes."""
+    digest = hashlib.sha256(json.dumps(GRAPH_ATTRS, sort_keys=True).encode())
+    for node in G.nodes():
+        digest.update(f"n{node}\0".encode())
+    for source, target in G.edges():
+        digest.update(f"e{source}\0{target}\0".encode())
+    return digest.hexdigest()
+
+def parse_plain_layout(plain: str) -> Dict[str, Tuple[float, float]]:
+    """Read node positions, in points, from Graphviz -Tplain output."""
+    positions = {}
+    for line in plain.splitlines():
+        if line.startswith('node '):
+            fields = shlex.split(line)
+            # Plain coordinates are in inches
+            positions[fields[1]] = (float(fields[2]) * 72, float(fields[3]) * 72)
+    return positions
+
+def compute_layout(G: nx.DiGraph, cache_dir: Optional[Path] = None) -> Dict[str, Tuple[float, float]]:
+    """Lay G out once with dot and return its node positions.
+
+    Layouts are kept per process and, with cache_dir, as JSON files, keyed by
+    layout_key, so renders of the same graph with different highlighting
+    reuse one layout.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph
+        cache_dir (Path, optional): Directory for layout files
+
+    Returns:
+        Dict[str, Tuple[float, float]]: Node positions in points
+    """
+    key = layout_key(G)
+    if key in _layouts:
+        return _layouts[key]
+    layout_file = Path(cache_dir) / f'layout-{key[:16]}.json' if cache_dir else None
+    if layout_file is not None and layout_file.exists():
+        logger.info(f"Loaded layout from {layout_file}")
+        _layouts[key] = {node: tuple(pos) for node, pos in json.loads(layout_file.read_text()).items()}
+        return _layouts[key]
+
+    logger.info(f"Computing layout of {G.number_of_nodes()} nodes")
+    positions = parse_plain_layout(_finish(G, 'plain', dpi=None))
+    _layouts[key] = positions
+    if layout_file is not None:
+        layout_file.parent.mkdir(parents=True, exist_ok=True)
+        layout_file.write_text(json.dumps(positions))
+    return positions
+
+def render_graphs(G: nx.DiGraph, jobs: List[RenderJob], positions: Optional[Dict[str, Tuple[float, float]]] = None,
+                  dpi: int = 1200, max_workers: Optional[int] = None) -> List[Path]:
+    """Render several images of G with concurrent Graphviz processes.
+
+    Each job's DOT text is streamed straight into its own process. Without
+    positions every job is laid out by dot, whose layout does not depend on
+    highlighting, so plain and highlighted images of one graph line up. With
+    positions (from compute_layout) the processes only draw, with straight
+    edges, which skips the layout work for graphs too large to lay out twice.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph
+        jobs (List[RenderJob]): Images to render; the format defaults to the output file suffix,
+            and a job's own graph, if set, is drawn instead of G
+        positions (Dict[str, Tuple[float, float]], optional): Fixed node positions in points
+        dpi (int): Output resolution for bitmap formats
+        max_workers (int, optional): Maximum concurrent processes, defaults to the CPU count
+
+    Returns:
+        List[Path]: Output paths, in job order
+
+    Raises:
+        RuntimeError: If Graphviz fails on any job
+    """
+    def render(job: RenderJob) -> Path:
+        output_format = job.format or Path(job.output_path).suffix.lstrip('.') or 'png'
+        logger.info(f"Rendering {output_format} to {job.output_path}")
+        _finish(G if job.graph is None else job.graph, output_format, job.output_path, fixed_positions=positions is not None,
+                highlight_nodes=job.highlight_nodes, highlight_edges=job.highlight_edges, positions=positions, dpi=dpi)
+        return Path(job.output_path)
+
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count() or 1) as executor:
+        return list(executor.map(render, jobs))
@@ -0,0 +1,226 @@
+import networkx as nx
+import csv
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional
+
+from .paths import PathInfo, iter_path_timing_issues
+from .timing import iter_timing_issues
+from ..utils.data import TemporalStore
+from ..utils.formats import pa, pq, _require_pyarrow
+
+logger = logging.getLogger(__name__)
+
+REPORT_FORMATS = ('jsonl', 'csv', 'parquet', 'arrow')
+
+# Formats written through pyarrow, in record batches of BATCH_ROWS rows
+ARROW_REPORT_FORMATS = ('parquet', 'arrow')
+BATCH_ROWS = 10000
+
+# Columns of the issue and path tables; empty fields are left out of JSON Lines rows
+ISSUE_FIELDS = ['issue_id', 'issue_type', 'node', 'predecessor', 'opportunity', 'partition', 'start_date',
+                'target_date', 'closed_date', 'node_date', 'predecessor_date', 'path_ids']
+PATH_FIELDS = ['path_id', 'length', 'nodes']
+
+# Separator for list fields in CSV
+CSV_LIST_SEPARATOR = ';'
+
+def _report_value(value):
+    """Dates as ISO 8601 text, everything else unchanged."""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+def _arrow_schemas() -> Dict[str, Any]:
+    """Arrow schemas of the issue and path tables."""
+    dates = [(field, pa.timestamp('ns')) for field in ('start_date', 'target_date', 'closed_date', 'node_date', 'predecessor_date')]
+    return {
+        'issues': pa.schema([('issue_id', pa.int64()), ('issue_type', pa.string()), ('node', pa.string()),
+                             ('predecessor', pa.string()), ('opportunity', pa.string()), ('partition', pa.string())] + dates +
+                            [('path_ids', pa.list_(pa.int64()))]),
+        'paths': pa.schema([('path_id', pa.int64()), ('length', pa.int64()), ('nodes', pa.list_(pa.string()))])
+    }
+
+class IssueReportWriter:
+    """Class to stream timing issues and the paths they refer to into two tables.
+
+    Issues go to <stem>.<format> and paths to <stem>_paths.<format>. Each row is
+    written when it is added (Parquet and Arrow rows once a record batch
+    fills), and an issue refers to its paths by path_id, so nothing is kept
+    in memory but the open files, at most one batch and the running counts.
+    """
+    def __init__(self, output_dir: Path, output_format: str = 'jsonl', stem: str = 'timing_issues'):
+        if output_format not in REPORT_FORMATS:
+            raise ValueError(f"Unknown report format {output_format}, expected one of {REPORT_FORMATS}")
+        self.format = output_format
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        self.issues_path = output_dir / f'{stem}.{output_format}'
+        self.paths_path = output_dir / f'{stem}_paths.{output_format}'
+        self.counts: Dict[str, int] = {}
+        self.num_paths = 0
+        self._csv_writers = {}
+        if output_format in ARROW_REPORT_FORMATS:
+            _require_pyarrow()
+            self._schemas = _arrow_schemas()
+            self._batches = {'issues': [], 'paths': []}
+            self._files = {
+                table: pq.ParquetWriter(path, self._schemas[table]) if output_format == 'parquet'
+                else pa.ipc.new_file(str(path), self._schemas[table])
+                for table, path in (('issues', self.issues_path), ('paths', self.paths_path))
+            }
+            return
+        self._files = {'issues': open(self.issues_path, 'w', newline=''), 'paths': open(self.paths_path, 'w', newline='')}
+        if output_format == 'csv':
+            for table, fields in (('issues', ISSUE_FIELDS), ('paths', PATH_FIELDS)):
+                self._csv_writers[table] = csv.DictWriter(self._files[table], fields)
+                self._csv_writers[table].writeheader()
+
+    def __enter__(self) -> 'IssueReportWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for table, out in self._files.items():
+            if self.format in ARROW_REPORT_FORMATS:
+                self._flush(table)
+            out.close()
+        logger.info(f"Wrote {sum(self.counts.values())} issues to {self.issues_path} and {self.num_paths} paths to {self.paths_path}")
+
+    def _flush(self, table: str) -> None:
+        if self._batches[table]:
+            self._files[table].write_batch(pa.RecordBatch.from_pylist(self._batches[table], schema=self._schemas[table]))
+            self._batches[table] = []
+
+    def _write(self, table: str, row: Dict[str, Any]) -> None:
+        if self.format in ARROW_REPORT_FORMATS:
+            self._batches[table].append(row)
+            if len(self._batches[table]) >= BATCH_ROWS:
+                self._flush(table)
+            return
+        row = {key: _report_value(value) for key, value in row.items()}
+        if self.format == 'csv':
+            self._csv_writers[table].writerow({
+                key: CSV_LIST_SEPARATOR.join(map(str, value)) if isinstance(value, list) else value
+                for key, value in row.items()
+            })
+        else:
+            self._files[table].write(json.dumps({key: value for key, value in row.items() if value is not None}) + '\n')
+
+    def write_path(self, nodes: List[str]) -> int:
+        """Add a path to the path table.
+
+        Returns:
+            int: The path_id to refer to it by
+        """
+        path_id = self.num_paths
+        self.num_paths += 1
+        self._write('paths', {'path_id': path_id, 'length': len(nodes), 'nodes': list(nodes)})
+        return path_id
+
+    def write_issue(self, issue_type: str, record: Dict[str, Any], path_ids: Iterable[int] = (),
+                    opportunity: Optional[str] = None, partition: Optional[str] = None) -> int:
+        """Add an issue to the issue table.
+
+        Args:
+            issue_type (str): Issue type, as in analyze_timing results
+            record (Dict[str, Any]): Issue record; a 'paths' or 'path' entry is ignored
+            path_ids (Iterable[int]): Paths, from write_path, that expose the issue
+            opportunity (str, optional): Opportunity of the issue's node
+            partition (str, optional): Key of the partition the issue was found in
+
+        Returns:
+            int: The issue_id
+        """
+        issue_id = sum(self.counts.values())
+        self.counts[issue_type] = self.counts.get(issue_type, 0) + 1
+        row = {'issue_id': issue_id, 'issue_type': issue_type, 'opportunity': opportunity, 'partition': partition,
+               'path_ids': list(path_ids)}
+        self._write('issues', {key: row[key] if key in row else record.get(key) for key in ISSUE_FIELDS})
+        return issue_id
+
+def write_timing_report(G: nx.DiGraph, temporal_data: Dict[str, Any], output_dir: Path, output_format: str = 'jsonl',
+                        max_witness_paths: int = 1, today: Optional[datetime] = None) -> Dict[str, int]:
+    """Stream the issues analyze_timing finds to an issue table and a path table.
+
+    Each issue's witness paths go to the path table; the issues of one node
+    share a path row when they come from the same node or edge.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph
+        temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
+        output_dir (Path): Directory for the two tables
+        output_format (str): One of REPORT_FORMATS
+        max_witness_paths (int): Maximum number of example paths per issue
+        today (datetime, optional): Reference date for overdue checks, defaults to now
+
+    Returns:
+        Dict[str, int]: Number of issues written of each type
+    """
+    store = TemporalStore.from_temporal_data(temporal_data)
+    with IssueReportWriter(output_dir, output_format) as writer:
+        for node, node_issues in iter_timing_issues(G, temporal_data, max_witness_paths, today):
+            _write_node_issues(writer, node, node_issues, store[node].opportunity)
+    return writer.counts
+
+def write_partition_report(results: Iterable[Any], temporal_data: Dict[str, Any], output_dir: Path,
+                           output_format: str = 'jsonl') -> Dict[str, int]:
+    """Merge the timing issues of partitioned analyses into one issue table and one path table.
+
+    Every issue row carries the key of the partition it was found in.
+
+    Args:
+        results (Iterable[PartitionResult]): Results of analyze_partitions
+        temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
+        output_dir (Path): Directory for the two tables
+        output_format (str): One of REPORT_FORMATS
+
+    Returns:
+        Dict[str, int]: Number of issues written of each type
+    """
+    store = TemporalStore.from_temporal_data(temporal_data)
+    with IssueReportWriter(output_dir, output_format, stem='partition_timing_issues') as writer:
+        for result in results:
+            for node, node_issues in result.timing_issues.items():
+                _write_node_issues(writer, node, node_issues, store[node].opportunity, result.key)
+    return writer.counts
+
+def _write_node_issues(writer: IssueReportWriter, node: str, node_issues: Dict[str, Any],
+                       opportunity: Optional[str], partition: Optional[str] = None) -> None:
+    """Write one node's issues, as analyze_timing reports them, with their witness paths."""
+    # Witness paths depend only on the node or edge, so they are written once per node
+    path_ids = {}
+    for issue_type, found in node_issues.items():
+        for record in found if isinstance(found, list) else [found] if found else []:
+            key = record.get('predecessor', node)
+            if key not in path_ids:
+                path_ids[key] = [writer.write_path(path) for path in record['paths']]
+            writer.write_issue(issue_type, record, path_ids[key], opportunity, partition)
+
+def write_path_timing_report(path_infos: Iterable[PathInfo], temporal_data: Dict[str, Any], output_dir: Path,
+                             output_format: str = 'jsonl', today: Optional[datetime] = None) -> Dict[str, int]:
+    """Stream the issues analyze_path_timing finds to an issue table and a path table.
+
+    Paths are read one at a time, e.g. from iter_paths_with_dates, and a path
+    is written to the path table only if it exposes an issue.
+
+    Args:
+        path_infos (Iterable[PathInfo]): Paths to analyze, as PathInfo objects or node lists
+        temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
+        output_dir (Path): Directory for the two tables
+        output_format (str): One of REPORT_FORMATS
+        today (datetime, optional): Reference date for overdue checks, defaults to now
+
+    Returns:
+        Dict[str, int]: Number of issues written of each type
+    """
+    with IssueReportWriter(output_dir, output_format, stem='path_timing_issues') as writer:
+        last_index = path_id = None
+        for path_index, path_info, issue_type, record in iter_path_timing_issues(path_infos, temporal_data, today):
+            if path_index != last_index:
+                last_index = path_index
+                path_id = writer.write_path(path_info.nodes if isinstance(path_info, PathInfo) else path_info)
+            writer.write_issue(issue_type, record, [path_id], temporal_data[record['node']].opportunity)
+    return writer.counts
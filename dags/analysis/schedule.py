@@ -0,0 +1,132 @@
+import networkx as nx
+import logging
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+from .aggregates import _node_dates, _NO_DATE_MAX, _NO_DATE_MIN
+from .csr import topological_order
+from ..utils.instrument import instrumented
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class Schedule:
+    """Class to store the result of a critical path analysis.
+
+    table has one row per node, in topological order, with the columns
+    start_date, target_date, earliest_start, earliest_finish, latest_start,
+    latest_finish, slack, delay, critical and driver (the predecessor that
+    finishes last, if it finishes no earlier than the node's own start and so
+    sets its earliest start; None otherwise).
+    """
+    table: pd.DataFrame
+    critical_path: List[str]
+    finish_date: Optional[datetime]
+
+def _timestamps(values: List[int]) -> np.ndarray:
+    """int64 nanoseconds to datetime64, with either sentinel as NaT."""
+    values = np.array(values, dtype=np.int64)
+    return np.where(values == _NO_DATE_MIN, _NO_DATE_MAX, values).view('datetime64[ns]')
+
+@instrumented(items=lambda schedule: {'nodes': len(schedule.table), 'critical_path': len(schedule.critical_path)})
+def compute_schedule(G: nx.DiGraph, temporal_data: Dict[str, Any], order: Optional[List[str]] = None) -> Schedule:
+    """Compute earliest and latest dates, slack and the critical path in one pass each way.
+
+    A work item lasts from its start date to its target date (no time if
+    either is missing). The forward pass moves each item no earlier than its
+    own start and no earlier than the earliest finish of every predecessor;
+    the backward pass moves it no later than the latest start of every
+    successor, with the overall finish date as the deadline of the sinks.
+    Slack is how far an item can slip without moving the finish date, and
+    delay how far its predecessors push its finish past its target date.
+    The critical path follows the driving predecessors back from the latest
+    finish, giving in O(V + E) the chain that find_sorted_paths approximates
+    by enumerating every path; its items with no slack are the ones that
+    actually hold the finish date.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph or CsrGraph
+        temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
+        order (List[str], optional): Topological order of G, e.g. analyze_network's 'topological_sort'
+
+    Returns:
+        Schedule: Per-node table, critical path and finish date
+
+    Raises:
+        nx.NetworkXUnfeasible: If the graph contains a cycle
+    """
+    logger.info("Computing schedule and critical path")
+    order = list(order) if order is not None else topological_order(G)
+    index = {node: i for i, node in enumerate(order)}
+    dates = _node_dates(G, temporal_data, order)
+    target = np.array([dates[node][0] for node in order], dtype=np.int64)
+    start = np.array([dates[node][1] for node in order], dtype=np.int64)
+    known_start = start != _NO_DATE_MIN
+    known_target = target != _NO_DATE_MAX
+    duration = np.where(known_start & known_target, target - np.where(known_start, start, 0), 0).tolist()
+    start = np.where(known_start, start, _NO_DATE_MAX).tolist()
+    target = target.tolist()
+
+    # Forward pass; _NO_DATE_MAX (the smallest int64) marks an unknown date
+    earliest_start = [_NO_DATE_MAX] * len(order)
+    earliest_finish = [_NO_DATE_MAX] * len(order)
+    driver = [-1] * len(order)
+    for i, node in enumerate(order):
+        pred_finish = _NO_DATE_MAX
+        last_pred = -1
+        for pred in G.predecessors(node):
+            p = index[pred]
+            if earliest_finish[p] > pred_finish:
+                pred_finish = earliest_finish[p]
+                last_pred = p
+        # Predecessors that finish before the node's own start, or at no known date, drive nothing
+        if pred_finish != _NO_DATE_MAX and pred_finish >= start[i]:
+            driver[i] = last_pred
+        begin = max(start[i], pred_finish)
+        earliest_start[i] = begin
+        earliest_finish[i] = max(begin + duration[i] if begin != _NO_DATE_MAX else _NO_DATE_MAX, target[i])
+
+    # Backward pass from the overall finish date
+    finish = max(earliest_finish, default=_NO_DATE_MAX)
+    latest_start = [_NO_DATE_MIN] * len(order)
+    latest_finish = [_NO_DATE_MIN] * len(order)
+    if finish != _NO_DATE_MAX:
+        for i in range(len(order) - 1, -1, -1):
+            end = finish
+            for succ in G.successors(order[i]):
+                end = min(end, latest_start[index[succ]])
+            latest_finish[i] = end
+            latest_start[i] = end - duration[i]
+
+    # Follow driving predecessors back from the last node to finish, stopping at a node nothing drives
+    critical_path = []
+    if finish != _NO_DATE_MAX:
+        i = len(order) - 1 - earliest_finish[::-1].index(finish)
+        while i >= 0:
+            critical_path.append(order[i])
+            i = driver[i]
+        critical_path.reverse()
+
+    earliest_finish_dates = _timestamps(earliest_finish)
+    target_dates = _timestamps(target)
+    # NaT propagates through the arithmetic and never compares equal
+    slack = _timestamps(latest_finish) - earliest_finish_dates
+    table = pd.DataFrame({
+        'start_date': _timestamps(start),
+        'target_date': target_dates,
+        'earliest_start': _timestamps(earliest_start),
+        'earliest_finish': earliest_finish_dates,
+        'latest_start': _timestamps(latest_start),
+        'latest_finish': _timestamps(latest_finish),
+        'slack': slack,
+        'delay': np.maximum(earliest_finish_dates - target_dates, np.timedelta64(0, 'ns')),
+        'critical': slack == np.timedelta64(0, 'ns'),
+        'driver': [order[p] if p >= 0 else None for p in driver]
+    }, index=pd.Index(order, name='node'))
+
+    finish_date = None if finish == _NO_DATE_MAX else pd.Timestamp(finish)
+    logger.info(f"Critical path of {len(critical_path)} nodes finishes {finish_date}; {int(table['critical'].sum())} critical nodes")
+    return Schedule(table=table, critical_path=critical_path, finish_date=finish_date)
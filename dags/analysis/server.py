@@ -0,0 +1,427 @@
+import networkx as nx
+import asyncio
+import functools
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Tuple, Optional
+from urllib.parse import urlsplit, parse_qsl
+
+from ..utils.cache import read_dag_cached, file_fingerprint
+from ..utils.data import TemporalStore
+from ..utils.instrument import instrumented
+from .focus import neighborhood_subgraph, _file_stem
+from .aggregates import count_paths
+from .paths import PathInfo, find_top_paths
+from .reachability import ReachabilityIndex
+from .render import RenderJob, render_graphs
+from .timing import analyze_timing
+
+logger = logging.getLogger(__name__)
+
+# Queries by name: (method, whether it runs in the worker pool, parameter types)
+QUERIES = {
+    'ping': ('_ping', False, {}),
+    'stats': ('_stats', False, {}),
+    'top_paths': ('_top_paths', False, {'k': int}),
+    'ancestors': ('_ancestors', False, {'node': str}),
+    'descendants': ('_descendants', False, {'node': str}),
+    'timing_issues': ('_timing_issues', True, {'node': str}),
+    'render': ('_render', True, {'node': str, 'hops': int, 'format': str}),
+    'reload': (None, False, {})
+}
+
+# HTTP reason phrases of the statuses the server answers with
+HTTP_STATUSES = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 500: 'Internal Server Error'}
+
+@dataclass
+class GraphSnapshot:
+    """Class to hold one load of the data file and everything computed from it.
+
+    A snapshot is never changed after it is built, apart from its render
+    cache, so queries can keep reading one while a reload builds the next.
+    Nothing in it enumerates every path: the top paths come from a
+    best-first search and the path count from counting, so a load costs
+    O(V + E) plus the top paths.
+    """
+    data_file: Path
+    fingerprint: Dict[str, Any]
+    G: nx.DiGraph
+    temporal_data: TemporalStore
+    reachability: ReachabilityIndex
+    path_count: int
+    top_paths: List[PathInfo]
+    timing_issues: Dict[str, Dict[str, Any]]
+    loaded_at: datetime
+    seconds: float
+    renders: Dict[Tuple[str, int, str], Dict[str, Any]] = field(default_factory=dict)
+    render_locks: Dict[Tuple[str, int, str], threading.Lock] = field(default_factory=dict)
+
+@instrumented(items=lambda snapshot: {'nodes': snapshot.G.number_of_nodes(), 'top_paths': len(snapshot.top_paths)})
+def load_snapshot(data_file: Path, cache_dir: Optional[Path] = None, max_top_paths: int = 1000,
+                  max_witness_paths: int = 1) -> GraphSnapshot:
+    """Read the data file through the cache and compute the indexes queries are answered from.
+
+    Args:
+        data_file (Path): Path to the CSV, Parquet or Arrow data file
+        cache_dir (Path, optional): Cache directory, defaults to get_cache_dir()
+        max_top_paths (int): Number of paths by target date kept for top_paths queries
+        max_witness_paths (int): Maximum number of example paths kept per timing issue
+
+    Returns:
+        GraphSnapshot: The loaded snapshot
+    """
+    started = time.perf_counter()
+    # Fingerprint before reading so a file changing mid-read is reloaded again
+    fingerprint = file_fingerprint(data_file, content_hash=False)
+    G, temporal_data = read_dag_cached(data_file, cache_dir)
+    reachability = ReachabilityIndex(G)
+    snapshot = GraphSnapshot(
+        data_file=Path(data_file),
+        fingerprint=fingerprint,
+        G=G,
+        temporal_data=temporal_data,
+        reachability=reachability,
+        path_count=count_paths(G),
+        top_paths=find_top_paths(G, temporal_data, max_top_paths),
+        timing_issues=analyze_timing(G, temporal_data, max_witness_paths),
+        loaded_at=datetime.now(),
+        seconds=time.perf_counter() - started
+    )
+    logger.info(f"Loaded snapshot of {data_file} with {G.number_of_nodes()} nodes and {snapshot.path_count} paths "
+                f"in {snapshot.seconds:.2f}s")
+    return snapshot
+
+def _json_default(value):
+    """Dates as ISO 8601 text and NumPy scalars as Python numbers."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+def _path_json(path_info: PathInfo) -> Dict[str, Any]:
+    return {'nodes': list(path_info.nodes), 'target_date': path_info.target_date,
+            'start_date': path_info.start_date, 'closed_date': path_info.closed_date}
+
+class DagService:
+    """Class to answer queries about a DAG kept loaded in memory, reloading it when its data file changes.
+
+    Cheap queries (top paths, ancestors, descendants) are answered on the
+    event loop straight from the current snapshot's indexes. Queries that
+    compute witness paths or run Graphviz go to a thread pool, where they
+    share the snapshot instead of copying it to another process. A watcher
+    polls the data file and, once a change has settled, loads a new snapshot
+    in the pool and swaps it in; queries in flight finish on the old one.
+
+    Attributes:
+        snapshot (GraphSnapshot): Snapshot queries are answered from
+        reloads (int): Number of snapshots loaded after the first
+        queries (Dict[str, int]): Number of queries answered of each kind
+    """
+    def __init__(self, data_file: Path, cache_dir: Optional[Path] = None, max_top_paths: int = 1000, max_witness_paths: int = 1, render_dir: Optional[Path] = None,
+                 dpi: int = 1200, workers: Optional[int] = None, poll_interval: float = 2.0):
+        """Set up the service; the data file is read by start.
+
+        Args:
+            data_file (Path): Path to the CSV, Parquet or Arrow data file
+            cache_dir (Path, optional): Cache directory, defaults to get_cache_dir()
+            max_top_paths (int): Largest k a top_paths query can ask for
+            max_witness_paths (int): Maximum number of example paths kept per timing issue
+            render_dir (Path, optional): Directory for render queries, which fail if not set
+            dpi (int): Output resolution for bitmap formats
+            workers (int, optional): Threads for heavy queries and reloads, defaults to the CPU count
+            poll_interval (float): Seconds between checks of the data file, 0 to never reload
+        """
+        self.data_file = Path(data_file)
+        self.cache_dir = cache_dir
+        self.max_top_paths = max_top_paths
+        self.max_witness_paths = max_witness_paths
+        self.render_dir = Path(render_dir) if render_dir is not None else None
+        self.dpi = dpi
+        self.poll_interval = poll_interval
+        self.snapshot: Optional[GraphSnapshot] = None
+        self.reloads = 0
+        self.queries: Dict[str, int] = {}
+        self._executor = ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+        self._reload_lock = asyncio.Lock()
+        self._watcher: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Load the first snapshot and start watching the data file."""
+        self.snapshot = await self._load()
+        if self.poll_interval:
+            self._watcher = asyncio.create_task(self._watch())
+
+    async def close(self) -> None:
+        """Stop watching the data file and shut the worker pool down."""
+        if self._watcher is not None:
+            self._watcher.cancel()
+            try:
+                await self._watcher
+            except asyncio.CancelledError:
+                pass
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _load(self) -> GraphSnapshot:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, load_snapshot, self.data_file, self.cache_dir, self.max_top_paths, self.max_witness_paths
+        )
+
+    async def reload(self) -> bool:
+        """Load a new snapshot of the data file and swap it in.
+
+        Returns:
+            bool: Whether the reload succeeded; on failure the old snapshot is kept
+        """
+        async with self._reload_lock:
+            try:
+                snapshot = await self._load()
+            except Exception as e:
+                logger.error(f"Failed to reload {self.data_file}, keeping the snapshot from {self.snapshot.loaded_at}: {e}")
+                return False
+            self.snapshot = snapshot
+            self.reloads += 1
+            return True
+
+    async def _watch(self) -> None:
+        """Reload the data file once it has changed and then stayed the same for one poll interval."""
+        pending = failed = None
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                current = file_fingerprint(self.data_file, content_hash=False)
+            except OSError as e:
+                logger.warning(f"Cannot check {self.data_file} for changes: {e}")
+                continue
+            if current in (self.snapshot.fingerprint, failed):
+                pending = None
+            elif current != pending:
+                # Still being written, or just changed; wait for it to settle
+                pending = current
+            else:
+                logger.info(f"{self.data_file} changed, reloading")
+                # A file that fails to load is only retried once it changes again
+                failed = None if await self.reload() else current
+                pending = None
+
+    async def handle(self, request: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        """Answer one query.
+
+        Args:
+            request (Dict[str, Any]): The query name under 'op' and its parameters;
+                an 'id' entry is echoed back in the response
+
+        Returns:
+            tuple: (status, response)
+                status: HTTP status, 200, 400 for a bad query, 404 for an unknown node or 500
+                response: {'ok': True, 'result': ...} or {'ok': False, 'error': ...}
+        """
+        started = time.perf_counter()
+        request = dict(request)
+        request_id = request.pop('id', None)
+        op = request.pop('op', None)
+        try:
+            if op not in QUERIES:
+                raise ValueError(f"Unknown query {op}, expected one of {list(QUERIES)}")
+            method, heavy, types = QUERIES[op]
+            unknown = set(request) - set(types)
+            if unknown:
+                raise ValueError(f"Unknown parameters {sorted(unknown)} for {op}")
+            if 'node' in types and 'node' not in request:
+                raise ValueError(f"{op} needs a node")
+            params = {name: types[name](value) for name, value in request.items()}
+
+            if method is None:
+                result = {'reloaded': await self.reload(), **self._stats(self.snapshot)}
+            elif heavy:
+                # Bind the snapshot now so a reload cannot swap it mid-query
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._executor, functools.partial(getattr(self, method), self.snapshot, **params)
+                )
+            else:
+                result = getattr(self, method)(self.snapshot, **params)
+            status, response = 200, {'ok': True, 'result': result}
+        except KeyError as e:
+            status, response = 404, {'ok': False, 'error': f"Work item {e} not in the DAG"}
+        except ValueError as e:
+            status, response = 400, {'ok': False, 'error': str(e)}
+        except Exception as e:
+            logger.exception(f"Query {op} failed")
+            status, response = 500, {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+        if request_id is not None:
+            response['id'] = request_id
+        op = op if op in QUERIES else 'unknown'
+        self.queries[op] = self.queries.get(op, 0) + 1
+        logger.debug("Answered %s in %.2fms", op, (time.perf_counter() - started) * 1000)
+        return status, response
+
+    def _ping(self, snapshot: GraphSnapshot) -> str:
+        return 'pong'
+
+    def _stats(self, snapshot: GraphSnapshot) -> Dict[str, Any]:
+        return {
+            'data_file': str(snapshot.data_file),
+            'loaded_at': snapshot.loaded_at,
+            'load_seconds': snapshot.seconds,
+            'reloads': self.reloads,
+            'nodes': snapshot.G.number_of_nodes(),
+            'edges': snapshot.G.number_of_edges(),
+            'paths': snapshot.path_count,
+            'queries': dict(self.queries)
+        }
+
+    def _top_paths(self, snapshot: GraphSnapshot, k: int = 20) -> List[Dict[str, Any]]:
+        if not 0 < k <= self.max_top_paths:
+            raise ValueError(f"k must be between 1 and {self.max_top_paths}, got {k}")
+        return [_path_json(path_info) for path_info in snapshot.top_paths[:k]]
+
+    def _ancestors(self, snapshot: GraphSnapshot, node: str) -> Dict[str, Any]:
+        ancestors = snapshot.reachability.ancestors(node)
+        return {'node': node, 'count': len(ancestors), 'ancestors': ancestors}
+
+    def _descendants(self, snapshot: GraphSnapshot, node: str) -> Dict[str, Any]:
+        descendants = snapshot.reachability.descendants(node)
+        return {'node': node, 'count': len(descendants), 'descendants': descendants}
+
+    def _timing_issues(self, snapshot: GraphSnapshot, node: str) -> Dict[str, Any]:
+        if node not in snapshot.G:
+            raise KeyError(node)
+        issues = {}
+        for issue_type, found in snapshot.timing_issues.get(node, {}).items():
+            records = found if isinstance(found, list) else [found] if found else []
+            if records:
+                issues[issue_type] = [{**record, 'paths': [list(path) for path in record['paths']]} for record in records]
+        opportunity = snapshot.temporal_data[node].opportunity if node in snapshot.temporal_data else None
+        return {'node': node, 'opportunity': opportunity, 'issues': issues}
+
+    def _render(self, snapshot: GraphSnapshot, node: str, hops: int = 2, format: str = 'svg') -> Dict[str, Any]:
+        if self.render_dir is None:
+            raise ValueError("Rendering is not enabled on this server")
+        if not format.isalnum():
+            raise ValueError(f"Unknown render format {format}")
+        if node not in snapshot.G:
+            raise KeyError(node)
+        key = (node, hops, format)
+        # Concurrent requests for one image wait for the first to draw it rather than draw the same file
+        with snapshot.render_locks.setdefault(key, threading.Lock()):
+            if key not in snapshot.renders:
+                subgraph = neighborhood_subgraph(snapshot.G, node, hops)
+                self.render_dir.mkdir(parents=True, exist_ok=True)
+                output_path = self.render_dir / f"{_file_stem(node)}_{hops}.{format}"
+                # Draw into a temporary file and swap it in, so the file a response names is always whole
+                fd, partial = tempfile.mkstemp(dir=self.render_dir, prefix=f'.{output_path.stem}-', suffix=f'.{format}')
+                os.close(fd)
+                try:
+                    render_graphs(snapshot.G, [RenderJob(Path(partial), format=format, graph=subgraph)],
+                                  dpi=self.dpi, max_workers=1)
+                    os.replace(partial, output_path)
+                except BaseException:
+                    Path(partial).unlink(missing_ok=True)
+                    raise
+                snapshot.renders[key] = {'node': node, 'nodes': subgraph.number_of_nodes(),
+                                         'edges': subgraph.number_of_edges(), 'path': str(output_path)}
+        return snapshot.renders[key]
+
+    async def handle_json_lines(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one connection of JSON Lines queries, answering each on its own line in order."""
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("A query must be a JSON object")
+                except ValueError as e:
+                    response = {'ok': False, 'error': f"Bad query: {e}"}
+                else:
+                    response = (await self.handle(request))[1]
+                writer.write(json.dumps(response, default=_json_default).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def handle_http(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one HTTP/1.1 connection, keeping it open between requests.
+
+        A request names its query in the path and passes the parameters in
+        the query string or as a JSON object body, e.g. GET /ancestors?node=123.
+        """
+        try:
+            while request_line := await reader.readline():
+                headers = {}
+                while (line := await reader.readline()).strip():
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                    url = urlsplit(target)
+                    request = dict(parse_qsl(url.query))
+                    body = await reader.readexactly(int(headers.get('content-length', 0)))
+                    if body:
+                        request.update(json.loads(body))
+                    request['op'] = url.path.strip('/')
+                except (ValueError, TypeError) as e:
+                    status, response = 400, {'ok': False, 'error': f"Bad request: {e}"}
+                    version = 'HTTP/1.0'
+                else:
+                    status, response = await self.handle(request)
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                payload = json.dumps(response, default=_json_default).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} {HTTP_STATUSES[status]}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                    .encode('latin-1') + payload
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+async def serve_dag(service: DagService, socket_path: Optional[Path] = None, host: str = '127.0.0.1',
+                    port: Optional[int] = None) -> None:
+    """Start a service and answer queries until cancelled.
+
+    Args:
+        service (DagService): Service to start and serve
+        socket_path (Path, optional): Unix socket for JSON Lines queries
+        host (str): Interface for HTTP queries; keep it local, as there is no authentication
+        port (int, optional): Port for HTTP queries
+
+    Raises:
+        ValueError: If neither socket_path nor port is given
+    """
+    if socket_path is None and port is None:
+        raise ValueError("Serving needs a socket path or a port")
+    await service.start()
+    servers = []
+    try:
+        if socket_path is not None:
+            if Path(socket_path).is_socket():
+                Path(socket_path).unlink()
+            servers.append(await asyncio.start_unix_server(service.handle_json_lines, path=str(socket_path)))
+            logger.info(f"Answering JSON Lines queries on {socket_path}")
+        if port is not None:
+            servers.append(await asyncio.start_server(service.handle_http, host=host, port=port))
+            logger.info(f"Answering HTTP queries on http://{host}:{port}")
+        await asyncio.gather(*(server.serve_forever() for server in servers))
+    finally:
+        for server in servers:
+            server.close()
+        await service.close()
+        if socket_path is not None and Path(socket_path).is_socket():
+            Path(socket_path).unlink()
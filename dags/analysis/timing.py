@@ -0,0 +1,211 @@
+import networkx as nx
+import itertools
+import logging
+import numpy as np
+import pandas as pd
+from collections.abc import Sequence
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
+from datetime import datetime
+
+from ..utils.data import TemporalStore
+from ..utils.instrument import instrumented
+
+logger = logging.getLogger(__name__)
+
+def _iter_chains(start: str, neighbors) -> Iterator[List[str]]:
+    """Yield every chain from start that follows neighbors until it runs out."""
+    next_nodes = list(neighbors(start))
+    if not next_nodes:
+        yield [start]
+        return
+    chain = [start]
+    stack = [iter(next_nodes)]
+    while stack:
+        node = next(stack[-1], None)
+        if node is None:
+            stack.pop()
+            chain.pop()
+            continue
+        chain.append(node)
+        next_nodes = list(neighbors(node))
+        if next_nodes:
+            stack.append(iter(next_nodes))
+        else:
+            yield list(chain)
+            chain.pop()
+
+def iter_paths_through(G: nx.DiGraph, first: str, last: str) -> Iterator[List[str]]:
+    """Lazily yield maximal paths that contain first followed directly by last.
+
+    Pass the same node twice for paths through a single node.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph (must be acyclic)
+        first (str): Node (or edge tail) the paths must contain
+        last (str): Node (or edge head) the paths must contain
+
+    Yields:
+        List[str]: Source-to-sink paths through the node or edge
+    """
+    for head in _iter_chains(first, G.predecessors):
+        head = head[::-1]
+        for tail in _iter_chains(last, G.successors):
+            yield head + tail[1:] if first == last else head + tail
+
+def _count_issues(issues: Dict[str, Dict[str, Any]]) -> int:
+    """Count issue records, for instrumentation."""
+    return sum(len(found) if isinstance(found, list) else found is not None
+               for node_issues in issues.values() for found in node_issues.values())
+
+class WitnessPaths(Sequence):
+    """Example paths through a node or edge, computed on first access.
+
+    Holds at most `limit` paths, so an issue record stays small no matter how
+    many paths cross the node or edge.
+    """
+    def __init__(self, G: nx.DiGraph, first: str, last: str, limit: int):
+        self._G = G
+        self._first = first
+        self._last = last
+        self._limit = limit
+        self._paths = None
+
+    def _materialize(self) -> List[List[str]]:
+        if self._paths is None:
+            self._paths = list(itertools.islice(iter_paths_through(self._G, self._first, self._last), self._limit))
+        return self._paths
+
+    def __getitem__(self, index):
+        return self._materialize()[index]
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+    def __repr__(self) -> str:
+        if self._paths is None:
+            return f"WitnessPaths({self._first!r}, {self._last!r}, limit={self._limit})"
+        return repr(self._paths)
+
+def iter_timing_issues(G: nx.DiGraph, temporal_data: Dict[str, Any], max_witness_paths: int = 1,
+                       today: Optional[datetime] = None, nodes: Optional[Iterable[str]] = None,
+                       issue_counts: Optional[Dict[str, int]] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Lazily yield the timing issues of each node, as analyze_timing finds them.
+
+    The checks run vectorized up front, but issue records are only built for
+    one node at a time, so a consumer that writes them out as they come keeps
+    memory flat however many issues there are.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph
+        temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
+        max_witness_paths (int): Maximum number of example paths kept per issue
+        today (datetime, optional): Reference date for overdue checks, defaults to now
+        nodes (Iterable[str], optional): Only analyze these nodes and their incoming edges
+        issue_counts (Dict[str, int], optional): Filled in with the number of issues of each type
+
+    Yields:
+        Tuple[str, Dict[str, Any]]: A node and its issues, keyed by issue type
+    """
+    store = TemporalStore.from_temporal_data(temporal_data)
+    today = np.datetime64(pd.Timestamp(today or datetime.now()).to_datetime64(), 'ns')
+
+    # Only nodes that lie on some path, and that have temporal data, are analyzed
+    candidates = G.nodes() if nodes is None else nodes
+    nodes = [node for node in candidates if node in G and node in store and G.degree(node)]
+    positions = np.array([store.positions[node] for node in nodes], dtype=np.int64)
+    start = store.start_dates[positions]
+    target = store.target_dates[positions]
+    closed = store.closed_dates[positions]
+
+    missing_start = np.isnat(start)
+    missing_target = np.isnat(target)
+    # NaT never compares less than anything, so missing dates never flag
+    target_passed = (target < today) & np.isnat(closed)
+
+    # Predecessor checks, once per edge with dates on both ends; edges are grouped by node
+    edges = [(u, v) for v in nodes for u in G.predecessors(v) if u in store]
+    end_before = start_before = np.zeros(0, dtype=bool)
+    if edges:
+        pred_positions = np.array([store.positions[u] for u, _ in edges], dtype=np.int64)
+        node_positions = np.array([store.positions[v] for _, v in edges], dtype=np.int64)
+        pred_target = store.target_dates[pred_positions]
+        end_before = store.target_dates[node_positions] < pred_target
+        start_before = store.start_dates[node_positions] < pred_target
+
+    if issue_counts is not None:
+        issue_counts.update({
+            'missing_start_dates': int(missing_start.sum()),
+            'missing_target_dates': int(missing_target.sum()),
+            'target_passed_without_close': int(target_passed.sum()),
+            'end_before_predecessor_end': int(end_before.sum()),
+            'start_before_predecessor_end': int(start_before.sum())
+        })
+    logger.info(f"Timing analysis of {len(nodes)} nodes and {len(edges)} edges")
+
+    def node_issue(node: str) -> Dict[str, Any]:
+        view = store[node]
+        return {
+            'node': node,
+            'target_date': view.target_date,
+            'start_date': view.start_date,
+            'closed_date': view.closed_date,
+            'paths': WitnessPaths(G, node, node, max_witness_paths)
+        }
+
+    edge = 0
+    for i, node in enumerate(nodes):
+        node_issues = {
+            'missing_start_dates': node_issue(node) if missing_start[i] else None,
+            'missing_target_dates': node_issue(node) if missing_target[i] else None,
+            'target_passed_without_close': node_issue(node) if target_passed[i] else None,
+            'end_before_predecessor_end': [],
+            'start_before_predecessor_end': []
+        }
+        while edge < len(edges) and edges[edge][1] == node:
+            pred = edges[edge][0]
+            if end_before[edge]:
+                node_issues['end_before_predecessor_end'].append({
+                    'node': node,
+                    'predecessor': pred,
+                    'node_date': store[node].target_date,
+                    'predecessor_date': store[pred].target_date,
+                    'paths': WitnessPaths(G, pred, node, max_witness_paths)
+                })
+            if start_before[edge]:
+                node_issues['start_before_predecessor_end'].append({
+                    'node': node,
+                    'predecessor': pred,
+                    'start_date': store[node].start_date,
+                    'predecessor_date': store[pred].target_date,
+                    'paths': WitnessPaths(G, pred, node, max_witness_paths)
+                })
+            edge += 1
+        yield node, node_issues
+
+@instrumented(items=lambda issues: {'nodes': len(issues), 'issues': _count_issues(issues)})
+def analyze_timing(G: nx.DiGraph, temporal_data: Dict[str, Any], max_witness_paths: int = 1,
+                   today: Optional[datetime] = None, nodes: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """Analyze the DAG for timing issues once per node and once per edge.
+
+    Finds the same issues as analyze_path_timing over all paths, but the
+    checks are vectorized over the temporal columns and each edge is checked
+    once, so the cost is O(V + E) however many paths cross it. Instead of
+    embedding the path that exposed an issue, each record carries a 'paths'
+    entry of WitnessPaths that computes up to max_witness_paths example paths
+    when first read.
+
+    Args:
+        G (nx.DiGraph): NetworkX directed graph
+        temporal_data (Dict[str, Any]): Dictionary mapping node IDs to temporal information
+        max_witness_paths (int): Maximum number of example paths kept per issue
+        today (datetime, optional): Reference date for overdue checks, defaults to now
+        nodes (Iterable[str], optional): Only analyze these nodes and their incoming edges
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Issues keyed by node, with the same issue types as analyze_path_timing
+    """
+    logger.info("Analyzing node and edge timing")
+    issue_counts = {}
+    issues = dict(iter_timing_issues(G, temporal_data, max_witness_paths, today, nodes, issue_counts))
+    logger.info(f"Timing analysis found {issue_counts}")
+    return issues
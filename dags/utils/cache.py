@@ -0,0 +1,191 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import numpy as np
+from pathlib import Path
+from typing import Dict, Tuple, Optional, Any
+
+from .data import TemporalStore, read_dag_data_columnar, read_dag_data_chunked
+from .formats import file_format, read_dag_data_arrow
+from ..analysis.csr import CsrGraph
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the loader or the cached layout changes meaning
+CACHE_SCHEMA_VERSION = 1
+
+_GRAPH_ARRAYS = ['succ_indptr', 'succ_indices', 'pred_indptr', 'pred_indices', 'type_codes', 'state_codes']
+_TEMPORAL_ARRAYS = ['start_dates', 'target_dates', 'closed_dates', 'opportunity_codes']
+
+def get_cache_dir() -> Path:
+    """Get the default directory for parsed-data caches.
+
+    Returns:
+        Path: Path to the cache directory
+    """
+    return Path(__file__).parent.parent.parent / '.dag_cache'
+
+def file_fingerprint(data_file: Path, content_hash: bool = True) -> Dict[str, Any]:
+    """Describe a data file by size, modification time and (optionally) SHA-256 of its content.
+
+    Args:
+        data_file (Path): Path to the data file
+        content_hash (bool): Whether to hash the file content
+
+    Returns:
+        dict: Fingerprint with 'size', 'mtime_ns' and 'sha256' keys
+    """
+    stat = os.stat(data_file)
+    fingerprint = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': None}
+    if content_hash:
+        digest = hashlib.sha256()
+        with open(data_file, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        fingerprint['sha256'] = digest.hexdigest()
+    return fingerprint
+
+def _entry_dir(data_file: Path, cache_dir: Path) -> Path:
+    """Cache entry directory for a data file, unique per resolved path."""
+    path_hash = hashlib.sha256(str(Path(data_file).resolve()).encode()).hexdigest()[:12]
+    return Path(cache_dir) / f"{Path(data_file).stem}-{path_hash}"
+
+def save_dag_cache(data_file: Path, graph: CsrGraph, temporal_store: TemporalStore,
+                   cache_dir: Optional[Path] = None, fingerprint: Optional[Dict[str, Any]] = None) -> Path:
+    """Write a parsed graph and temporal store to the cache as .npy arrays.
+
+    Args:
+        data_file (Path): Source data file the graph was parsed from
+        graph (CsrGraph): Parsed graph
+        temporal_store (TemporalStore): Parsed temporal data
+        cache_dir (Path, optional): Cache directory, defaults to get_cache_dir()
+        fingerprint (dict, optional): Fingerprint of data_file taken before it was parsed
+
+    Returns:
+        Path: Directory of the cache entry
+    """
+    entry = _entry_dir(data_file, cache_dir or get_cache_dir())
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=entry.parent, prefix='.tmp-'))
+    try:
+        np.save(staging / 'node_ids.npy', np.array(graph.node_ids, dtype=str))
+        for name in _GRAPH_ARRAYS:
+            np.save(staging / f'{name}.npy', np.asarray(getattr(graph, name)))
+        np.save(staging / 'temporal_node_ids.npy', np.array(temporal_store.node_ids, dtype=str))
+        for name in _TEMPORAL_ARRAYS:
+            np.save(staging / f'{name}.npy', np.asarray(getattr(temporal_store, name)))
+        meta = {
+            'schema_version': CACHE_SCHEMA_VERSION,
+            'source': str(Path(data_file).resolve()),
+            'fingerprint': fingerprint or file_fingerprint(data_file),
+            'types': graph.types,
+            'states': graph.states,
+            'opportunities': temporal_store.opportunities
+        }
+        with open(staging / 'meta.json', 'w') as f:
+            json.dump(meta, f)
+
+        # Swap the finished entry in so readers never see a partial one
+        if entry.exists():
+            shutil.rmtree(entry)
+        os.replace(staging, entry)
+    except Exception:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    logger.info(f"Saved DAG cache for {data_file} to {entry}")
+    return entry
+
+def load_dag_cache(data_file: Path, cache_dir: Optional[Path] = None) -> Optional[Tuple[CsrGraph, TemporalStore]]:
+    """Load a cached graph and temporal store if they are still valid for data_file.
+
+    The entry is valid when its schema version matches and the file's size and
+    modification time are unchanged. If only the modification time changed, the
+    content hash decides, and a matching entry is refreshed in place. Arrays are
+    memory-mapped copy-on-write, so loading does not read them up front.
+
+    Args:
+        data_file (Path): Source data file
+        cache_dir (Path, optional): Cache directory, defaults to get_cache_dir()
+
+    Returns:
+        tuple or None: (graph, temporal_store), or None if there is no valid entry
+    """
+    entry = _entry_dir(data_file, cache_dir or get_cache_dir())
+    try:
+        with open(entry / 'meta.json') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        logger.info(f"No DAG cache for {data_file}")
+        return None
+
+    if meta.get('schema_version') != CACHE_SCHEMA_VERSION:
+        logger.info(f"DAG cache for {data_file} has schema {meta.get('schema_version')}, expected {CACHE_SCHEMA_VERSION}")
+        return None
+
+    cached = meta['fingerprint']
+    current = file_fingerprint(data_file, content_hash=False)
+    if current['size'] != cached['size']:
+        logger.info(f"DAG cache for {data_file} is stale (size changed)")
+        return None
+    if current['mtime_ns'] != cached['mtime_ns']:
+        current = file_fingerprint(data_file)
+        if current['sha256'] != cached['sha256']:
+            logger.info(f"DAG cache for {data_file} is stale (content changed)")
+            return None
+        meta['fingerprint'] = current
+        with open(entry / 'meta.json', 'w') as f:
+            json.dump(meta, f)
+
+    def load(name: str) -> np.ndarray:
+        return np.load(entry / f'{name}.npy', mmap_mode='c')
+
+    graph = CsrGraph.from_arrays(
+        load('node_ids').tolist(),
+        *(load(name) for name in _GRAPH_ARRAYS[:5]),
+        meta['types'],
+        load('state_codes'),
+        meta['states']
+    )
+    temporal_store = TemporalStore(
+        load('temporal_node_ids').tolist(),
+        *(load(name) for name in _TEMPORAL_ARRAYS),
+        meta['opportunities']
+    )
+    logger.info(f"Loaded DAG cache for {data_file} from {entry}")
+    return graph, temporal_store
+
+def read_dag_cached(data_file: Path, cache_dir: Optional[Path] = None,
+                    chunksize: Optional[int] = None) -> Tuple[CsrGraph, TemporalStore]:
+    """Read DAG data through the cache, parsing the data file only when needed.
+
+    Args:
+        data_file (Path): Path to the CSV, Parquet or Arrow data file
+        cache_dir (Path, optional): Cache directory, defaults to get_cache_dir()
+        chunksize (int, optional): Parse the CSV in chunks of this many rows with read_dag_data_chunked
+
+    Returns:
+        tuple: (graph, temporal_store)
+            graph: CsrGraph built from the data
+            temporal_store: TemporalStore indexed by node ID
+    """
+    cached = load_dag_cache(data_file, cache_dir)
+    if cached is not None:
+        return cached
+
+    # Fingerprint before parsing so a file changing mid-read is caught next time
+    fingerprint = file_fingerprint(data_file)
+    if file_format(data_file) != 'csv':
+        dag_data, temporal_store = read_dag_data_arrow(data_file)
+    elif chunksize:
+        dag_data, temporal_store = read_dag_data_chunked(data_file, chunksize)
+    else:
+        dag_data, temporal_store = read_dag_data_columnar(data_file)
+    graph = CsrGraph.from_dag_data(dag_data)
+    try:
+        save_dag_cache(data_file, graph, temporal_store, cache_dir, fingerprint)
+    except OSError as e:
+        logger.warning(f"Failed to write DAG cache for {data_file}: {e}")
+    return graph, temporal_store
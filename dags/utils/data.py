@@ -1,12 +1,26 @@
 import json
 import logging
+import os
+import warnings
+import numpy as np
 import pandas as pd
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Iterator, Iterable
 from datetime import datetime
+from .instrument import instrumented
 
 logger = logging.getLogger(__name__)
 
+def _dag_data_items(result: Tuple[Dict, Mapping]) -> Dict[str, int]:
+    """Item counts of a loader result, for instrumentation."""
+    dag_data, temporal_data = result
+    return {
+        'work_items': len(dag_data),
+        'relationships': sum(len(d['predecessors']) + len(d['successors']) for d in dag_data.values()),
+        'temporal_nodes': len(temporal_data)
+    }
+
 class NodeTemporalInfo:
     """Class to store temporal information for a node."""
     def __init__(self, start_date: Optional[str], target_date: Optional[str], closed_date: Optional[str], opportunity: Optional[str]):
@@ -35,6 +49,283 @@ class NodeTemporalInfo:
                 f"Out-Degree: {self.out_degree}"
                 f"Opportunity: {self.opportunity}")
 
+# Formats tried, in order, before falling back to per-value parsing
+DATE_FORMATS = ['%m/%d/%y', '%m/%d/%y %H:%M', '%m/%d/%Y', '%m/%d/%Y %H:%M', 'ISO8601']
+
+@instrumented(items=lambda dates: {'values': len(dates)})
+def parse_dates(values) -> np.ndarray:
+    """Parse a column of date strings to datetime64 in one vectorized pass.
+    
+    Each distinct value is parsed once. Known formats are tried in bulk and
+    anything left over is parsed individually. Missing or unparseable values
+    become NaT.
+    
+    Args:
+        values: Sequence of date strings (None/NaN for missing), or a datetime64 Series
+        
+    Returns:
+        np.ndarray: datetime64[ns] array
+    """
+    if isinstance(values, pd.Series) and pd.api.types.is_datetime64_any_dtype(values.dtype):
+        # Already typed, e.g. a timestamp column from Parquet
+        if values.dt.tz is not None:
+            values = values.dt.tz_convert(None)
+        return values.to_numpy(dtype='datetime64[ns]')
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+    uniques = pd.Series(uniques, dtype=object)
+    parsed = pd.Series(pd.NaT, index=uniques.index, dtype='datetime64[ns]')
+    remaining = uniques.notna() & (uniques != '')
+    for date_format in DATE_FORMATS:
+        if not remaining.any():
+            break
+        attempt = pd.to_datetime(uniques[remaining], errors='coerce', format=date_format)
+        parsed[remaining] = attempt
+        remaining &= parsed.isna()
+    if remaining.any():
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)
+            parsed[remaining] = pd.to_datetime(uniques[remaining], errors='coerce', format='mixed')
+        failed = remaining & parsed.isna()
+        if failed.any():
+            logger.warning(f"Failed to parse {int(failed.sum())} distinct dates, e.g. '{uniques[failed].iloc[0]}'")
+    
+    # Missing values have code -1, which picks the trailing NaT
+    return np.append(parsed.to_numpy(dtype='datetime64[ns]'), np.datetime64('NaT', 'ns'))[codes]
+
+class NodeTemporalView:
+    """Lightweight view of one node's row in a TemporalStore.
+    
+    Exposes the same attributes as NodeTemporalInfo, so code written against
+    the per-node objects works unchanged against the columnar store.
+    """
+    __slots__ = ('_store', '_position')
+    
+    def __init__(self, store: 'TemporalStore', position: int):
+        self._store = store
+        self._position = position
+    
+    @property
+    def start_date(self) -> Optional[datetime]:
+        return self._store._timestamp(self._store.start_dates, self._position)
+    
+    @property
+    def target_date(self) -> Optional[datetime]:
+        return self._store._timestamp(self._store.target_dates, self._position)
+    
+    @property
+    def closed_date(self) -> Optional[datetime]:
+        return self._store._timestamp(self._store.closed_dates, self._position)
+    
+    @property
+    def opportunity(self) -> Optional[str]:
+        code = self._store.opportunity_codes[self._position]
+        return None if code < 0 else self._store.opportunities[code]
+    
+    @property
+    def in_degree(self) -> Optional[int]:
+        degree = self._store.in_degrees[self._position]
+        return None if degree < 0 else int(degree)
+    
+    @in_degree.setter
+    def in_degree(self, value: Optional[int]) -> None:
+        self._store.in_degrees[self._position] = -1 if value is None else value
+    
+    @property
+    def out_degree(self) -> Optional[int]:
+        degree = self._store.out_degrees[self._position]
+        return None if degree < 0 else int(degree)
+    
+    @out_degree.setter
+    def out_degree(self, value: Optional[int]) -> None:
+        self._store.out_degrees[self._position] = -1 if value is None else value
+    
+    def __str__(self) -> str:
+        return (f"Start: {self.start_date}, "
+                f"Target: {self.target_date}, "
+                f"Closed: {self.closed_date}, "
+                f"In-Degree: {self.in_degree}, "
+                f"Out-Degree: {self.out_degree}"
+                f"Opportunity: {self.opportunity}")
+
+class TemporalStore(Mapping):
+    """Columnar temporal information for all nodes, indexed by node ID.
+    
+    Dates are held as datetime64[ns] arrays with NaT for missing values,
+    opportunities as integer codes into a category list (-1 for missing) and
+    degrees as integer arrays (-1 until computed). Indexing by node ID returns
+    a NodeTemporalView, so the store can stand in for the
+    Dict[str, NodeTemporalInfo] returned by read_dag_data.
+    """
+    def __init__(self, node_ids: List[str], start_dates: np.ndarray, target_dates: np.ndarray,
+                 closed_dates: np.ndarray, opportunity_codes: np.ndarray, opportunities: List[str]):
+        self.node_ids = list(node_ids)
+        self.positions = {node: i for i, node in enumerate(self.node_ids)}
+        self.start_dates = np.asarray(start_dates, dtype='datetime64[ns]')
+        self.target_dates = np.asarray(target_dates, dtype='datetime64[ns]')
+        self.closed_dates = np.asarray(closed_dates, dtype='datetime64[ns]')
+        self.opportunity_codes = np.asarray(opportunity_codes, dtype=np.int32)
+        self.opportunities = list(opportunities)
+        self.in_degrees = np.full(len(self.node_ids), -1, dtype=np.int32)
+        self.out_degrees = np.full(len(self.node_ids), -1, dtype=np.int32)
+    
+    @classmethod
+    def from_columns(cls, node_ids, start_dates, target_dates, closed_dates, opportunities) -> 'TemporalStore':
+        """Build a store from raw columns, parsing each date column in one pass.
+        
+        Args:
+            node_ids: Unique node IDs
+            start_dates: Start date strings, aligned with node_ids
+            target_dates: Target date strings, aligned with node_ids
+            closed_dates: Closed date strings, aligned with node_ids
+            opportunities: Opportunity names, aligned with node_ids
+            
+        Returns:
+            TemporalStore: Store holding the parsed columns
+        """
+        codes, categories = pd.factorize(pd.Series(opportunities, dtype=object))
+        return cls(
+            node_ids,
+            parse_dates(start_dates),
+            parse_dates(target_dates),
+            parse_dates(closed_dates),
+            codes,
+            categories.tolist()
+        )
+    
+    @classmethod
+    def from_temporal_data(cls, temporal_data: Dict[str, NodeTemporalInfo]) -> 'TemporalStore':
+        """Build a store from a dictionary of NodeTemporalInfo objects."""
+        if isinstance(temporal_data, TemporalStore):
+            return temporal_data
+        infos = list(temporal_data.values())
+        codes, categories = pd.factorize(pd.Series([t.opportunity for t in infos], dtype=object))
+        store = cls(
+            list(temporal_data),
+            parse_dates([t.start_date for t in infos]),
+            parse_dates([t.target_date for t in infos]),
+            parse_dates([t.closed_date for t in infos]),
+            codes,
+            categories.tolist()
+        )
+        store.in_degrees[:] = [-1 if t.in_degree is None else t.in_degree for t in infos]
+        store.out_degrees[:] = [-1 if t.out_degree is None else t.out_degree for t in infos]
+        return store
+    
+    def upsert(self, node_ids, start_dates, target_dates, closed_dates, opportunities) -> None:
+        """Insert or overwrite temporal information for a batch of nodes.
+        
+        Existing rows are updated in place and new nodes are appended in one
+        step, so small deltas do not rebuild the store. Degrees of new nodes
+        start unknown.
+        
+        Args:
+            node_ids: Node IDs to insert or update
+            start_dates: Start date strings, aligned with node_ids
+            target_dates: Target date strings, aligned with node_ids
+            closed_dates: Closed date strings, aligned with node_ids
+            opportunities: Opportunity names, aligned with node_ids
+        """
+        node_ids = list(node_ids)
+        start_dates = parse_dates(start_dates)
+        target_dates = parse_dates(target_dates)
+        closed_dates = parse_dates(closed_dates)
+        codes = []
+        for opportunity in opportunities:
+            if opportunity is None or pd.isna(opportunity):
+                codes.append(-1)
+                continue
+            if opportunity not in self.opportunities:
+                self.opportunities.append(opportunity)
+            codes.append(self.opportunities.index(opportunity))
+        codes = np.array(codes, dtype=np.int32)
+        
+        # Later rows for the same node win
+        positions = {}
+        for i, node in enumerate(node_ids):
+            positions[node] = i
+        new_nodes = [node for node in positions if node not in self.positions]
+        for node in new_nodes:
+            self.positions[node] = len(self.node_ids)
+            self.node_ids.append(node)
+        if new_nodes:
+            grow = len(new_nodes)
+            self.start_dates = np.concatenate([self.start_dates, np.full(grow, np.datetime64('NaT'), dtype='datetime64[ns]')])
+            self.target_dates = np.concatenate([self.target_dates, np.full(grow, np.datetime64('NaT'), dtype='datetime64[ns]')])
+            self.closed_dates = np.concatenate([self.closed_dates, np.full(grow, np.datetime64('NaT'), dtype='datetime64[ns]')])
+            self.opportunity_codes = np.concatenate([self.opportunity_codes, np.full(grow, -1, dtype=np.int32)])
+            self.in_degrees = np.concatenate([self.in_degrees, np.full(grow, -1, dtype=np.int32)])
+            self.out_degrees = np.concatenate([self.out_degrees, np.full(grow, -1, dtype=np.int32)])
+        
+        rows = np.array([self.positions[node] for node in positions], dtype=np.int64)
+        sources = np.array(list(positions.values()), dtype=np.int64)
+        self.start_dates[rows] = start_dates[sources]
+        self.target_dates[rows] = target_dates[sources]
+        self.closed_dates[rows] = closed_dates[sources]
+        self.opportunity_codes[rows] = codes[sources]
+    
+    def subset(self, node_ids: Iterable[str]) -> 'TemporalStore':
+        """Copy the rows of some nodes into a new store, in the order given.
+        
+        Nodes not in the store are skipped. Opportunity codes and known
+        degrees carry over unchanged.
+        
+        Args:
+            node_ids (Iterable[str]): Nodes to keep
+        
+        Returns:
+            TemporalStore: Store holding only those nodes
+        """
+        node_ids = [node for node in node_ids if node in self.positions]
+        rows = np.array([self.positions[node] for node in node_ids], dtype=np.int64)
+        store = TemporalStore(
+            node_ids,
+            self.start_dates[rows],
+            self.target_dates[rows],
+            self.closed_dates[rows],
+            self.opportunity_codes[rows],
+            self.opportunities
+        )
+        store.in_degrees[:] = self.in_degrees[rows]
+        store.out_degrees[:] = self.out_degrees[rows]
+        return store
+    
+    @staticmethod
+    def _timestamp(dates: np.ndarray, position: int) -> Optional[datetime]:
+        value = dates[position]
+        return None if np.isnat(value) else pd.Timestamp(value)
+    
+    def position(self, node: str) -> int:
+        """Return the row of a node in the column arrays."""
+        return self.positions[node]
+    
+    def date_counts(self) -> Dict[str, int]:
+        """Count nodes that have each kind of date."""
+        return {
+            'with_start_date': int((~np.isnat(self.start_dates)).sum()),
+            'with_target_date': int((~np.isnat(self.target_dates)).sum()),
+            'with_closed_date': int((~np.isnat(self.closed_dates)).sum())
+        }
+    
+    def memory_usage(self) -> int:
+        """Approximate bytes held by the column arrays."""
+        return sum(a.nbytes for a in (
+            self.start_dates, self.target_dates, self.closed_dates,
+            self.opportunity_codes, self.in_degrees, self.out_degrees
+        ))
+    
+    def __getitem__(self, node: str) -> NodeTemporalView:
+        return NodeTemporalView(self, self.positions[node])
+    
+    def __contains__(self, node) -> bool:
+        return node in self.positions
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.node_ids)
+    
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+@instrumented(items=_dag_data_items)
 def read_dag_data(data_file: Path) -> Tuple[Dict, Dict[str, NodeTemporalInfo]]:
     """Read DAG data from CSV file.
     
@@ -90,30 +381,289 @@ def read_dag_data(data_file: Path) -> Tuple[Dict, Dict[str, NodeTemporalInfo]]:
             elif relationship_type == 'Successor':
                 dag_data[work_item_id]['successors'].append(relationship_id)
         
-        logger.info(f"Processed {len(dag_data)} unique work items")
-        logger.debug(f"Found {sum(len(d['predecessors']) for d in dag_data.values())} predecessor relationships")
-        logger.debug(f"Found {sum(len(d['successors']) for d in dag_data.values())} successor relationships")
+        _log_data_summary(dag_data, temporal_data)
         
-        # Log temporal information summary
-        temporal_summary = {
-            'with_start_date': sum(1 for t in temporal_data.values() if t.start_date is not None),
-            'with_target_date': sum(1 for t in temporal_data.values() if t.target_date is not None),
-            'with_closed_date': sum(1 for t in temporal_data.values() if t.closed_date is not None)
+        return dag_data, temporal_data
+    except Exception as e:
+        logger.error(f"Error reading data file: {e}")
+        raise
+
+@instrumented(items=_dag_data_items)
+def read_dag_data_vectorized(data_file: Path) -> Tuple[Dict, Dict[str, NodeTemporalInfo]]:
+    """Read DAG data from CSV file using column operations instead of row iteration.
+    
+    Produces the same structures as read_dag_data: work items keep the type and
+    state of their first row, temporal data comes from the first row that
+    mentions each related ID, and relationship lists keep file order.
+    
+    Args:
+        data_file (Path): Path to the CSV data file
+        
+    Returns:
+        tuple: (dag_data, temporal_data)
+            dag_data: DAG data structure with nodes and their relationships
+            temporal_data: Dictionary mapping node IDs to their temporal information
+        
+    Raises:
+        FileNotFoundError: If the data file doesn't exist
+        pd.errors.EmptyDataError: If the file is empty
+    """
+    try:
+        logger.info(f"Reading DAG data from {data_file} (vectorized)")
+        df = pd.read_csv(data_file)
+        logger.info(f"Successfully read {len(df)} rows from CSV file")
+        
+        work_item_ids = df['WORK_ITEM_ID'].astype(str)
+        related_ids = df['WORK_ITEM_RELATED_ID'].astype(str)
+        
+        dag_data = _build_dag_data(df, work_item_ids, related_ids)
+        
+        # Temporal information comes from the first row for each related ID
+        first_related = ~related_ids.duplicated()
+        temporal_data = {
+            node: NodeTemporalInfo(
+                start_date=start_date,
+                target_date=target_date,
+                closed_date=closed_date,
+                opportunity=opportunity
+            )
+            for node, start_date, target_date, closed_date, opportunity in zip(
+                related_ids[first_related],
+                df.loc[first_related, 'START_DATETIME'],
+                df.loc[first_related, 'TARGET_DATETIME'],
+                df.loc[first_related, 'CLOSED_DATETIME'],
+                df.loc[first_related, 'OPPORTUNITY_NAME']
+            )
         }
-        logger.info(f"Temporal data summary: {temporal_summary}")
+        
+        _log_data_summary(dag_data, temporal_data)
         
         return dag_data, temporal_data
     except Exception as e:
         logger.error(f"Error reading data file: {e}")
         raise
 
-def get_data_file_path() -> Path:
-    """Get the path to the default DAG data file.
+@instrumented(items=_dag_data_items)
+def read_dag_data_columnar(data_file: Path) -> Tuple[Dict, TemporalStore]:
+    """Read DAG data from CSV file into a columnar temporal store.
+    
+    Like read_dag_data_vectorized, but the temporal information is returned
+    as a TemporalStore with all dates parsed in one pass per column.
+    
+    Args:
+        data_file (Path): Path to the CSV data file
+        
+    Returns:
+        tuple: (dag_data, temporal_store)
+            dag_data: DAG data structure with nodes and their relationships
+            temporal_store: TemporalStore indexed by node ID
+        
+    Raises:
+        FileNotFoundError: If the data file doesn't exist
+        pd.errors.EmptyDataError: If the file is empty
+    """
+    try:
+        logger.info(f"Reading DAG data from {data_file} (columnar)")
+        df = pd.read_csv(data_file)
+        logger.info(f"Successfully read {len(df)} rows from CSV file")
+        
+        return _columnar_from_frame(df)
+    except Exception as e:
+        logger.error(f"Error reading data file: {e}")
+        raise
+
+def _columnar_from_frame(df: pd.DataFrame) -> Tuple[Dict, TemporalStore]:
+    """Build dag_data and a TemporalStore from a relationship frame, as read_dag_data_columnar does.
+    
+    Date columns may hold strings or already be datetime64.
+    """
+    work_item_ids = df['WORK_ITEM_ID'].astype(str)
+    related_ids = df['WORK_ITEM_RELATED_ID'].astype(str)
+    
+    dag_data = _build_dag_data(df, work_item_ids, related_ids)
+    
+    # Temporal information comes from the first row for each related ID
+    first_related = ~related_ids.duplicated()
+    temporal_store = TemporalStore.from_columns(
+        related_ids[first_related].tolist(),
+        df.loc[first_related, 'START_DATETIME'],
+        df.loc[first_related, 'TARGET_DATETIME'],
+        df.loc[first_related, 'CLOSED_DATETIME'],
+        df.loc[first_related, 'OPPORTUNITY_NAME']
+    )
+    
+    _log_data_summary(dag_data, temporal_store)
+    
+    return dag_data, temporal_store
+
+# Columns the pipeline reads from an export, and the dtypes to read them with
+EXPORT_DTYPES = {
+    'WORK_ITEM_ID': str,
+    'WORK_ITEM_RELATED_ID': str,
+    'WORK_ITEM_RELATIONSHIP_TYPE': 'category',
+    'WORK_ITEM_TYPE_NAME': 'category',
+    'WORK_ITEM_RELATIONSHIP_STATE_NAME': 'category',
+    'OPPORTUNITY_NAME': 'category',
+    'START_DATETIME': str,
+    'TARGET_DATETIME': str,
+    'CLOSED_DATETIME': str
+}
+
+@instrumented(items=_dag_data_items)
+def read_dag_data_chunked(data_file: Path, chunksize: int = 100000,
+                          compression: Optional[str] = 'infer',
+                          opportunities: Optional[List[str]] = None) -> Tuple[Dict, TemporalStore]:
+    """Read DAG data from a CSV file in fixed-size chunks into a columnar temporal store.
+    
+    Only the columns in EXPORT_DTYPES are read, IDs and dates as strings and
+    names as categoricals. Each chunk is folded into the relationship lists
+    and the temporal columns before the next is read, so beyond the results
+    memory is bounded by the chunk size rather than the file size. Produces
+    the same results as read_dag_data_columnar. With opportunities, rows of
+    other opportunities are dropped from each chunk before it is folded in,
+    so only the kept partitions are ever held.
+    
+    Args:
+        data_file (Path): Path to the CSV data file
+        chunksize (int): Rows per chunk
+        compression (str, optional): Compression of the file, e.g. 'gzip' or 'zstd'
+            (which needs the zstandard package); 'infer' goes by the file suffix
+        opportunities (List[str], optional): Only keep rows with these OPPORTUNITY_NAMEs
+        
+    Returns:
+        tuple: (dag_data, temporal_store)
+            dag_data: DAG data structure with nodes and their relationships
+            temporal_store: TemporalStore indexed by node ID
+        
+    Raises:
+        FileNotFoundError: If the data file doesn't exist
+        pd.errors.EmptyDataError: If the file is empty
+        ValueError: If the file lacks one of the columns in EXPORT_DTYPES
+    """
+    try:
+        logger.info(f"Reading DAG data from {data_file} in chunks of {chunksize} rows")
+        dag_data = {}
+        node_ids = []
+        positions = {}
+        columns = {'start': [], 'target': [], 'closed': [], 'opportunity': []}
+        codes_by_name = {}
+        rows = 0
+        kept_rows = 0
+        
+        chunks = pd.read_csv(data_file, usecols=list(EXPORT_DTYPES), dtype=EXPORT_DTYPES,
+                             chunksize=chunksize, compression=compression)
+        for chunk in chunks:
+            rows += len(chunk)
+            if opportunities is not None:
+                chunk = chunk[chunk['OPPORTUNITY_NAME'].isin(opportunities).to_numpy()]
+            kept_rows += len(chunk)
+            work_item_ids = chunk['WORK_ITEM_ID'].astype(str)
+            related_ids = chunk['WORK_ITEM_RELATED_ID'].astype(str)
+            _build_dag_data(chunk, work_item_ids, related_ids, dag_data)
+            
+            # Temporal information comes from the first row for each related ID in the file
+            first_related = (~related_ids.duplicated() & ~related_ids.isin(positions)).to_numpy()
+            new_nodes = related_ids[first_related].tolist()
+            for node in new_nodes:
+                positions[node] = len(node_ids)
+                node_ids.append(node)
+            columns['start'].append(parse_dates(chunk.loc[first_related, 'START_DATETIME']))
+            columns['target'].append(parse_dates(chunk.loc[first_related, 'TARGET_DATETIME']))
+            columns['closed'].append(parse_dates(chunk.loc[first_related, 'CLOSED_DATETIME']))
+            
+            # Opportunity codes follow first appearance across the whole file
+            codes, names = pd.factorize(chunk.loc[first_related, 'OPPORTUNITY_NAME'].astype(object))
+            global_codes = np.array([codes_by_name.setdefault(name, len(codes_by_name)) for name in names] + [-1], dtype=np.int32)
+            columns['opportunity'].append(global_codes[codes])
+        
+        logger.info(f"Successfully read {rows} rows from CSV file")
+        if opportunities is not None:
+            logger.info(f"Kept {kept_rows} rows of {len(opportunities)} opportunities")
+        empty_dates = np.array([], dtype='datetime64[ns]')
+        temporal_store = TemporalStore(
+            node_ids,
+            np.concatenate(columns['start'] or [empty_dates]),
+            np.concatenate(columns['target'] or [empty_dates]),
+            np.concatenate(columns['closed'] or [empty_dates]),
+            np.concatenate(columns['opportunity'] or [np.array([], dtype=np.int32)]),
+            list(codes_by_name)
+        )
+        
+        _log_data_summary(dag_data, temporal_store)
+        
+        return dag_data, temporal_store
+    except Exception as e:
+        logger.error(f"Error reading data file: {e}")
+        raise
+
+def _build_dag_data(df: pd.DataFrame, work_item_ids: pd.Series, related_ids: pd.Series,
+                    dag_data: Optional[Dict] = None) -> Dict:
+    """Build the dag_data structure from a relationship frame with group operations.
+    
+    With dag_data, the frame is folded into it: new work items are added and
+    relationships are appended after those already there.
+    """
+    dag_data = {} if dag_data is None else dag_data
+    
+    # Work items take their type and state from their first row
+    first_item = ~work_item_ids.duplicated()
+    for node, node_type, node_state in zip(
+        work_item_ids[first_item],
+        df.loc[first_item, 'WORK_ITEM_TYPE_NAME'],
+        df.loc[first_item, 'WORK_ITEM_RELATIONSHIP_STATE_NAME']
+    ):
+        if node not in dag_data:
+            dag_data[node] = {
+                'predecessors': [],
+                'successors': [],
+                'type': node_type,
+                'state': node_state
+            }
+    
+    # Split relationships by type; groupby keeps file order within each group
+    relationship_types = df['WORK_ITEM_RELATIONSHIP_TYPE']
+    for relationship_type, key in (('Predecessor', 'predecessors'), ('Successor', 'successors')):
+        mask = relationship_types == relationship_type
+        grouped = related_ids[mask].groupby(work_item_ids[mask], sort=False).agg(list)
+        for node, related in grouped.items():
+            dag_data[node][key].extend(related)
+    
+    return dag_data
+
+def _log_data_summary(dag_data: Dict, temporal_data: Mapping) -> None:
+    """Log a summary of the loaded relationships and temporal information."""
+    logger.info(f"Processed {len(dag_data)} unique work items")
+    logger.debug(f"Found {sum(len(d['predecessors']) for d in dag_data.values())} predecessor relationships")
+    logger.debug(f"Found {sum(len(d['successors']) for d in dag_data.values())} successor relationships")
+    
+    # Log temporal information summary
+    if isinstance(temporal_data, TemporalStore):
+        temporal_summary = temporal_data.date_counts()
+    else:
+        temporal_summary = {
+            'with_start_date': sum(1 for t in temporal_data.values() if t.start_date is not None),
+            'with_target_date': sum(1 for t in temporal_data.values() if t.target_date is not None),
+            'with_closed_date': sum(1 for t in temporal_data.values() if t.closed_date is not None)
+        }
+    logger.info(f"Temporal data summary: {temporal_summary}")
+
+@instrumented()
+def get_data_file_path(data_file: Optional[Path] = None) -> Path:
+    """Get the path to the DAG data file.
+    
+    Args:
+        data_file (Path, optional): Explicit data file; otherwise the DAG_DATA_FILE
+            environment variable, then data/working.csv
     
     Returns:
         Path: Path to the data file
     """
-    path = Path(__file__).parent.parent.parent / 'data' / 'working.csv'
-    #path = Path(__file__).parent.parent.parent / 'data' / 'sample.csv'
+    if data_file is not None:
+        path = Path(data_file)
+    elif os.environ.get('DAG_DATA_FILE'):
+        path = Path(os.environ['DAG_DATA_FILE'])
+    else:
+        path = Path(__file__).parent.parent.parent / 'data' / 'working.csv'
+        #path = Path(__file__).parent.parent.parent / 'data' / 'sample.csv'
     logger.debug(f"Resolved data file path: {path}")
     return path 
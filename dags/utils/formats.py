@@ -0,0 +1,144 @@
+import logging
+import pandas as pd
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Tuple, Optional
+
+from .data import TemporalStore, EXPORT_DTYPES, _columnar_from_frame, _dag_data_items
+from .instrument import instrumented
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # Optional; only needed for Parquet and Arrow files
+    pa = ds = pq = None
+
+logger = logging.getLogger(__name__)
+
+# File suffixes of each columnar format
+PARQUET_SUFFIXES = ('.parquet', '.pq')
+ARROW_SUFFIXES = ('.arrow', '.feather', '.ipc')
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("Parquet and Arrow files need the pyarrow package, e.g. from the arrow extra")
+
+def file_format(path: Path) -> str:
+    """Format of a data file by its suffix: 'parquet', 'arrow' or 'csv'."""
+    suffix = Path(path).suffix.lower()
+    if suffix in PARQUET_SUFFIXES:
+        return 'parquet'
+    if suffix in ARROW_SUFFIXES:
+        return 'arrow'
+    return 'csv'
+
+def _date_bound(column: str, schema, value: datetime):
+    """A date bound as a scalar of the column's type, for comparisons pushed into the scan."""
+    return pa.scalar(pd.Timestamp(value).to_pydatetime(), type=schema.field(column).type)
+
+@instrumented(items=_dag_data_items)
+def read_dag_data_arrow(data_file: Path, opportunities: Optional[List[str]] = None,
+                        target_from: Optional[datetime] = None,
+                        target_to: Optional[datetime] = None) -> Tuple[Dict, TemporalStore]:
+    """Read DAG data from a Parquet or Arrow IPC (Feather) file into a columnar temporal store.
+
+    Only the columns in EXPORT_DTYPES are scanned. Filters are pushed into
+    the scan, so Parquet row groups that cannot match are skipped; a date
+    range is pushed down when TARGET_DATETIME is a timestamp column and
+    applied after parsing when it holds strings. The kept rows are then
+    converted to pandas, which copies the projected columns once, and built
+    into the same structures as read_dag_data_columnar.
+
+    Args:
+        data_file (Path): Path to the .parquet, .arrow or .feather file
+        opportunities (List[str], optional): Only keep rows with these OPPORTUNITY_NAMEs
+        target_from (datetime, optional): Only keep rows targeted on or after this date
+        target_to (datetime, optional): Only keep rows targeted on or before this date
+
+    Returns:
+        tuple: (dag_data, temporal_store)
+            dag_data: DAG data structure with nodes and their relationships
+            temporal_store: TemporalStore indexed by node ID
+
+    Raises:
+        ImportError: If pyarrow is not installed
+        FileNotFoundError: If the data file doesn't exist
+    """
+    _require_pyarrow()
+    try:
+        logger.info(f"Reading DAG data from {data_file} ({file_format(data_file)})")
+        dataset = ds.dataset(data_file, format='parquet' if file_format(data_file) == 'parquet' else 'ipc')
+        target_typed = pa.types.is_timestamp(dataset.schema.field('TARGET_DATETIME').type) or \
+            pa.types.is_date(dataset.schema.field('TARGET_DATETIME').type)
+
+        conditions = []
+        if opportunities is not None:
+            conditions.append(ds.field('OPPORTUNITY_NAME').isin(list(opportunities)))
+        if target_typed and target_from is not None:
+            conditions.append(ds.field('TARGET_DATETIME') >= _date_bound('TARGET_DATETIME', dataset.schema, target_from))
+        if target_typed and target_to is not None:
+            conditions.append(ds.field('TARGET_DATETIME') <= _date_bound('TARGET_DATETIME', dataset.schema, target_to))
+        condition = None
+        for part in conditions:
+            condition = part if condition is None else condition & part
+
+        table = dataset.to_table(columns=list(EXPORT_DTYPES), filter=condition)
+        logger.info(f"Successfully read {table.num_rows} rows from {data_file}")
+        df = table.to_pandas()
+
+        if not target_typed and (target_from is not None or target_to is not None):
+            target = pd.to_datetime(df['TARGET_DATETIME'], errors='coerce', format='mixed')
+            keep = target.notna()
+            if target_from is not None:
+                keep &= target >= pd.Timestamp(target_from)
+            if target_to is not None:
+                keep &= target <= pd.Timestamp(target_to)
+            df = df[keep.to_numpy()].reset_index(drop=True)
+            logger.info(f"Kept {len(df)} rows in the target date range")
+
+        return _columnar_from_frame(df)
+    except Exception as e:
+        logger.error(f"Error reading data file: {e}")
+        raise
+
+def write_frame(df: pd.DataFrame, output_path: Path) -> Path:
+    """Write a frame as Parquet, Arrow IPC or CSV, going by the file suffix.
+
+    Args:
+        df (pd.DataFrame): Frame to write
+        output_path (Path): Output file
+
+    Returns:
+        Path: The written file
+
+    Raises:
+        ImportError: If a Parquet or Arrow file is asked for and pyarrow is not installed
+    """
+    output_path = Path(output_path)
+    output_format = file_format(output_path)
+    if output_format == 'csv':
+        df.to_csv(output_path)
+    else:
+        _require_pyarrow()
+        table = pa.Table.from_pandas(df)
+        if output_format == 'parquet':
+            pq.write_table(table, output_path)
+        else:
+            with pa.OSFile(str(output_path), 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    logger.info(f"Wrote {len(df)} rows to {output_path}")
+    return output_path
+
+def convert_csv(data_file: Path, output_path: Path) -> Path:
+    """Convert a CSV export to Parquet or Arrow, keeping only the columns the pipeline reads.
+
+    Args:
+        data_file (Path): CSV export
+        output_path (Path): .parquet, .arrow or .feather file to write
+
+    Returns:
+        Path: The written file
+    """
+    df = pd.read_csv(data_file, usecols=list(EXPORT_DTYPES), dtype=EXPORT_DTYPES)
+    return write_frame(df.reset_index(drop=True), output_path)
@@ -0,0 +1,229 @@
+import cProfile
+import functools
+import inspect
+import json
+import logging
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class StageStats:
+    """Class to accumulate timing, memory and item counts for one pipeline stage."""
+    name: str
+    calls: int = 0
+    seconds: float = 0.0
+    memory_bytes: Optional[int] = None
+    memory_kind: Optional[str] = None
+    items: Dict[str, int] = field(default_factory=dict)
+
+class _Instrumentation:
+    """Process-wide instrumentation state; disabled until enable_instrumentation is called."""
+    def __init__(self):
+        self.enabled = False
+        self.trace_memory = False
+        self.stats: Dict[str, StageStats] = {}
+        # (traced bytes at entry, running traced peak) for each stage being measured
+        self.stack: List[List[int]] = []
+        self.profile_stage: Optional[str] = None
+        self.profile_output: Optional[Path] = None
+
+_state = _Instrumentation()
+
+def enable_instrumentation(trace_memory: bool = False, profile_stage: Optional[str] = None,
+                           profile_output: Optional[Path] = None) -> None:
+    """Start recording stage statistics.
+
+    Args:
+        trace_memory (bool): Measure peak allocations with tracemalloc instead of the
+            (coarser, but free) growth of the process's peak RSS
+        profile_stage (str, optional): Stage whose first call is run under cProfile
+        profile_output (Path, optional): File for the profile stats, defaults to <stage>.prof
+    """
+    _state.enabled = True
+    _state.trace_memory = trace_memory
+    _state.profile_stage = profile_stage
+    _state.profile_output = Path(profile_output or f'{profile_stage}.prof') if profile_stage else None
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+def disable_instrumentation() -> None:
+    """Stop recording stage statistics, keeping what was recorded."""
+    _state.enabled = False
+    if _state.trace_memory and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+def reset_instrumentation() -> None:
+    """Discard recorded stage statistics."""
+    _state.stats.clear()
+
+def _peak_rss() -> int:
+    """Peak resident set size of the process in bytes, or 0 if unknown."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 if resource else 0
+
+def _enter() -> List[int]:
+    if _state.trace_memory:
+        current, peak = tracemalloc.get_traced_memory()
+        if _state.stack:
+            _state.stack[-1][1] = max(_state.stack[-1][1], peak)
+        tracemalloc.reset_peak()
+        frame = [current, current]
+    else:
+        frame = [_peak_rss(), 0]
+    _state.stack.append(frame)
+    return frame
+
+def _exit(frame: List[int]) -> int:
+    """Return the memory a stage added at its peak, and fold it into the enclosing stage."""
+    _state.stack.pop()
+    if not _state.trace_memory:
+        return max(0, _peak_rss() - frame[0])
+    peak = max(frame[1], tracemalloc.get_traced_memory()[1])
+    if _state.stack:
+        _state.stack[-1][1] = max(_state.stack[-1][1], peak)
+    return peak - frame[0]
+
+def _record(name: str, seconds: float, memory: int, items: Dict[str, int]) -> None:
+    stats = _state.stats.setdefault(name, StageStats(name))
+    stats.calls += 1
+    stats.seconds += seconds
+    stats.memory_bytes = max(stats.memory_bytes or 0, memory)
+    stats.memory_kind = 'tracemalloc' if _state.trace_memory else 'rss'
+    for key, value in items.items():
+        stats.items[key] = stats.items.get(key, 0) + value
+
+def _run(name: str, call: Callable[[], Any]) -> Any:
+    """Run call, under cProfile if it is the stage chosen for profiling."""
+    if name != _state.profile_stage:
+        return call()
+    # Only the first call is profiled
+    _state.profile_stage = None
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(call)
+    finally:
+        profiler.dump_stats(_state.profile_output)
+        logger.info(f"Wrote profile of {name} to {_state.profile_output}")
+
+@contextmanager
+def stage(name: str):
+    """Measure a block of code as a named stage.
+
+    Yields:
+        Dict[str, int]: Item counts to fill in for the stage
+    """
+    if not _state.enabled:
+        yield {}
+        return
+    items = {}
+    frame = _enter()
+    start = time.perf_counter()
+    try:
+        yield items
+    finally:
+        seconds = time.perf_counter() - start
+        _record(name, seconds, _exit(frame), items)
+
+def instrumented(items: Optional[Callable[[Any], Dict[str, int]]] = None, yields: str = 'items'):
+    """Decorate a pipeline function so its calls are measured when instrumentation is enabled.
+
+    Generator functions are measured while they run, and count what they yield.
+
+    Args:
+        items (Callable, optional): Maps the function's result to item counts
+        yields (str): Name of the count of yielded items, for generator functions
+    """
+    def decorator(func):
+        name = func.__name__
+
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def generator_wrapper(*args, **kwargs):
+                if not _state.enabled:
+                    return func(*args, **kwargs)
+                return _measure_generator(name, func(*args, **kwargs), yields)
+            return generator_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _state.enabled:
+                return func(*args, **kwargs)
+            frame = _enter()
+            start = time.perf_counter()
+            try:
+                result = _run(name, lambda: func(*args, **kwargs))
+            except BaseException:
+                _exit(frame)
+                raise
+            seconds = time.perf_counter() - start
+            _record(name, seconds, _exit(frame), items(result) if items else {})
+            return result
+        return wrapper
+    return decorator
+
+def _measure_generator(name: str, generator, yields: str):
+    """Re-yield from generator, timing only the work done inside it.
+
+    With RSS the growth of the peak is summed over the steps; with
+    tracemalloc the largest single step is kept.
+    """
+    count = 0
+    seconds = 0.0
+    memory = 0
+    try:
+        while True:
+            frame = _enter()
+            start = time.perf_counter()
+            try:
+                item = next(generator)
+            except StopIteration:
+                return
+            finally:
+                seconds += time.perf_counter() - start
+                step = _exit(frame)
+                memory = max(memory, step) if _state.trace_memory else memory + step
+            count += 1
+            yield item
+    finally:
+        # Also reached when the consumer stops early
+        _record(name, seconds, memory, {yields: count})
+
+def instrumentation_report() -> List[Dict[str, Any]]:
+    """Recorded stage statistics, slowest first.
+
+    Returns:
+        List[Dict[str, Any]]: One entry per stage with calls, seconds, memory and item counts
+    """
+    return [asdict(stats) for stats in sorted(_state.stats.values(), key=lambda s: s.seconds, reverse=True)]
+
+def format_report_table(report: List[Dict[str, Any]]) -> str:
+    """Format an instrumentation report as a text table."""
+    lines = [f"{'Stage':<28} {'Calls':>7} {'Seconds':>10} {'Memory MB':>10}  Items", '-' * 80]
+    for entry in report:
+        memory = f"{entry['memory_bytes'] / 2 ** 20:10.1f}" if entry['memory_bytes'] is not None else f"{'':>10}"
+        items = ', '.join(f"{key}={value}" for key, value in entry['items'].items())
+        lines.append(f"{entry['name']:<28} {entry['calls']:>7} {entry['seconds']:>10.3f} {memory}  {items}")
+    return '\n'.join(lines)
+
+def write_report_json(output_path: Path) -> None:
+    """Write the instrumentation report to a JSON file.
+
+    Args:
+        output_path (Path): Path of the JSON file
+    """
+    with open(output_path, 'w') as f:
+        json.dump({
+            'memory_kind': 'tracemalloc' if _state.trace_memory else 'rss',
+            'stages': instrumentation_report()
+        }, f, indent=2)
+    logger.info(f"Wrote instrumentation report to {output_path}")
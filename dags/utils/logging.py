@@ -1,12 +1,19 @@
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from pathlib import Path
 
-def setup_logging(log_name='dag_analysis'):
+def setup_logging(log_name='dag_analysis', queued=False):
     """Set up logging with rotating file handler.
     
+    With queued, log calls only put the record on an in-memory queue and a
+    background thread formats it and writes the file, so the file I/O and
+    rotation stay off the analysis code. The queue is drained at exit.
+    
     Args:
         log_name (str): Base name for the log file
+        queued (bool): Write the file from a background thread
         
     Returns:
         logging.Logger: Configured logger instance
@@ -30,7 +37,14 @@ def setup_logging(log_name='dag_analysis'):
     # Configure root logger
     logger = logging.getLogger()
     logger.setLevel(logging.INFO)
-    logger.addHandler(handler)
+    if queued:
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        logger.addHandler(QueueHandler(log_queue))
+    else:
+        logger.addHandler(handler)
     
     # Configure module loggers
     #for module in ['dags.utils.data', 'dags.analysis.paths']:
@@ -0,0 +1,135 @@
+import logging
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Columns of the relationship export, in export order
+EXPORT_COLUMNS = [
+    'OPPORTUNITY_NAME', 'WORK_ITEM_ID', 'WORK_ITEM_RELATED_ID', 'WORK_ITEM_RELATIONSHIP_TYPE',
+    'WORK_ITEM_TYPE_NAME', 'WORK_ITEM_RELATIONSHIP_TITLE_NAME', 'WORK_ITEM_RELATIONSHIP_STATE_NAME',
+    'REPORTING_STATUS_NAME', 'TSHIRT_SIZE', 'IMPACT_CATEGORY_NAME', 'WORK_ITEM_RELATIONSHIP_ISSUE_IND',
+    'VALUE_AREA_NAME', 'START_DATETIME', 'TARGET_DATETIME', 'CHANGED_DATETIME', 'CLOSED_DATETIME',
+    'WORK_ITEM_RELATIONSHIP_CREATED_DATETIME', 'ESTIMATED_START_DATETIME', 'ESTIMATED_COMPLETION_DATETIME',
+    'WORK_ITEM_LINKS_ID', 'EDE_CREATE_DATETIME', 'EDE_UPDATE_DATETIME'
+]
+
+STATES = ['New', 'Planning', 'Solutioning', 'Ready', 'Implementing', 'QA', 'Dev Complete', 'Closed']
+
+def _format_dates(dates: pd.Series) -> pd.Series:
+    """Format dates like the export does, e.g. 7/17/24, leaving NaT empty."""
+    formatted = dates.dt.month.astype('Int64').astype(str) + '/' + dates.dt.day.astype('Int64').astype(str) + '/' + dates.dt.strftime('%y')
+    return formatted.where(dates.notna())
+
+def generate_dag_frame(num_nodes: int = 1000, edge_density: float = 1.5, depth: int = 10, fan_out: int = 4,
+                       missing_date_fraction: float = 0.05, inconsistent_date_fraction: float = 0.05,
+                       closed_fraction: float = 0.3, num_opportunities: int = 8,
+                       base_date: str = '2024-01-01', seed: Optional[int] = None) -> pd.DataFrame:
+    """Generate a random work item DAG as a relationship export.
+
+    Nodes are spread over `depth` layers and edges only point to later layers,
+    so the graph is acyclic and its longest path has at most `depth` nodes.
+    Each edge becomes one row, written either as a Successor row from its tail
+    or as a Predecessor row from its head. A node's dates follow its layer, so
+    they are consistent along every edge, except for a fraction of nodes whose
+    dates are pulled earlier than their predecessors' and a fraction of dates
+    left empty.
+
+    Args:
+        num_nodes (int): Number of work items
+        edge_density (float): Edges per node before the fan-out cap is applied
+        depth (int): Number of layers
+        fan_out (int): Maximum number of successors per node
+        missing_date_fraction (float): Fraction of start and of target dates left empty
+        inconsistent_date_fraction (float): Fraction of nodes dated before their predecessors
+        closed_fraction (float): Fraction of nodes with a closed date
+        num_opportunities (int): Number of distinct opportunity names
+        base_date (str): Earliest start date
+        seed (int, optional): Random seed, for reproducible data
+
+    Returns:
+        pd.DataFrame: Rows in the export schema (EXPORT_COLUMNS)
+
+    Raises:
+        ValueError: If the parameters cannot produce a graph
+    """
+    if num_nodes < 2 or depth < 2 or fan_out < 1:
+        raise ValueError("Need at least 2 nodes, 2 layers and a fan-out of 1")
+    rng = np.random.default_rng(seed)
+    node_ids = np.arange(100000, 100000 + num_nodes)
+
+    # Every layer gets at least one node when there are enough nodes
+    layers = np.sort(np.concatenate([
+        np.arange(min(depth, num_nodes)),
+        rng.integers(0, depth, max(0, num_nodes - depth))
+    ]))
+    layer_starts = np.searchsorted(layers, np.arange(depth + 1))
+
+    # Edges jump forward one layer, occasionally more
+    num_edges = int(edge_density * num_nodes)
+    tails = rng.integers(0, layer_starts[depth - 1], num_edges) if layer_starts[depth - 1] else np.zeros(0, dtype=np.int64)
+    head_layers = np.minimum(layers[tails] + rng.geometric(0.7, len(tails)), depth - 1)
+    heads = layer_starts[head_layers] + (rng.random(len(tails)) * (layer_starts[head_layers + 1] - layer_starts[head_layers])).astype(np.int64)
+    edges = pd.DataFrame({'tail': tails, 'head': heads}).drop_duplicates()
+    edges = edges[edges.groupby('tail').cumcount() < fan_out]
+    tails = edges['tail'].to_numpy()
+    heads = edges['head'].to_numpy()
+
+    # Work items last one to four weeks and each layer starts five weeks after the last,
+    # so only the inconsistent nodes, moved back two layers, start before a predecessor ends
+    base = pd.Timestamp(base_date)
+    start_days = layers * 35 + rng.integers(0, 7, num_nodes)
+    inconsistent = rng.random(num_nodes) < inconsistent_date_fraction
+    start_days = np.where(inconsistent & (layers > 0), start_days - 70, start_days)
+    start = base + pd.to_timedelta(start_days, unit='D')
+    target = start + pd.to_timedelta(rng.integers(7, 29, num_nodes), unit='D')
+    closed = target + pd.to_timedelta(rng.integers(-3, 10, num_nodes), unit='D')
+    start = pd.Series(start).mask(rng.random(num_nodes) < missing_date_fraction)
+    target = pd.Series(target).mask(rng.random(num_nodes) < missing_date_fraction)
+    closed = pd.Series(closed).mask(rng.random(num_nodes) >= closed_fraction)
+    opportunities = np.array([f"[SYN] Opportunity {i + 1}" for i in range(num_opportunities)])[rng.integers(0, num_opportunities, num_nodes)]
+    states = np.where(closed.notna(), 'Closed', np.array(STATES[:-1])[rng.integers(0, len(STATES) - 1, num_nodes)])
+
+    # Half the edges are exported from the tail as Successor rows, the rest from the head as Predecessor rows
+    successor_rows = rng.random(len(tails)) < 0.5
+    items = np.where(successor_rows, tails, heads)
+    related = np.where(successor_rows, heads, tails)
+    created = _format_dates(start.fillna(base) - pd.Timedelta(days=30))
+    df = pd.DataFrame({
+        'OPPORTUNITY_NAME': opportunities[related],
+        'WORK_ITEM_ID': node_ids[items],
+        'WORK_ITEM_RELATED_ID': node_ids[related],
+        'WORK_ITEM_RELATIONSHIP_TYPE': np.where(successor_rows, 'Successor', 'Predecessor'),
+        'WORK_ITEM_TYPE_NAME': 'Feature',
+        'WORK_ITEM_RELATIONSHIP_TITLE_NAME': [f"Synthetic work item {node_ids[i]}" for i in related],
+        'WORK_ITEM_RELATIONSHIP_STATE_NAME': states[related],
+        'VALUE_AREA_NAME': 'Major Initiative',
+        'START_DATETIME': _format_dates(start).to_numpy()[related],
+        'TARGET_DATETIME': _format_dates(target).to_numpy()[related],
+        'CHANGED_DATETIME': _format_dates(target.fillna(base)).to_numpy()[related],
+        'CLOSED_DATETIME': _format_dates(closed).to_numpy()[related],
+        'WORK_ITEM_RELATIONSHIP_CREATED_DATETIME': created.to_numpy()[related],
+        'WORK_ITEM_LINKS_ID': np.arange(500000000, 500000000 + len(tails)),
+        'EDE_CREATE_DATETIME': '6/26/25',
+        'EDE_UPDATE_DATETIME': '6/26/25'
+    })
+    df = df.reindex(columns=EXPORT_COLUMNS).sample(frac=1, random_state=rng.integers(2 ** 32)).reset_index(drop=True)
+    logger.info(f"Generated {num_nodes} work items with {len(df)} relationships over {depth} layers")
+    return df
+
+def write_dag_csv(output_path: Path, **params) -> Path:
+    """Write a generated DAG to a CSV file in the export schema.
+
+    Args:
+        output_path (Path): Path of the CSV file to write
+        **params: Parameters for generate_dag_frame
+
+    Returns:
+        Path: The written file
+    """
+    df = generate_dag_frame(**params)
+    df.to_csv(output_path, index=False)
+    logger.info(f"Wrote synthetic DAG data to {output_path}")
+    return Path(output_path)
@@ -0,0 +1,26 @@
+from pathlib import Path
+
+import networkx as nx
+import pytest
+
+from dags.analysis.paths import _path_info, create_dag
+from dags.utils.data import read_dag_data
+
+DATA_FILE = Path(__file__).parent.parent / 'data' / 'working.csv'
+
+@pytest.fixture(scope='session')
+def working_dag():
+    data, temporal_data = read_dag_data(DATA_FILE)
+    return create_dag(data), temporal_data
+
+@pytest.fixture(scope='session')
+def baseline_paths(working_dag):
+    """Every path in working.csv, in the order the original all-pairs walk found them."""
+    G, temporal_data = working_dag
+    paths = []
+    for source in G.nodes():
+        reachable = nx.descendants(G, source)
+        for target in G.nodes():
+            if target in reachable:
+                paths.extend(_path_info(G, path, temporal_data) for path in nx.all_simple_paths(G, source, target))
+    return paths
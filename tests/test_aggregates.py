@@ -0,0 +1,46 @@
+from collections import defaultdict
+
+import networkx as nx
+import pytest
+
+from dags.analysis.aggregates import aggregate_paths_by_node, aggregate_paths_by_pair, count_paths
+
+def _reduce(paths):
+    """(count, latest target, earliest start, latest closed) over a group of PathInfo."""
+    def pick(dates, choose):
+        dates = [date for date in dates if date is not None]
+        return choose(dates) if dates else None
+    return (len(paths), pick((path.target_date for path in paths), max),
+            pick((path.start_date for path in paths), min), pick((path.closed_date for path in paths), max))
+
+def _fields(aggregate):
+    return (aggregate.path_count, aggregate.target_date, aggregate.start_date, aggregate.closed_date)
+
+def test_count_paths_matches_enumeration(working_dag, baseline_paths):
+    G, _ = working_dag
+    assert count_paths(G) == len(baseline_paths) == 4149
+
+@pytest.mark.parametrize('direction, end', [('upstream', -1), ('downstream', 0)])
+def test_node_aggregates_match_enumeration(working_dag, baseline_paths, direction, end):
+    G, temporal_data = working_dag
+    grouped = defaultdict(list)
+    for path in baseline_paths:
+        grouped[path.nodes[end]].append(path)
+    aggregates = aggregate_paths_by_node(G, temporal_data, direction)
+    assert list(aggregates) == list(G.nodes())
+    assert {node: _fields(aggregate) for node, aggregate in aggregates.items()} == \
+        {node: _reduce(grouped[node]) for node in G.nodes()}
+
+def test_pair_aggregates_match_enumeration(working_dag, baseline_paths):
+    G, temporal_data = working_dag
+    grouped = defaultdict(list)
+    for path in baseline_paths:
+        grouped[(path.nodes[0], path.nodes[-1])].append(path)
+    aggregates = aggregate_paths_by_pair(G, temporal_data)
+    assert {pair: _fields(aggregate) for pair, aggregate in aggregates.items()} == \
+        {pair: _reduce(paths) for pair, paths in grouped.items()}
+
+def test_count_paths_on_a_diamond():
+    G = nx.DiGraph([('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D')])
+    # Four edges, A-B-D, A-C-D
+    assert count_paths(G) == 6
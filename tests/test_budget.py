@@ -0,0 +1,54 @@
+import dataclasses
+
+import networkx as nx
+import pytest
+
+from dags.analysis.budget import EnumerationReport, PathBudget
+from dags.analysis.paths import iter_paths_with_dates
+from dags.analysis.pathstore import PathStore
+from dags.utils.data import NodeTemporalInfo
+
+# Two sources into a diamond chain: A reaches D by 4 paths, D reaches F by 2
+EDGES = [('A', 'B1'), ('A', 'B2'), ('B1', 'C'), ('B2', 'C'), ('A', 'C'), ('A', 'D'), ('C', 'D'), ('D', 'E1'),
+         ('D', 'E2'), ('E1', 'F'), ('E2', 'F'), ('S', 'D')]
+
+@pytest.fixture
+def dag():
+    G = nx.DiGraph(EDGES)
+    return G, {node: NodeTemporalInfo(None, '2025-01-01', None, None) for node in G.nodes()}
+
+def _without_time(report):
+    return dataclasses.replace(report, seconds=0.0)
+
+@pytest.mark.parametrize('budget', [
+    PathBudget(max_paths_per_pair=1),
+    PathBudget(max_paths_per_pair=2, max_length=3),
+    PathBudget(max_paths=7),
+    PathBudget(max_paths_per_pair=1, max_paths=12),
+    PathBudget(max_length=2)
+])
+def test_walkers_apply_a_budget_alike(dag, budget):
+    G, temporal_data = dag
+    report = EnumerationReport()
+    lazy = [path.nodes for path in iter_paths_with_dates(G, temporal_data, budget=budget, report=report)]
+    store = PathStore.from_graph(G, temporal_data, budget=budget)
+    assert lazy == [path.nodes for path in store]
+    assert _without_time(report) == _without_time(store.report)
+    assert report.truncated
+
+def test_truncated_pairs_count_the_paths_left_out(dag):
+    G, temporal_data = dag
+    store = PathStore.from_graph(G, temporal_data, budget=PathBudget(max_paths_per_pair=1))
+    everything = [path.nodes for path in PathStore.from_graph(G, temporal_data)]
+    for (source, target), left_out in store.report.truncated_pairs.items():
+        found = sum(1 for path in everything if path[0] == source and path[-1] == target)
+        assert left_out == found - 1
+    assert store.report.truncated_pairs[('A', 'F')] == 7
+    assert len(store) == len({(path[0], path[-1]) for path in everything})
+
+def test_max_length_cuts_only_sources_with_longer_paths(dag):
+    G, temporal_data = dag
+    store = PathStore.from_graph(G, temporal_data, budget=PathBudget(max_length=3))
+    assert set(store.report.cut_sources) == {'A', 'B1', 'B2'}
+    assert all(len(path.nodes) <= 4 for path in store)
+    assert store.report.stopped is None
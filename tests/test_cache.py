@@ -0,0 +1,72 @@
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from dags.analysis.csr import CsrGraph
+from dags.utils import cache
+from dags.utils.cache import load_dag_cache, read_dag_cached
+from dags.utils.data import read_dag_data_columnar
+
+DATA_FILE = Path(__file__).parent.parent / 'data' / 'working.csv'
+
+@pytest.fixture
+def data_file(tmp_path):
+    copy = tmp_path / 'working.csv'
+    shutil.copyfile(DATA_FILE, copy)
+    return copy
+
+def _contents(graph, temporal_store):
+    """Nodes, edges, labels and dates of a parsed DAG, for comparing cached and fresh reads."""
+    return (graph.nodes(data=True), graph.edges(), [list(graph.predecessors(node)) for node in graph.nodes()],
+            [(node, temporal_store[node].start_date, temporal_store[node].target_date,
+              temporal_store[node].closed_date, temporal_store[node].opportunity) for node in temporal_store.node_ids])
+
+def _parsed(data_file):
+    dag_data, temporal_store = read_dag_data_columnar(data_file)
+    return _contents(CsrGraph.from_dag_data(dag_data), temporal_store)
+
+def _no_parsing(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("data file parsed on a cache hit")
+    monkeypatch.setattr(cache, 'read_dag_data_columnar', fail)
+
+def _cached_mtime(data_file, cache_dir):
+    with open(cache._entry_dir(data_file, cache_dir) / 'meta.json') as f:
+        return json.load(f)['fingerprint']['mtime_ns']
+
+def test_cache_hit_returns_the_parsed_data(data_file, tmp_path, monkeypatch):
+    cache_dir = tmp_path / 'cache'
+    expected = _parsed(data_file)
+    assert load_dag_cache(data_file, cache_dir) is None
+    assert _contents(*read_dag_cached(data_file, cache_dir)) == expected
+
+    _no_parsing(monkeypatch)
+    assert _contents(*read_dag_cached(data_file, cache_dir)) == expected
+
+def test_touched_file_with_same_content_still_hits(data_file, tmp_path, monkeypatch):
+    cache_dir = tmp_path / 'cache'
+    expected = _contents(*read_dag_cached(data_file, cache_dir))
+    stat = os.stat(data_file)
+    os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    _no_parsing(monkeypatch)
+    assert _contents(*read_dag_cached(data_file, cache_dir)) == expected
+    # The hash check refreshed the entry, so the next load skips it
+    assert _cached_mtime(data_file, cache_dir) == stat.st_mtime_ns + 10 ** 9
+
+@pytest.mark.parametrize('old, new', [('9/24/24', '9/25/24'), ('9/24/24', '10/24/24')], ids=['same-size', 'resized'])
+def test_changed_content_misses(data_file, tmp_path, old, new):
+    cache_dir = tmp_path / 'cache'
+    before = _contents(*read_dag_cached(data_file, cache_dir))
+    stat = os.stat(data_file)
+    data_file.write_text(data_file.read_text(encoding='utf-8').replace(old, new, 1), encoding='utf-8')
+    os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    assert load_dag_cache(data_file, cache_dir) is None
+    expected = _parsed(data_file)
+    assert expected != before
+    assert _contents(*read_dag_cached(data_file, cache_dir)) == expected
+    assert load_dag_cache(data_file, cache_dir) is not None
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import networkx as nx
+import pandas as pd
+import pytest
+
+from dags.analysis.csr import CsrGraph, descendants, topological_order
+from dags.analysis.paths import analyze_network
+from dags.utils.data import read_dag_data
+
+DATA_FILE = Path(__file__).parent.parent / 'data' / 'working.csv'
+
+def _structure(G):
+    """Nodes with type and state, plus successor and predecessor lists, all in order."""
+    def labels(attrs):
+        return tuple(None if pd.isna(attrs.get(key)) else attrs.get(key) for key in ('type', 'state'))
+    return [(node, labels(attrs), list(G.successors(node)), list(G.predecessors(node)))
+            for node, attrs in G.nodes(data=True)]
+
+@pytest.fixture(scope='module')
+def graphs(working_dag):
+    G, _ = working_dag
+    data, _ = read_dag_data(DATA_FILE)
+    return G, {'dag_data': CsrGraph.from_dag_data(data), 'networkx': CsrGraph.from_networkx(G)}
+
+@pytest.mark.parametrize('build', ['dag_data', 'networkx'])
+def test_csr_graph_matches_create_dag(graphs, build):
+    G, csr_graphs = graphs
+    csr = csr_graphs[build]
+    assert _structure(csr) == _structure(G)
+    assert csr.edges() == list(G.edges())
+    assert _structure(csr.to_networkx()) == _structure(G)
+    assert list(csr.to_networkx().edges()) == list(G.edges())
+
+@pytest.mark.parametrize('build', ['dag_data', 'networkx'])
+def test_csr_graph_analysis_matches_networkx(graphs, build):
+    G, csr_graphs = graphs
+    csr = csr_graphs[build]
+    order = topological_order(csr)
+    position = {node: i for i, node in enumerate(order)}
+    assert sorted(order) == sorted(G.nodes())
+    assert all(position[u] < position[v] for u, v in G.edges())
+    assert all(descendants(csr, node) == nx.descendants(G, node) for node in G.nodes())
+
+    expected = analyze_network(G)
+    metrics = analyze_network(csr)
+    for key in ('total_nodes', 'total_edges', 'is_dag', 'node_types', 'node_states'):
+        assert metrics[key] == expected[key]
+    for key in ('in_degree_centrality', 'out_degree_centrality'):
+        assert metrics[key] == pytest.approx(expected[key])
+
+def test_csr_graph_rejects_cycles():
+    csr = CsrGraph.from_networkx(nx.DiGraph([('A', 'B'), ('B', 'C'), ('C', 'A')]))
+    with pytest.raises(nx.NetworkXUnfeasible):
+        topological_order(csr)
+    assert analyze_network(csr)['topological_sort'] is None
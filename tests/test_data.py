@@ -0,0 +1,34 @@
+import pandas as pd
+import pytest
+from pathlib import Path
+
+from dags.utils.data import read_dag_data, read_dag_data_vectorized, read_dag_data_columnar, read_dag_data_chunked
+
+DATA_FILE = Path(__file__).parent.parent / 'data' / 'working.csv'
+
+def _temporal_fields(temporal_data):
+    """Dates and opportunity of every node, in node order, with missing values as None."""
+    return [
+        (node, info.start_date, info.target_date, info.closed_date,
+         None if pd.isna(info.opportunity) else info.opportunity)
+        for node, info in ((node, temporal_data[node]) for node in temporal_data)
+    ]
+
+@pytest.fixture(scope='module')
+def reference():
+    return read_dag_data(DATA_FILE)
+
+@pytest.mark.parametrize('read', [
+    read_dag_data_vectorized,
+    read_dag_data_columnar,
+    lambda data_file: read_dag_data_chunked(data_file),
+    lambda data_file: read_dag_data_chunked(data_file, chunksize=37)
+], ids=['vectorized', 'columnar', 'chunked', 'chunked-small'])
+def test_loader_matches_read_dag_data(reference, read):
+    dag_data, temporal_data = read(DATA_FILE)
+    expected_dag_data, expected_temporal_data = reference
+
+    # Same work items in the same order, with relationship lists in file order
+    assert list(dag_data) == list(expected_dag_data)
+    assert dag_data == expected_dag_data
+    assert _temporal_fields(temporal_data) == _temporal_fields(expected_temporal_data)
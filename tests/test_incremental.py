@@ -0,0 +1,50 @@
+import pandas as pd
+import pytest
+
+from dags.analysis.aggregates import aggregate_paths_by_node
+from dags.analysis.incremental import IncrementalAnalysis, read_delta
+from dags.utils.data import NodeTemporalInfo
+
+TODAY = NodeTemporalInfo(None, '2025-06-01', None, None).target_date
+
+COLUMNS = ['CHANGE_TYPE', 'WORK_ITEM_ID', 'WORK_ITEM_RELATED_ID', 'WORK_ITEM_RELATIONSHIP_TYPE', 'WORK_ITEM_TYPE_NAME',
+           'WORK_ITEM_RELATIONSHIP_STATE_NAME', 'START_DATETIME', 'TARGET_DATETIME', 'CLOSED_DATETIME', 'OPPORTUNITY_NAME']
+
+@pytest.fixture
+def analysis(working_dag):
+    G, temporal_data = working_dag
+    return IncrementalAnalysis(G.copy(), temporal_data, max_witness_paths=2, today=TODAY)
+
+@pytest.fixture
+def delta_file(working_dag, tmp_path):
+    G, _ = working_dag
+    (source, target), (pred, node) = list(G.edges())[:2]
+    leaf = next(node for node in G.nodes() if G.out_degree(node) == 0 and G.in_degree(node))
+    rows = [
+        # Drop an edge, push a predecessor's target date past its successor's and hang a new node off a leaf
+        ('remove', target, source, 'Predecessor', 'Feature', 'Dev Complete', None, None, None, None),
+        ('update', node, pred, 'Predecessor', 'Feature', 'Dev Complete', '1/2/24', '12/31/26', None, 'opp'),
+        ('add', leaf, 'NEW-1', 'Successor', 'Feature', 'New', '7/1/25', '5/1/25', None, 'opp'),
+        # Would close a cycle, so it is skipped
+        ('add', 'NEW-1', leaf, 'Successor', 'Feature', 'New', '7/1/24', '8/1/24', None, 'opp')
+    ]
+    path = tmp_path / 'delta.csv'
+    pd.DataFrame(rows, columns=COLUMNS).to_csv(path, index=False)
+    return path
+
+def test_delta_matches_a_full_recompute(analysis, delta_file, working_dag):
+    G, _ = working_dag
+    (source, target), (pred, node) = list(G.edges())[:2]
+    summary = analysis.apply_delta(read_delta(delta_file))
+    assert (summary['added_edges'], summary['removed_edges'], summary['rejected_edges']) == (1, 1, 1)
+    assert not analysis.G.has_edge(source, target) and 'NEW-1' in analysis.G
+    assert pred in [record['predecessor'] for record in analysis.issues[node]['end_before_predecessor_end']]
+    assert analysis.verify() == {'aggregates': [], 'issues': []}
+    assert analysis.aggregates() == aggregate_paths_by_node(analysis.G, analysis.temporal_data)
+
+def test_verify_reports_stale_state(analysis, delta_file):
+    analysis.apply_delta(read_delta(delta_file))
+    node = next(node for node in analysis.issues if analysis.G.in_degree(node))
+    analysis._counts[node] += 1
+    del analysis.issues[node]
+    assert analysis.verify() == {'aggregates': [node], 'issues': [node]}
@@ -0,0 +1,24 @@
+import pytest
+
+from dags.analysis.parallel import find_paths_with_dates_parallel
+from dags.analysis.paths import find_paths_with_dates, create_dag
+from dags.utils.data import read_dag_data_columnar
+from dags.utils.synthetic import write_dag_csv
+
+@pytest.fixture(scope='module')
+def synthetic_dag(tmp_path_factory):
+    data_file = write_dag_csv(tmp_path_factory.mktemp('data') / 'synthetic.csv', num_nodes=120, seed=3)
+    data, temporal_data = read_dag_data_columnar(data_file)
+    return create_dag(data), temporal_data
+
+def _rows(paths):
+    return [(path.nodes, path.target_date, path.start_date, path.closed_date) for path in paths]
+
+@pytest.mark.parametrize('workers', [1, 2])
+@pytest.mark.parametrize('maximal', [False, True])
+def test_parallel_paths_match_serial_order(synthetic_dag, workers, maximal):
+    G, temporal_data = synthetic_dag
+    serial = find_paths_with_dates(G, temporal_data, maximal=maximal)
+    parallel = find_paths_with_dates_parallel(G, temporal_data, workers=workers, maximal=maximal)
+    assert len(serial) > 0
+    assert _rows(parallel) == _rows(serial)
@@ -0,0 +1,35 @@
+from pathlib import Path
+
+import pytest
+
+from dags.analysis.budget import PathBudget
+from dags.analysis.partition import analyze_partitions
+from dags.analysis.paths import create_dag
+from dags.utils.data import read_dag_data_columnar
+
+DATA_FILE = Path(__file__).parent.parent / 'data' / 'working.csv'
+
+@pytest.fixture(scope='module')
+def working_dag():
+    data, temporal_data = read_dag_data_columnar(DATA_FILE)
+    return create_dag(data), temporal_data
+
+def _summary(results):
+    return [(result.key, result.nodes, result.edges, result.paths,
+             [(path.nodes, path.target_date) for path in result.top_paths]) for result in results]
+
+def test_counted_partitions_match_enumerated_ones(working_dag):
+    G, temporal_data = working_dag
+    counted = analyze_partitions(G, temporal_data, workers=1)
+    # A budget that leaves nothing out still enumerates every path
+    enumerated = analyze_partitions(G, temporal_data, workers=1, budget=PathBudget(max_paths=10 ** 9))
+    assert all(result.enumeration is None for result in counted)
+    assert not any(result.enumeration.truncated for result in enumerated)
+    assert _summary(counted) == _summary(enumerated)
+    assert sum(result.paths for result in counted) == 4149
+
+def test_partitions_leave_temporal_data_alone(working_dag):
+    G, temporal_data = working_dag
+    before = {node: (info.in_degree, info.out_degree) for node, info in temporal_data.items()}
+    analyze_partitions(G, temporal_data, by='opportunity', workers=2)
+    assert {node: (info.in_degree, info.out_degree) for node, info in temporal_data.items()} == before
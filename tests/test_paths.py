@@ -0,0 +1,20 @@
+import networkx as nx
+import pytest
+
+from dags.analysis.paths import find_paths_with_dates, find_sorted_paths, find_top_paths
+from dags.utils.data import NodeTemporalInfo
+
+def _temporal_data(target_dates):
+    return {node: NodeTemporalInfo(None, target, None, None) for node, target in target_dates.items()}
+
+@pytest.mark.parametrize('max_paths', [1, 3, 5, 8, 100])
+def test_top_paths_break_ties_in_enumeration_order(max_paths):
+    # Most paths share the latest target date, through E or straight to it
+    G = nx.DiGraph([('S', 'A'), ('S', 'B'), ('A', 'E'), ('B', 'E'), ('E', 'F'), ('A', 'C'), ('C', 'E'), ('T', 'E'),
+                    ('T', 'C')])
+    temporal_data = _temporal_data({'S': '2025-01-01', 'A': '2025-02-01', 'B': '2025-02-01', 'C': '2025-03-01',
+                                    'E': '2025-03-01', 'F': None, 'T': '2025-03-01'})
+    expected = find_sorted_paths(find_paths_with_dates(G, temporal_data), max_paths)
+    top_paths = find_top_paths(G, temporal_data, max_paths)
+    assert [path.nodes for path in top_paths] == [path.nodes for path in expected]
+    assert [path.target_date for path in top_paths] == [path.target_date for path in expected]
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dags.analysis.csr import CsrGraph
+from dags.analysis.paths import iter_maximal_paths
+from dags.analysis.pathstore import PathStore
+
+def _rows(paths):
+    return [(path.nodes, path.target_date, path.start_date, path.closed_date) for path in paths]
+
+@pytest.mark.parametrize('as_csr', [False, True], ids=['networkx', 'csr'])
+def test_store_matches_baseline_paths(working_dag, baseline_paths, as_csr):
+    G, temporal_data = working_dag
+    store = PathStore.from_graph(CsrGraph.from_networkx(G) if as_csr else G, temporal_data)
+    assert len(store) == len(baseline_paths)
+    assert _rows(store) == _rows(baseline_paths)
+    assert not store.report.truncated
+
+    expected_dates = pd.to_datetime([path.target_date for path in baseline_paths]).values
+    np.testing.assert_array_equal(store.target_dates(), expected_dates)
+    assert _rows(store[-3:]) == _rows(baseline_paths[-3:])
+    assert store[-1].nodes == baseline_paths[-1].nodes
+
+def test_maximal_store_matches_baseline_paths(working_dag, baseline_paths):
+    G, temporal_data = working_dag
+    store = PathStore.from_graph(G, temporal_data, maximal=True)
+    # Source-to-sink paths, in depth-first order rather than by target
+    assert [path.nodes for path in store] == list(iter_maximal_paths(G))
+    expected = [path for path in baseline_paths
+                if not G.in_degree(path.nodes[0]) and not G.out_degree(path.nodes[-1])]
+    assert sorted(_rows(store), key=lambda row: row[0]) == sorted(_rows(expected), key=lambda row: row[0])
+
+def test_store_rejects_out_of_range_index(working_dag):
+    G, temporal_data = working_dag
+    store = PathStore.from_graph(G, temporal_data, maximal=True)
+    with pytest.raises(IndexError):
+        store[len(store)]
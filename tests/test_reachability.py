@@ -0,0 +1,28 @@
+import networkx as nx
+import pytest
+
+from dags.analysis.csr import CsrGraph
+from dags.analysis.paths import iter_paths_with_dates
+from dags.analysis.reachability import ReachabilityIndex
+
+@pytest.mark.parametrize('as_csr', [False, True], ids=['networkx', 'csr'])
+def test_index_matches_networkx_reachability(working_dag, as_csr):
+    G, _ = working_dag
+    # Over 64 nodes, so rows span several bitset words
+    index = ReachabilityIndex(CsrGraph.from_networkx(G) if as_csr else G)
+    for node in G.nodes():
+        below = nx.descendants(G, node)
+        above = nx.ancestors(G, node)
+        assert index.descendants(node) == [other for other in G.nodes() if other in below]
+        assert index.ancestors(node) == [other for other in G.nodes() if other in above]
+        assert [index.reaches(node, other) for other in G.nodes()] == [other in below for other in G.nodes()]
+
+def test_pruned_search_matches_baseline_paths(working_dag, baseline_paths):
+    G, temporal_data = working_dag
+    paths = list(iter_paths_with_dates(G, temporal_data, reachability=ReachabilityIndex(G)))
+    assert [path.nodes for path in paths] == [path.nodes for path in baseline_paths]
+    assert [path.target_date for path in paths] == [path.target_date for path in baseline_paths]
+
+def test_index_rejects_cycles():
+    with pytest.raises(nx.NetworkXUnfeasible):
+        ReachabilityIndex(nx.DiGraph([('A', 'B'), ('B', 'A')]))
@@ -0,0 +1,56 @@
+import os
+import re
+import sys
+
+import networkx as nx
+import pytest
+
+from dags.analysis import render
+from dags.analysis.render import RenderJob, compute_layout, render_graphs
+
+# Stands in for dot and neato: floods stderr before reading any DOT, then answers
+# -Tplain with a layout of the nodes it was sent and writes other formats to -o
+FAKE_GRAPHVIZ = '''
+import re, sys
+sys.stderr.write('Warning: flat edge between adjacent nodes\\n' * 20000)
+sys.stderr.flush()
+text = sys.stdin.read()
+nodes = re.findall(r'^"([^"]*)"(?: \\[.*\\])?;$', text, re.M)
+args = dict((arg[:2], arg[2:]) for arg in sys.argv[1:])
+if args['-T'] == 'plain':
+    sys.stdout.write('graph 1 10 10\\n' + ''.join(f'node {n} {i} {2 * i} 1 1 {n} solid box black lightblue\\n'
+                                                 for i, n in enumerate(nodes)) + 'stop\\n')
+else:
+    open(args['-o'], 'w').write(text)
+'''
+
+@pytest.fixture
+def fake_graphviz(tmp_path, monkeypatch):
+    bin_dir = tmp_path / 'bin'
+    bin_dir.mkdir()
+    for name in ('dot', 'neato'):
+        script = bin_dir / name
+        script.write_text(f"#!{sys.executable}\n{FAKE_GRAPHVIZ}")
+        script.chmod(0o755)
+    monkeypatch.setenv('PATH', f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setattr(render, '_layouts', {})
+    return tmp_path
+
+def test_render_survives_graphviz_filling_stderr(fake_graphviz):
+    G = nx.DiGraph([('A', 'B'), ('B', 'C')])
+    outputs = render_graphs(G, [RenderJob(fake_graphviz / 'full.svg'),
+                                RenderJob(fake_graphviz / 'highlighted.svg', highlight_nodes={'B'})], dpi=None)
+    assert [path.name for path in outputs] == ['full.svg', 'highlighted.svg']
+    assert re.search(r'^"B" \[fillcolor="lightgreen"\];$', outputs[1].read_text(), re.M)
+
+def test_layout_is_cached_on_disk(fake_graphviz):
+    G = nx.DiGraph([('A', 'B'), ('B', 'C')])
+    cache_dir = fake_graphviz / 'cache'
+    positions = compute_layout(G, cache_dir)
+    assert positions == {'A': (0.0, 0.0), 'B': (72.0, 144.0), 'C': (144.0, 288.0)}
+    assert len(list(cache_dir.glob('layout-*.json'))) == 1
+
+    # A new process has no layouts in memory and reads the file instead of running dot
+    render._layouts.clear()
+    (fake_graphviz / 'bin' / 'dot').unlink()
+    assert compute_layout(G, cache_dir) == positions
@@ -0,0 +1,86 @@
+import csv
+import json
+from pathlib import Path
+
+import networkx as nx
+import pytest
+
+from dags.analysis.paths import analyze_path_timing, find_paths_with_dates
+from dags.analysis.report import REPORT_FORMATS, write_path_timing_report, write_timing_report
+from dags.analysis.timing import analyze_timing
+from dags.utils.data import NodeTemporalInfo
+
+TODAY = NodeTemporalInfo(None, '2025-06-01', None, None).target_date
+
+@pytest.fixture
+def dag():
+    # C ends before its predecessor B and starts before A ends; D has no dates
+    G = nx.DiGraph([('A', 'B'), ('B', 'C'), ('A', 'C'), ('C', 'D')])
+    temporal_data = {
+        'A': NodeTemporalInfo('2025-01-01', '2025-02-01', '2025-02-01', 'opp-1'),
+        'B': NodeTemporalInfo('2025-02-01', '2025-04-01', None, 'opp-1'),
+        'C': NodeTemporalInfo('2025-01-15', '2025-03-01', None, 'opp-2'),
+        'D': NodeTemporalInfo(None, None, None, 'opp-2')
+    }
+    return G, temporal_data
+
+def _read_table(path: Path, output_format: str):
+    if output_format == 'jsonl':
+        return [json.loads(line) for line in path.read_text().splitlines()]
+    if output_format == 'csv':
+        with open(path, newline='') as f:
+            return [{key: value for key, value in row.items() if value != ''} for row in csv.DictReader(f)]
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+    table = pq.read_table(path) if output_format == 'parquet' else feather.read_table(path)
+    return [{key: value for key, value in row.items() if value is not None} for row in table.to_pylist()]
+
+def _path_ids(row, output_format):
+    path_ids = row.get('path_ids', [])
+    return [int(path_id) for path_id in path_ids.split(';')] if output_format == 'csv' else path_ids
+
+def _path_nodes(row, output_format):
+    return row['nodes'].split(';') if output_format == 'csv' else row['nodes']
+
+def _expected_issues(issues):
+    """(issue type, node, predecessor) of every issue in an analyze_timing or analyze_path_timing result."""
+    expected = []
+    for node, node_issues in issues.items():
+        for issue_type, found in node_issues.items():
+            for record in found if isinstance(found, list) else [found] if found else []:
+                expected.append((issue_type, node, record.get('predecessor')))
+    return sorted(expected)
+
+@pytest.mark.parametrize('output_format', REPORT_FORMATS)
+def test_timing_report_round_trip(dag, tmp_path, output_format):
+    G, temporal_data = dag
+    counts = write_timing_report(G, temporal_data, tmp_path, output_format, max_witness_paths=2, today=TODAY)
+    issues = _read_table(tmp_path / f'timing_issues.{output_format}', output_format)
+    paths = {int(row['path_id']): _path_nodes(row, output_format)
+             for row in _read_table(tmp_path / f'timing_issues_paths.{output_format}', output_format)}
+
+    expected = analyze_timing(G, temporal_data, max_witness_paths=2, today=TODAY)
+    assert sorted((row['issue_type'], row['node'], row.get('predecessor')) for row in issues) == _expected_issues(expected)
+    assert sum(counts.values()) == len(issues)
+    for row in issues:
+        assert row['opportunity'] == temporal_data[row['node']].opportunity
+        witness = [paths[path_id] for path_id in _path_ids(row, output_format)]
+        assert witness and all(row['node'] in path for path in witness)
+        if 'predecessor' in row:
+            assert all((row['predecessor'], row['node']) in zip(path, path[1:]) for path in witness)
+
+@pytest.mark.parametrize('as_lists', [False, True])
+def test_path_timing_report_accepts_node_lists(dag, tmp_path, as_lists):
+    G, temporal_data = dag
+    paths = find_paths_with_dates(G, temporal_data)
+    path_infos = [list(path.nodes) for path in paths] if as_lists else paths
+    write_path_timing_report(path_infos, temporal_data, tmp_path, today=TODAY)
+    issues = _read_table(tmp_path / 'path_timing_issues.jsonl', 'jsonl')
+    written = {row['path_id']: row['nodes'] for row in _read_table(tmp_path / 'path_timing_issues_paths.jsonl', 'jsonl')}
+
+    # Every issue is reported on each path that crosses its edge, and a node's own issues on the first path
+    assert sorted((row['issue_type'], row['node'], row.get('predecessor')) for row in issues) == \
+        _expected_issues(analyze_path_timing(path_infos, temporal_data))
+    for row in issues:
+        assert row['node'] in written[row['path_ids'][0]]
+    assert all(written[path_id] in [list(path.nodes) for path in paths] for path_id in written)
@@ -0,0 +1,30 @@
+import networkx as nx
+
+from dags.analysis.schedule import compute_schedule
+from dags.utils.data import NodeTemporalInfo
+
+def _temporal_data(dates):
+    return {node: NodeTemporalInfo(start, target, None, None) for node, (start, target) in dates.items()}
+
+def test_predecessor_finishing_before_start_does_not_drive():
+    G = nx.DiGraph([('A', 'C')])
+    schedule = compute_schedule(G, _temporal_data({'A': ('2025-01-01', '2025-01-05'), 'C': ('2025-03-01', '2025-03-10')}))
+    assert schedule.critical_path == ['C']
+    assert schedule.table.loc['C', 'driver'] is None
+    assert not schedule.table.loc['A', 'critical']
+
+def test_overrunning_predecessor_drives():
+    G = nx.DiGraph([('A', 'C'), ('B', 'C')])
+    schedule = compute_schedule(G, _temporal_data({
+        'A': ('2025-01-01', '2025-03-05'),
+        'B': ('2025-01-01', '2025-01-05'),
+        'C': ('2025-03-01', '2025-03-10')
+    }))
+    assert schedule.critical_path == ['A', 'C']
+    assert schedule.table.loc['C', 'driver'] == 'A'
+    assert schedule.table.loc[schedule.critical_path, 'critical'].all()
+
+def test_predecessor_without_dates_does_not_drive():
+    G = nx.DiGraph([('A', 'C')])
+    schedule = compute_schedule(G, _temporal_data({'A': (None, None), 'C': ('2025-03-01', '2025-03-10')}))
+    assert schedule.critical_path == ['C']
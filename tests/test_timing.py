@@ -0,0 +1,44 @@
+import networkx as nx
+import pytest
+
+from dags.analysis.paths import iter_path_timing_issues
+from dags.analysis.timing import analyze_timing
+from dags.utils.data import NodeTemporalInfo
+
+TODAY = NodeTemporalInfo(None, '2025-06-01', None, None).target_date
+
+def _records(issues):
+    """Every analyze_timing record, without its witness paths, keyed by (issue type, node, predecessor)."""
+    records = {}
+    for node, node_issues in issues.items():
+        for issue_type, found in node_issues.items():
+            for record in found if isinstance(found, list) else [found] if found else []:
+                key = (issue_type, node, record.get('predecessor'))
+                assert key not in records
+                records[key] = {field: value for field, value in record.items() if field != 'paths'}
+    return records
+
+def test_timing_matches_path_timing_over_all_paths(working_dag, baseline_paths):
+    G, temporal_data = working_dag
+    # Edge issues repeat on every path that crosses the edge, with the same record
+    expected = {}
+    for _, _, issue_type, record in iter_path_timing_issues(baseline_paths, temporal_data, today=TODAY):
+        expected[(issue_type, record['node'], record.get('predecessor'))] = record
+    assert expected
+    assert _records(analyze_timing(G, temporal_data, today=TODAY)) == expected
+
+@pytest.mark.parametrize('max_witness_paths', [1, 3])
+def test_witness_paths_cross_the_issue(working_dag, max_witness_paths):
+    G, temporal_data = working_dag
+    issues = analyze_timing(G, temporal_data, max_witness_paths=max_witness_paths, today=TODAY)
+    for node, node_issues in issues.items():
+        for found in node_issues.values():
+            for record in found if isinstance(found, list) else [found] if found else []:
+                paths = list(record['paths'])
+                assert 1 <= len(paths) <= max_witness_paths
+                for path in paths:
+                    assert nx.is_path(G, path) and len(path) >= 2
+                    if 'predecessor' in record:
+                        assert (record['predecessor'], node) in zip(path, path[1:])
+                    else:
+                        assert node in path